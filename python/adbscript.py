@@ -5,7 +5,7 @@ import sys
 
 from modules.console_ui import style_text
 from modules.program_tools import execute_with_interrupt_handler
-from modules.menu.creation import run_menu
+from modules.menu.creation import run_menu_from_command_line
 from adbscript_tools.main_menu import MAIN_MENU_DATA
 
 if __name__ == "__main__":
@@ -23,4 +23,4 @@ if __name__ == "__main__":
 
     # Si ADB está disponible en el sistema,
     # se puede ejecutar el script.
-    execute_with_interrupt_handler(run_menu, MAIN_MENU_DATA)
+    execute_with_interrupt_handler(run_menu_from_command_line, MAIN_MENU_DATA)
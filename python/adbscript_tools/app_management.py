@@ -5,7 +5,7 @@
 # x11-misc/xdg-user-dirs - provee "xdg-user-dir"
 
 from modules.console_ui import get_validated_input, style_text
-from modules.subprocess_utils import run_command
+from modules.subprocess_utils import run_command, run_command_to_file
 
 
 def _install_standalone_apps() -> None:
@@ -71,33 +71,25 @@ def _save_app_info_report(adb_command: list[str], fileout_name: str) -> None:
     #   versión de cada aplicación.
     parameters_to_append = ["-f", " --show-versioncode"]
 
-    command_output = run_command(
-        command=adb_command + parameters_to_append, capture_output=True
-    )
+    output_path = f"{documents_folder}/{fileout_name}"
 
-    if command_output.returncode == 0:
-        try:
-            with open(f"{documents_folder}/{fileout_name}", "w") as file:
-                # Ahora se requiere trabajar únicamente
-                # con la salida estándar almacenada en
-                # "command_output", para poder grabarla
-                # en el achivo de salida.
-                file.write(command_output.stdout)
+    # La salida del comando se escribe directamente en el
+    # archivo, sin cargarla en memoria, ya que en los
+    # dispositivos con miles de aplicaciones puede ser
+    # considerablemente extensa. Los errores al crear el
+    # archivo se informan como el resto de los errores de
+    # ejecución, en cuyo caso se obtiene None.
+    saved = run_command_to_file(
+        command=adb_command + parameters_to_append, output_path=output_path
+    )
 
-            style_text(
-                colour_type="bg",
-                colour="green",
-                text="Archivo guardado exitosamente en la siguiente ubicación:"
-                f"\n{documents_folder}/{fileout_name}.",
-            )
-        except OSError as os_error:
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text="Se ha producido un error del SO durante la creación del"
-                f" archivo {fileout_name}."
-                f"\nEl error encontrado es: {os_error}.",
-            )
+    if saved:
+        style_text(
+            colour_type="bg",
+            colour="green",
+            text="Archivo guardado exitosamente en la siguiente ubicación:"
+            f"\n{output_path}.",
+        )
 
 
 APP_MANAGEMENT_MENU_DATA = {
@@ -5,11 +5,13 @@
 
 import shlex
 
-from adbscript_tools.file_management import FILE_MANAGEMENT_MENU_DATA
-from adbscript_tools.app_management import APP_MANAGEMENT_MENU_DATA
 from modules.console_ui import get_validated_input
 from modules.subprocess_utils import run_command
 
+# Tiempo máximo en segundos que se espera a que
+# inicie el servidor de ADB.
+_ADB_SERVER_TIMEOUT = 30
+
 
 def _start_adb_server() -> None:
     """
@@ -22,7 +24,15 @@ def _start_adb_server() -> None:
     # pantalla al iniciar el servidor, por lo que
     # se lo debe capturar para que no se lo vea
     # al iniciar el script.
-    run_command(command=["adb", "start-server"], capture_output=True)
+    #
+    # Asimismo, se le pone un límite de tiempo para que
+    # un servidor que no responde no bloquee el script
+    # indefinidamente.
+    run_command(
+        command=["adb", "start-server"],
+        capture_output=True,
+        timeout=_ADB_SERVER_TIMEOUT,
+    )
 
 
 def _stop_adb_server() -> None:
@@ -82,11 +92,15 @@ MAIN_MENU_DATA = {
         },
         {
             "name": "Realizar operaciones con archivos.",
-            "action": FILE_MANAGEMENT_MENU_DATA,
+            "action": (
+                "adbscript_tools.file_management:FILE_MANAGEMENT_MENU_DATA"
+            ),
         },
         {
             "name": "Administrar las aplicaciones del dispositivo.",
-            "action": APP_MANAGEMENT_MENU_DATA,
+            "action": (
+                "adbscript_tools.app_management:APP_MANAGEMENT_MENU_DATA"
+            ),
         },
         {"name": "COMANDOS DE FASTBOOT"},
         {
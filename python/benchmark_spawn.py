@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este script mide el costo de lanzar comandos con las funciones del módulo
+"subprocess_utils", utilizando programas que no realizan ningún trabajo (como
+"true" o "cat") para que el tiempo medido corresponda únicamente al
+lanzamiento de los procesos.
+
+Se comparan las funciones del módulo con una llamada a subprocess.run() sin
+ninguna optimización, que es la forma en la que se lanzaban los comandos
+antes de que el módulo utilizara os.posix_spawn().
+
+La función run_command_as_root() se mide a través del ayudante persistente
+del módulo "root_helper", utilizando "env" en lugar de un programa para
+elevar privilegios, de manera que no se le deba pedir una contraseña al
+usuario.
+
+Uso: python benchmark_spawn.py [cantidad de repeticiones]
+"""
+
+import subprocess
+import sys
+import time
+
+from modules.program_tools import execute_with_interrupt_handler
+from modules.root_helper import enable_root_helper, stop_root_helper
+from modules.subprocess_utils import (
+    pipe_commands,
+    run_command,
+    run_command_as_root,
+)
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad de repeticiones por defecto de cada medición.
+_DEFAULT_REPETITIONS = 200
+
+
+def _measure(name: str, repetitions: int, function, *args, **kwargs) -> None:
+    """
+    _measure() es una función que ejecuta una función la
+    cantidad de veces indicada e imprime el tiempo medio
+    que demoró cada ejecución.
+    """
+    # La primera ejecución no se mide, ya que incluye
+    # costos que solo se pagan una vez, como resolver la
+    # ruta de los programas o iniciar el ayudante.
+    function(*args, **kwargs)
+
+    start_time = time.perf_counter()
+    for _ in range(repetitions):
+        function(*args, **kwargs)
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f"{name:<45} {elapsed_time / repetitions * 1000:>8.3f} ms")
+
+
+def _run_unoptimized(command: list[str], **kwargs) -> None:
+    """
+    _run_unoptimized() es una función que ejecuta un
+    comando con subprocess.run() sin indicar la ruta
+    del programa ni evitar el cierre de descriptores, de
+    manera que subprocess no pueda utilizar posix_spawn()
+    en todas las versiones de Python.
+    """
+    subprocess.run(args=command, check=True, **kwargs)
+
+
+def run_benchmark() -> None:
+    repetitions = (
+        int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_REPETITIONS
+    )
+    custom_env = {"PATH": "/usr/bin:/bin", "LC_ALL": "C"}
+
+    print(f"Tiempo medio por ejecución ({repetitions} repeticiones):")
+    _measure(
+        "subprocess.run() sin optimizar",
+        repetitions,
+        _run_unoptimized,
+        ["true"],
+    )
+    _measure(
+        "subprocess.run() sin optimizar, con entorno",
+        repetitions,
+        _run_unoptimized,
+        ["true"],
+        env=custom_env,
+    )
+    _measure("run_command()", repetitions, run_command, ["true"])
+    _measure(
+        "run_command(), con entorno",
+        repetitions,
+        run_command,
+        ["true"],
+        custom_env=custom_env,
+    )
+    _measure(
+        "run_command(), capturando la salida",
+        repetitions,
+        run_command,
+        ["true"],
+        capture_output=True,
+    )
+    _measure(
+        "pipe_commands(), dos comandos",
+        repetitions,
+        pipe_commands,
+        ["true"],
+        ["cat"],
+    )
+
+    enable_root_helper(elevation_command="env")
+    try:
+        _measure(
+            "run_command_as_root(), con el ayudante",
+            repetitions,
+            run_command_as_root,
+            ["true"],
+        )
+    finally:
+        stop_root_helper()
+
+
+if __name__ == "__main__":
+    execute_with_interrupt_handler(run_benchmark)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este script mide el tiempo de inicio de los scripts con menús, es decir, el
+tiempo que transcurre hasta que se puede mostrar el menú principal, así como
+el tiempo de importación de cada módulo involucrado.
+
+Por cada menú principal se mide, en un intérprete nuevo:
+* El tiempo de importación del módulo que define el menú principal.
+* El tiempo de compilación del menú principal con compile_menu().
+* El tiempo que demora cargar y compilar todos sus submenús diferidos, que es
+  el costo que se evita al iniciar el script y que se paga recién al ingresar
+  a cada submenú.
+
+Asimismo, se muestran los módulos cuya importación resultó más costosa, según
+la información que provee la opción "-X importtime" del intérprete.
+
+Como los tiempos varían considerablemente de una ejecución a otra, cada
+medición se repite _REPETITIONS veces y se informa el mínimo de cada fase. Los
+módulos más costosos corresponden a la ejecución con la importación más
+rápida.
+
+Uso: python benchmark_startup.py [cantidad de módulos a mostrar]
+"""
+
+import json
+import subprocess
+import sys
+
+from modules.program_tools import execute_with_interrupt_handler
+
+# --- Constantes a utilizar en las funciones ---
+# Módulos que definen los menús principales a medir.
+_MAIN_MENU_MODULES = [
+    "genscript_tools.main_menu",
+    "adbscript_tools.main_menu",
+]
+
+# Cantidad de módulos a mostrar por defecto.
+_DEFAULT_MODULE_COUNT = 15
+
+# Cantidad de veces que se repite cada medición.
+_REPETITIONS = 12
+
+# Código que se ejecuta en el intérprete nuevo. Imprime
+# los tiempos medidos en formato JSON.
+_MEASUREMENT_CODE = """
+import importlib, json, time
+start = time.perf_counter()
+module = importlib.import_module({module!r})
+imported = time.perf_counter()
+from modules.menu.plan import (
+    LAZY_SUBMENU_ACTION, compile_menu, resolve_submenu
+)
+compiled_start = time.perf_counter()
+menu = compile_menu(module.MAIN_MENU_DATA)
+compiled = time.perf_counter()
+pending = [menu]
+visited = {{id(menu)}}
+while pending:
+    for option in pending.pop().options:
+        if option.kind == LAZY_SUBMENU_ACTION:
+            submenu = resolve_submenu(option)
+            if id(submenu) not in visited:
+                visited.add(id(submenu))
+                pending.append(submenu)
+resolved = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "compile": compiled - compiled_start,
+    "lazy": resolved - compiled,
+}}))
+"""
+
+
+def _parse_import_times(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    _parse_import_times() es una función que obtiene, a
+    partir de la salida de "-X importtime", el nombre de
+    cada módulo importado junto con su tiempo propio y
+    acumulado de importación, en microsegundos.
+    """
+    import_times = []
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_time, cumulative_time, name = line[12:].split("|")
+        import_times.append(
+            (name.strip(), int(self_time), int(cumulative_time))
+        )
+
+    return import_times
+
+
+def _measure_main_menu(module: str, module_count: int) -> None:
+    """
+    _measure_main_menu() es una función que mide el tiempo
+    de inicio de un menú principal en intérpretes nuevos
+    e imprime los resultados.
+    """
+    phases = None
+    import_times = []
+
+    for _ in range(_REPETITIONS):
+        result = subprocess.run(
+            args=[
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                _MEASUREMENT_CODE.format(module=module),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        run_phases = json.loads(result.stdout)
+
+        # Se conservan los tiempos de importación de los
+        # módulos de la ejecución con la importación más
+        # rápida.
+        if phases is None or run_phases["import"] < phases["import"]:
+            import_times = _parse_import_times(result.stderr)
+
+        phases = (
+            run_phases
+            if phases is None
+            else {
+                phase: min(phases[phase], value)
+                for phase, value in run_phases.items()
+            }
+        )
+
+    print(module)
+    for description, phase in [
+        ("Importación del menú principal", "import"),
+        ("Compilación del menú principal", "compile"),
+        ("Carga de los submenús diferidos", "lazy"),
+    ]:
+        print(f"  {description:<45} {phases[phase] * 1000:>8.2f} ms")
+    print("  Módulos más costosos (acumulado / propio):")
+
+    for name, self_time, cumulative_time in sorted(
+        import_times, key=lambda item: item[2], reverse=True
+    )[:module_count]:
+        print(
+            f"    {cumulative_time / 1000:>8.2f} ms"
+            f" {self_time / 1000:>8.2f} ms  {name}"
+        )
+
+    print("")
+
+
+def run_benchmark() -> None:
+    module_count = (
+        int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_MODULE_COUNT
+    )
+
+    for module in _MAIN_MENU_MODULES:
+        _measure_main_menu(module, module_count)
+
+
+if __name__ == "__main__":
+    execute_with_interrupt_handler(run_benchmark)
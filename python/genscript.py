@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from modules.menu.creation import run_menu
+from modules.menu.creation import run_menu_from_command_line
 from modules.program_tools import execute_with_interrupt_handler
 from genscript_tools.main_menu import MAIN_MENU_DATA
 
 if __name__ == "__main__":
-    execute_with_interrupt_handler(run_menu, MAIN_MENU_DATA)
+    execute_with_interrupt_handler(run_menu_from_command_line, MAIN_MENU_DATA)
@@ -22,16 +22,15 @@ from modules.console_ui import (
     style_text,
 )
 
+from modules.root_helper import (
+    enable_root_helper_from_environment,
+    stop_root_helper,
+)
 from modules.subprocess_utils import (
     pipe_commands,
     run_command,
 )
 
-from genscript_tools.package_management import PACKAGE_MANAGEMENT_MENU_DATA
-from genscript_tools.snapshots import SNAPSHOT_MANAGEMENT_MENU_DATA
-from genscript_tools.updates import UPDATES_MENU_DATA
-from genscript_tools.use_flags import USE_FLAGS_MENU_DATA
-
 
 def clean_thumbnails() -> None:
     """
@@ -166,28 +165,42 @@ def read_news() -> None:
 MAIN_MENU_DATA = {
     "dict_name": "MAIN_MENU_DATA",
     "title": "¡Bienvenido a la herramienta de administración del sistema!",
+    # Si se lo pide con SCRIPTS_ROOT_HELPER=1, todas las opciones
+    # que requieren permisos de superusuario comparten un único
+    # ayudante persistente, de manera que solo se solicite
+    # autenticación una vez por sesión.
+    "on_start": [enable_root_helper_from_environment],
+    "on_exit": [stop_root_helper],
+    # Los submenús se referencian de manera diferida, para
+    # que sus módulos solo se importen al ingresar a ellos.
     "options": [
         {"name": "APARTADOS ADICIONALES"},
         {
             "name": "Menú de opciones de actualización.",
-            "action": UPDATES_MENU_DATA,
+            "action": "genscript_tools.updates:UPDATES_MENU_DATA",
         },
         {
             "name": "Menú de manejo de paquetes y repositorios del sistema.",
-            "action": PACKAGE_MANAGEMENT_MENU_DATA,
+            "action": (
+                "genscript_tools.package_management:"
+                "PACKAGE_MANAGEMENT_MENU_DATA"
+            ),
         },
         {
             "name": "Menú de manejo de snapshots.",
-            "action": SNAPSHOT_MANAGEMENT_MENU_DATA,
+            "action": (
+                "genscript_tools.snapshots:SNAPSHOT_MANAGEMENT_MENU_DATA"
+            ),
         },
         {
             "name": "Menú de obtención de información sobre USE flags.",
-            "action": USE_FLAGS_MENU_DATA,
+            "action": "genscript_tools.use_flags:USE_FLAGS_MENU_DATA",
         },
         {"name": "OPCIONES DE LIMPIEZA"},
         {
             "name": "Limpiar archivos residuales.",
             "action": [
+                "#PARALLEL",
                 ["#ROOT", "eclean-dist", "-d"],
                 ["#ROOT", "eclean-pkg", "-d"],
             ],
@@ -4,8 +4,8 @@
 # sys-fs/btrfs-progs - provee "btrfs".
 # app-backup/snapper - provee "snapper".
 
-import functools
 import json
+import os
 import sys
 
 from modules.console_ui import (
@@ -14,10 +14,23 @@ from modules.console_ui import (
     style_text,
 )
 
-from modules.subprocess_utils import run_command
+from modules.command_cache import get_invalidation_stamp, run_cached_command
+from modules.subprocess_utils import run_command, run_commands_concurrently
+
+# Rutas en las que Snapper registra sus configuraciones,
+# utilizadas para invalidar el listado guardado en caché.
+_SNAPPER_CONFIG_PATHS = ["/etc/snapper/configs", "/etc/conf.d/snapper"]
+
+# Tiempo en segundos durante el cual se reutiliza el
+# listado de configuraciones de Snapper.
+_SNAPPER_CONFIGS_CACHE_TTL = 24 * 60 * 60
+
+# Carpeta de cada subvolumen en la que Snapper guarda sus
+# snapshots. Su fecha de modificación cambia al crear o
+# eliminar una snapshot.
+_SNAPSHOTS_DIRECTORY = ".snapshots"
 
 
-@functools.cache
 def _get_snapper_config_list() -> list[tuple[str, str]]:
     """
     _get_snapper_config_list() es una función
@@ -40,9 +53,16 @@ def _get_snapper_config_list() -> list[tuple[str, str]]:
     # por un comando ejecutado con run_command se debe
     # utilizar el método "stdout" para acceder a dicha
     # salida.
-    snapper_raw_output = run_command(
+    #
+    # El listado de configuraciones se guarda en caché
+    # (también en disco) y solo se vuelve a consultar
+    # si cambia alguno de los archivos donde Snapper
+    # registra sus configuraciones.
+    snapper_raw_output = run_cached_command(
         command=["snapper", "--machine-readable", "json", "list-configs"],
-        capture_output=True,
+        ttl=_SNAPPER_CONFIGS_CACHE_TTL,
+        invalidation_paths=_SNAPPER_CONFIG_PATHS,
+        persistent=True,
     ).stdout
 
     try:
@@ -120,12 +140,20 @@ def create_system_snapshot(snapshot_description: str) -> None:
         raise ValueError("La descripción de la snapshot debe ser un string.")
 
     config_list = _get_snapper_config_list()
-    for config, _ in config_list:
-        # Limpieza de snapshots innecesarias.
-        run_command(["snapper", "-c", f"{config}", "cleanup", "number"])
 
-        # Creación de snapshot.
-        run_command(
+    # Las configuraciones de Snapper son independientes
+    # entre sí, por lo que la limpieza y la creación de
+    # snapshots se realizan de manera concurrente para
+    # todas ellas. La limpieza de cada configuración
+    # siempre finaliza antes de crear las snapshots.
+    run_commands_concurrently(
+        [
+            ["snapper", "-c", f"{config}", "cleanup", "number"]
+            for config, _ in config_list
+        ]
+    )
+    run_commands_concurrently(
+        [
             [
                 "snapper",
                 "-c",
@@ -135,8 +163,10 @@ def create_system_snapshot(snapshot_description: str) -> None:
                 "number",
                 "--description",
                 f"{snapshot_description}",
-            ],
-        )
+            ]
+            for config, _ in config_list
+        ]
+    )
 
 
 def create_system_snapshot_with_prompt() -> None:
@@ -153,27 +183,112 @@ def create_system_snapshot_with_prompt() -> None:
     create_system_snapshot(snapshot_str)
 
 
-def delete_system_snapshot() -> None:
+def delete_snapshot(config: str, snapshot_number: int) -> None:
+    """
+    delete_snapshot() es una función utilizada
+    para borrar una snapshot específica de una
+    configuración de Snapper.
+    """
+    run_command(["snapper", "-c", f"{config}", "delete", f"{snapshot_number}"])
+
+
+def _get_snapshots_stamp() -> list:
+    """
+    _get_snapshots_stamp() es una función que
+    devuelve la marca de invalidación del menú
+    para eliminar snapshots, construida a partir
+    de la carpeta de snapshots de cada subvolumen.
+    """
+    return get_invalidation_stamp(
+        [
+            os.path.join(subvolume, _SNAPSHOTS_DIRECTORY)
+            for _, subvolume in _get_snapper_config_list()
+        ]
+    )
+
+
+def _generate_snapshot_options() -> list[dict]:
     """
-    delete_system_snapshot() es una función
-    utilizada para borrar snapshots del sistema.
-    Le muestra al usuario un listado de snapshots
-    disponibles y le pide que especifique cuál
-    desea borrar.
+    _generate_snapshot_options() es una función
+    que genera una opción del menú para eliminar
+    snapshots por cada snapshot existente, de
+    manera que el usuario la pueda elegir en
+    lugar de escribir su número.
+
+    A diferencia del antiguo delete_system_snapshot(),
+    que eliminaba la snapshot con el número indicado en
+    todas las configuraciones de Snapper, cada opción
+    elimina la snapshot de una única configuración. Para
+    eliminar el mismo número en varias configuraciones se
+    debe elegir la opción correspondiente en cada una.
     """
     config_list = _get_snapper_config_list()
-    get_snapshots_list()
-    print("")
 
-    snapshot_number = get_validated_input(
-        "Introduzca el número de snapshot a borrar",
+    # Los listados de snapshots de cada configuración
+    # son independientes entre sí, por lo que se los
+    # obtiene de manera concurrente.
+    results = run_commands_concurrently(
+        [
+            ["snapper", "--machine-readable", "json", "-c", config, "list"]
+            for config, _ in config_list
+        ],
+        capture_output=True,
     )
+    options = []
 
-    for config, _ in config_list:
-        run_command(
-            ["snapper", "-c", f"{config}", "delete", f"{snapshot_number}"]
-        )
+    for (config, subvolume), result in zip(config_list, results):
+        if result is None:
+            continue
 
+        try:
+            snapshots = json.loads(result.stdout).get(config, [])
+        except json.JSONDecodeError:
+            continue
+
+        # La snapshot N.° 0 representa el estado actual
+        # del subvolumen, por lo que no se puede borrar.
+        snapshots = [
+            snapshot for snapshot in snapshots if snapshot.get("number")
+        ]
+
+        if not snapshots:
+            continue
+
+        options.append({"name": f"SNAPSHOTS DEL SUBVOLUMEN '{subvolume}'"})
+
+        for snapshot in snapshots:
+            name = f"Snapshot N.° {snapshot['number']} ({snapshot['date']})"
+            if snapshot.get("description"):
+                name += f": {snapshot['description']}"
+
+            options.append(
+                {
+                    "name": f"{name}.",
+                    "action": [
+                        (delete_snapshot, [config, snapshot["number"]])
+                    ],
+                    "aesthetic_action": "print_line",
+                }
+            )
+
+    if not options:
+        options.append({"name": "NO HAY SNAPSHOTS PARA ELIMINAR"})
+
+    return options
+
+
+DELETE_SNAPSHOT_MENU_DATA = {
+    "dict_name": "DELETE_SNAPSHOT_MENU_DATA",
+    "title": "Apartado para elegir la snapshot a eliminar",
+    "options_provider": (_generate_snapshot_options, _get_snapshots_stamp),
+    "options": [
+        {"name": "MISCELÁNEA"},
+        {
+            "name": "SALIR.",
+            "action": "exit",
+        },
+    ],
+}
 
 SNAPSHOT_MANAGEMENT_MENU_DATA = {
     "dict_name": "SNAPSHOT_MANAGEMENT_MENU_DATA",
@@ -201,8 +316,7 @@ SNAPSHOT_MANAGEMENT_MENU_DATA = {
         },
         {
             "name": "Eliminar una snapshot del sistema.",
-            "action": [delete_system_snapshot],
-            "aesthetic_action": "clear_screen",
+            "action": DELETE_SNAPSHOT_MENU_DATA,
         },
         {"name": "MISCELÁNEA"},
         {
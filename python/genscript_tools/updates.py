@@ -134,7 +134,9 @@ CVE_CHECK_MENU_DATA = {
 UPDATES_MENU_DATA = {
     "dict_name": "UPDATES_MENU_DATA",
     "title": "Apartado para actualizar el software del sistema",
-    "on_draw": [check_internet_connection],
+    # El estado de la conexión se reutiliza durante un
+    # minuto, para no repetir el ping en cada redibujado.
+    "on_draw": [(check_internet_connection, 60)],
     "options": [
         {"name": "PAQUETES/REPOSITORIOS"},
         {
@@ -159,7 +161,21 @@ UPDATES_MENU_DATA = {
                 # porque fwupdmgr devuelve códigos de salida distintos de cero
                 # aún cuando no hubo errores de ejecución pero tampoco hay
                 # actualizaciones disponibles.
-                (run_command, [["fwupdmgr", "refresh", "--force"]]),
+                #
+                # La actualización de metadatos tiene un límite de tiempo
+                # porque puede quedarse esperando indefinidamente si el
+                # servidor remoto no responde.
+                (
+                    run_command,
+                    [
+                        ["fwupdmgr", "refresh", "--force"],
+                        check_return := True,
+                        use_shell := False,
+                        capture_output := False,
+                        custom_env := None,
+                        timeout := 300,
+                    ],
+                ),
                 (
                     run_command,
                     [
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo contiene una capa de caché para los resultados de comandos de solo
+lectura ejecutados con run_command(capture_output=True), de manera que las
+consultas cuyo resultado rara vez cambia no se deban volver a ejecutar cada
+vez que se las necesita.
+
+### Funcionamiento de la caché ###
+* Cada resultado se identifica a partir del comando ejecutado, las variables de
+  entorno con las que se lo ejecutó y, opcionalmente, una "marca de
+  invalidación" construida a partir de la fecha de modificación de una serie
+  de rutas (por ejemplo, "/var/db/pkg" o "/var/lib/portage/world"). Si alguna
+  de dichas rutas cambia, el resultado almacenado deja de ser válido.
+
+* Cada resultado tiene un tiempo de vida (TTL), tras el cual el comando se
+  vuelve a ejecutar. La caché en memoria tiene un tamaño máximo, y cuando se
+  llena se descartan los resultados usados hace más tiempo (LRU).
+
+* Opcionalmente, los resultados se pueden guardar en disco, dentro de la
+  carpeta "$XDG_CACHE_HOME/scripts/command_cache", de manera que también se
+  reutilicen entre distintas ejecuciones de un script. Los errores al leer o
+  escribir en disco se ignoran, ya que la caché solo es una optimización.
+
+* Únicamente se almacenan los resultados de los comandos que finalizan con el
+  código de salida 0.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+from modules.subprocess_utils import run_command
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad máxima de resultados que se guardan en memoria.
+_CACHE_MAX_ENTRIES = 128
+
+# --- Estado de la caché en memoria ---
+_memory_cache = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# --- Funciones privadas ---
+def _get_cache_directory() -> str:
+    """
+    _get_cache_directory() es una función que devuelve la
+    ruta de la carpeta donde se guardan los resultados en
+    disco, respetando la variable XDG_CACHE_HOME.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "scripts", "command_cache")
+
+
+def _get_cache_key(command: list[str], custom_env: dict | None) -> str:
+    """
+    _get_cache_key() es una función que devuelve la llave
+    con la que se identifica el resultado de un comando,
+    a partir del propio comando y de su entorno.
+    """
+    env_items = sorted(custom_env.items()) if custom_env is not None else None
+    raw_key = json.dumps([command, env_items])
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def _read_disk_entry(key: str) -> dict | None:
+    """
+    _read_disk_entry() es una función que lee un resultado
+    guardado en disco, devolviendo None si no existe o si
+    no se lo puede leer.
+    """
+    try:
+        with open(os.path.join(_get_cache_directory(), f"{key}.json")) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk_entry(key: str, entry: dict) -> None:
+    """
+    _write_disk_entry() es una función que guarda un
+    resultado en disco. La escritura se realiza sobre un
+    archivo temporal que luego reemplaza al definitivo,
+    para no dejar nunca un archivo a medio escribir.
+    """
+    directory = _get_cache_directory()
+
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(entry, file)
+            os.replace(temp_path, os.path.join(directory, f"{key}.json"))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _is_entry_valid(entry: dict, stamp: list) -> bool:
+    """
+    _is_entry_valid() es una función que determina si un
+    resultado almacenado sigue siendo válido, controlando
+    su tiempo de vida y su marca de invalidación.
+    """
+    return entry["stamp"] == stamp and time.time() < entry["expires_at"]
+
+
+def _entry_to_result(entry: dict) -> subprocess.CompletedProcess:
+    """
+    _entry_to_result() es una función que convierte un
+    resultado almacenado en un objeto del tipo
+    subprocess.CompletedProcess, para que sea
+    indistinguible del que devuelve run_command().
+    """
+    return subprocess.CompletedProcess(
+        args=entry["command"],
+        returncode=entry["returncode"],
+        stdout=entry["stdout"],
+        stderr=entry["stderr"],
+    )
+
+
+def _store_in_memory(key: str, entry: dict) -> None:
+    """
+    _store_in_memory() es una función que guarda un
+    resultado en la caché en memoria, descartando los
+    resultados usados hace más tiempo si se supera el
+    tamaño máximo de la caché.
+    """
+    with _cache_lock:
+        _memory_cache[key] = entry
+        _memory_cache.move_to_end(key)
+
+        while len(_memory_cache) > _CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+# --- Funciones públicas ---
+def get_invalidation_stamp(paths: list[str] | None) -> list:
+    """
+    get_invalidation_stamp() es una función que construye
+    la marca de invalidación de un resultado a partir de
+    las fechas de modificación de las rutas recibidas. Las
+    rutas inexistentes se representan con None.
+
+    Se la utiliza en run_cached_command(), pero también
+    permite invalidar otros datos guardados en caché a
+    partir de las mismas rutas, comparando las marcas.
+    """
+    stamp = []
+
+    for path in paths or []:
+        try:
+            stamp.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            stamp.append([path, None])
+
+    return stamp
+
+
+def run_cached_command(
+    command: list[str],
+    ttl: float = 300,
+    invalidation_paths: list[str] | None = None,
+    custom_env: dict = None,
+    persistent: bool = False,
+) -> None | subprocess.CompletedProcess:
+    """
+    run_cached_command() es un wrapper de run_command()
+    con capture_output=True que reutiliza el resultado de
+    una ejecución anterior del mismo comando, siempre que
+    este no haya vencido ni haya sido invalidado.
+
+    El parámetro "ttl" indica la cantidad de segundos que
+    un resultado es válido, "invalidation_paths" las rutas
+    cuya modificación invalida el resultado y "persistent"
+    si el resultado también se debe guardar en disco.
+
+    Al igual que run_command(), devuelve None si el
+    comando falla.
+    """
+    if not isinstance(command, list):
+        raise TypeError("El parámetro 'command' debe ser una lista.")
+
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        raise ValueError("El parámetro 'ttl' debe ser un número mayor a cero.")
+
+    if invalidation_paths is not None and not isinstance(
+        invalidation_paths, list
+    ):
+        raise TypeError(
+            "El parámetro 'invalidation_paths' debe ser una lista de rutas."
+        )
+
+    if not isinstance(persistent, bool):
+        raise TypeError("El parámetro 'persistent' debe ser un valor lógico.")
+
+    key = _get_cache_key(command=command, custom_env=custom_env)
+    stamp = get_invalidation_stamp(invalidation_paths)
+
+    # Primero se busca el resultado en memoria y luego,
+    # si corresponde, en disco.
+    with _cache_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None and _is_entry_valid(entry, stamp):
+            _memory_cache.move_to_end(key)
+            return _entry_to_result(entry)
+
+    if persistent:
+        entry = _read_disk_entry(key)
+        if entry is not None and _is_entry_valid(entry, stamp):
+            _store_in_memory(key, entry)
+            return _entry_to_result(entry)
+
+    # Si no hay un resultado válido, se ejecuta el comando.
+    result = run_command(
+        command=command, capture_output=True, custom_env=custom_env
+    )
+
+    if result is None or result.returncode != 0:
+        return result
+
+    entry = {
+        "command": command,
+        "stamp": stamp,
+        "expires_at": time.time() + ttl,
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+    }
+
+    _store_in_memory(key, entry)
+
+    if persistent:
+        _write_disk_entry(key, entry)
+
+    return result
+
+
+def clear_command_cache(persistent: bool = False) -> None:
+    """
+    clear_command_cache() es una función utilizada para
+    descartar todos los resultados almacenados en memoria
+    y, si se lo indica, también los guardados en disco.
+    """
+    with _cache_lock:
+        _memory_cache.clear()
+
+    if persistent:
+        directory = _get_cache_directory()
+
+        try:
+            for file_name in os.listdir(directory):
+                if file_name.endswith(".json"):
+                    os.unlink(os.path.join(directory, file_name))
+        except OSError:
+            pass
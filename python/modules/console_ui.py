@@ -8,17 +8,22 @@ Este módulo contiene una serie de funciones relacionadas al aspecto estético
 de los scripts y el control de entradas recibidas por parte del usuario.
 """
 
+import codecs
+import contextlib
+import functools
 import subprocess
 import os
 import sys
+import time
 
 if os.name == "nt":
     import msvcrt
 elif os.name == "posix":
+    import select
     import termios
     import tty
 
-from typing import Literal
+from typing import Callable, Iterator, Literal
 
 # --- Colecciones a utilizar en las funciones ---
 _BACKGROUND_COLOURS = {
@@ -51,15 +56,322 @@ assert set(_BACKGROUND_COLOURS.keys()) == set(
     _FOREGROUND_COLOURS.keys()
 ), "Los diccionarios de colores no coinciden."
 
+# Tabla de estilos precalculada a partir de los
+# diccionarios de colores, con el prefijo ANSI de cada
+# combinación de modo ("fg" o "bg") y color. Permite
+# estilizar texto con una simple búsqueda en un
+# diccionario.
+_STYLE_PREFIXES = {
+    **{
+        ("fg", colour): f"\033[1;{colour_code}m"
+        for colour, colour_code in _FOREGROUND_COLOURS.items()
+    },
+    **{
+        ("bg", colour): f"\033[1;37;{colour_code}m"
+        for colour, colour_code in _BACKGROUND_COLOURS.items()
+    },
+}
+
+_STYLE_SUFFIX = "\033[0m"
+
+# Teclas especiales representadas por secuencias de
+# escape CSI ("ESC [") cuyo último byte es una letra.
+_CSI_KEYS = {
+    "A": "UP",
+    "B": "DOWN",
+    "C": "RIGHT",
+    "D": "LEFT",
+    "H": "HOME",
+    "F": "END",
+    "Z": "SHIFT+TAB",
+}
+
+# Teclas especiales representadas por secuencias de
+# escape CSI del estilo "ESC [ número ~".
+_CSI_TILDE_KEYS = {
+    "1": "HOME",
+    "2": "INSERT",
+    "3": "DELETE",
+    "4": "END",
+    "5": "PAGE_UP",
+    "6": "PAGE_DOWN",
+    "7": "HOME",
+    "8": "END",
+    "11": "F1",
+    "12": "F2",
+    "13": "F3",
+    "14": "F4",
+    "15": "F5",
+    "17": "F6",
+    "18": "F7",
+    "19": "F8",
+    "20": "F9",
+    "21": "F10",
+    "23": "F11",
+    "24": "F12",
+}
+
+# Teclas especiales representadas por secuencias de
+# escape SS3 ("ESC O").
+_SS3_KEYS = {
+    "A": "UP",
+    "B": "DOWN",
+    "C": "RIGHT",
+    "D": "LEFT",
+    "H": "HOME",
+    "F": "END",
+    "P": "F1",
+    "Q": "F2",
+    "R": "F3",
+    "S": "F4",
+}
+
+# Teclas especiales de Windows, que msvcrt informa con
+# el prefijo "\x00" o "\xe0" seguido de un código.
+_WINDOWS_SPECIAL_KEYS = {
+    "H": "UP",
+    "P": "DOWN",
+    "M": "RIGHT",
+    "K": "LEFT",
+    "G": "HOME",
+    "O": "END",
+    "R": "INSERT",
+    "S": "DELETE",
+    "I": "PAGE_UP",
+    "Q": "PAGE_DOWN",
+    ";": "F1",
+    "<": "F2",
+    "=": "F3",
+    ">": "F4",
+    "?": "F5",
+    "@": "F6",
+    "A": "F7",
+    "B": "F8",
+    "C": "F9",
+    "D": "F10",
+    "\x85": "F11",
+    "\x86": "F12",
+}
+
+# Teclas de control que se representan con un nombre.
+_CONTROL_KEYS = {
+    "\r": "ENTER",
+    "\n": "ENTER",
+    "\t": "TAB",
+    "\x7f": "BACKSPACE",
+    "\x08": "BACKSPACE",
+}
+
+
+# --- Constantes a utilizar en las funciones ---
+# Secuencia de escape ANSI que mueve el cursor al
+# inicio de la pantalla, la limpia y descarta el
+# historial de desplazamiento de la terminal, tal y
+# como lo hace el comando "clear".
+_CLEAR_SCREEN_SEQUENCE = "\033[H\033[2J\033[3J"
+
+# Tiempo máximo, en segundos, que se espera entre los
+# bytes de una secuencia de escape. Si no llega ningún
+# byte más luego de un ESC, se considera que se presionó
+# la tecla Escape.
+_ESCAPE_SEQUENCE_TIMEOUT = 0.05
+
+# --- Estado de las entradas programadas ---
+# Respuestas a utilizar en lugar de leer la entrada
+# estándar, o None si se ejecuta de forma interactiva.
+_scripted_input = {"answers": None}
+
+
+# --- Funciones privadas ---
+def _read_answer(prompt: str) -> str:
+    """
+    _read_answer() es una función que obtiene la siguiente
+    respuesta del usuario, ya sea leyéndola de la entrada
+    estándar o, si se proveyeron respuestas programadas
+    con scripted_input(), tomando la siguiente de ellas.
+    """
+    answers = _scripted_input["answers"]
+
+    if answers is None:
+        return input(prompt)
+
+    if not answers:
+        raise ValueError(
+            "No se proveyó ninguna respuesta para la solicitud"
+            f" '{prompt.rstrip(': ')}'."
+        )
+
+    # La respuesta se imprime para que la salida sea
+    # la misma que en una ejecución interactiva.
+    answer = answers.pop(0)
+    print(f"{prompt}{answer}")
+    return answer
+
+
+def _exit_on_abort_key(ch: str) -> None:
+    """
+    _exit_on_abort_key() es una función que aborta la
+    ejecución del programa si el carácter recibido
+    corresponde a CTRL + C, CTRL + D o CTRL + Z, ya que
+    al leer la entrada en modo crudo dichas combinaciones
+    de teclas no producen ninguna excepción.
+    """
+    # Si el usuario presiona CTRL + C, CTRL + D o
+    # CTRL + Z, se aborta forzosamente la ejecución
+    # del programa, tal y como sucedería en un
+    # contexto de ejecución normal.
+    if len(ch) == 1 and ord(ch) in [3, 4, 26]:
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text="\nEjecución del programa interrupida manualmente."
+            "\n¡Saliendo!",
+        )
+
+        # 130 es el código de salida utilizado por
+        # la excepción KeyboardInterrupt cuando se
+        # presiona CTRL + C. Se lo utiliza acá de
+        # manera general ya que la idea cuando se
+        # utiliza cualquiera de esas combinaciones
+        # de teclas es salir forzosamente de forma
+        # inmediata.
+        sys.exit(130)
+
+
+def _read_posix_byte(fd: int, timeout: float | None) -> bytes | None:
+    """
+    _read_posix_byte() es una función que lee un byte de
+    la entrada estándar, esperando como máximo la cantidad
+    de segundos indicada. Devuelve None si se agota el
+    tiempo de espera, y produce un EOFError si la entrada
+    se cerró, al igual que input().
+    """
+    ready, _, _ = select.select([fd], [], [], timeout)
+
+    if not ready:
+        return None
+
+    data = os.read(fd, 1)
+
+    # Una entrada cerrada siempre está lista para leer,
+    # por lo que devolver None haría que quien espera una
+    # tecla la vuelva a leer indefinidamente.
+    if not data:
+        raise EOFError("La entrada estándar se cerró.")
+
+    return data
+
+
+def _decode_escape_sequence(read_byte: Callable[[], bytes | None]) -> str:
+    """
+    _decode_escape_sequence() es una función que decodifica
+    la secuencia de escape que sigue a un ESC, leyendo sus
+    bytes con la función recibida, hasta obtener el nombre
+    de la tecla presionada.
+
+    Se trata de una pequeña máquina de estados: luego del
+    ESC se espera "[" (secuencias CSI) u "O" (secuencias
+    SS3), y luego los parámetros y el byte final de la
+    secuencia. Las secuencias desconocidas se devuelven
+    tal cual.
+    """
+    first_byte = read_byte()
+
+    # Si no llegó nada más, se presionó la tecla Escape.
+    if first_byte is None:
+        return "ESC"
+
+    introducer = first_byte.decode(errors="replace")
+
+    if introducer == "O":
+        final_byte = read_byte()
+        if final_byte is None:
+            return "ALT+O"
+        final = final_byte.decode(errors="replace")
+        return _SS3_KEYS.get(final, f"\033O{final}")
+
+    if introducer != "[":
+        # ESC seguido de un carácter común corresponde a
+        # la combinación de dicho carácter con ALT.
+        return f"ALT+{introducer}"
+
+    # Los parámetros de una secuencia CSI son dígitos y
+    # separadores, y la secuencia termina con un byte
+    # entre "@" y "~".
+    parameters = ""
+    while True:
+        next_byte = read_byte()
+        if next_byte is None:
+            return f"\033[{parameters}"
+
+        character = next_byte.decode(errors="replace")
+        if "@" <= character <= "~":
+            break
+        parameters += character
+
+    if character == "~":
+        key = _CSI_TILDE_KEYS.get(parameters.split(";")[0])
+    else:
+        key = _CSI_KEYS.get(character)
+
+    return key if key is not None else f"\033[{parameters}{character}"
+
+
+def _read_windows_key(timeout: float | None = None) -> str | None:
+    """
+    _read_windows_key() es la implementación para Windows
+    de la función read_key() entregada por
+    keyboard_session(). Las bibliotecas de Windows ya
+    entregan los caracteres decodificados, por lo que solo
+    se deben traducir las teclas especiales.
+    """
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+
+    ch = msvcrt.getwch()
+
+    if ch in ("\x00", "\xe0"):
+        code = msvcrt.getwch()
+        return _WINDOWS_SPECIAL_KEYS.get(code, f"{ch}{code}")
+
+    if ch == "\033":
+        return "ESC"
+
+    _exit_on_abort_key(ch)
+    return _CONTROL_KEYS.get(ch, ch)
+
 
 # --- Funciones públicas de visualización y formato ---
-def clear_screen() -> None:
+def clear_screen(print_line: bool = True) -> None | str:
     """
-    clear_screen() es un wrapper de subprocess.run()
-    utilizado para limpiar la pantalla.
+    clear_screen() es una función utilizada para limpiar
+    la pantalla. En sistemas POSIX se utilizan secuencias
+    de escape ANSI, sin lanzar ningún proceso externo,
+    mientras que en Windows se utiliza el comando "cls".
+
+    Si "print_line=False", en lugar de limpiar la pantalla
+    se devuelve la secuencia que la limpia, para poder
+    incluirla en una cadena que se imprima de una sola
+    vez. En Windows, la pantalla se limpia de todos modos
+    y se devuelve una cadena vacía.
     """
-    command = "cls" if os.name == "nt" else "clear"
-    subprocess.run([command])
+    if not isinstance(print_line, bool):
+        raise TypeError("El parámetro 'print_line' debe ser un valor lógico.")
+
+    if os.name == "nt":
+        subprocess.run(["cls"])
+        return None if print_line else ""
+
+    if not print_line:
+        return _CLEAR_SCREEN_SEQUENCE
+
+    sys.stdout.write(_CLEAR_SCREEN_SEQUENCE)
+    sys.stdout.flush()
+    return None
 
 
 def draw_line(
@@ -159,12 +471,7 @@ def style_text(
         raise TypeError("El parámetro 'print_line' debe ser un valor lógico.")
 
     try:
-        if colour_type == "fg":
-            colour_code = _FOREGROUND_COLOURS[colour]
-            line = f"\033[1;{colour_code}m{text}\033[0m"
-        else:
-            colour_code = _BACKGROUND_COLOURS[colour]
-            line = f"\033[1;37;{colour_code}m{text}\033[0m"
+        line = f"{_STYLE_PREFIXES[(colour_type, colour)]}{text}{_STYLE_SUFFIX}"
 
         if print_line:
             print(line)
@@ -184,8 +491,11 @@ def style_text(
 
 
 def draw_coloured_line(
-    length: int, symbol: str = "-", colour: str = "yellow"
-) -> None:
+    length: int,
+    symbol: str = "-",
+    colour: str = "yellow",
+    print_line: bool = True,
+) -> None | str:
     """
     draw_coloured_line() es una combinación de draw_line()
     y style_text() que permite dibujar una línea de símbolos
@@ -194,6 +504,9 @@ def draw_coloured_line(
     utilizar. Por defecto, se imprime una línea de guiones
     amarilla.
 
+    Al igual que dichas funciones, permite imprimir la
+    línea o devolverla con el parámetro 'print_line'.
+
     Aquí aplican las restricciones de las funciones
     mencionadas anteriormente con respecto a la longitud de
     la línea, el símbolo pasado por parámetro y el color
@@ -204,7 +517,54 @@ def draw_coloured_line(
     funciones.
     """
     line_str = draw_line(length=length, symbol=symbol, print_line=False)
-    style_text(colour_type="fg", colour=colour, text=line_str, print_line=True)
+    return style_text(
+        colour_type="fg", colour=colour, text=line_str, print_line=print_line
+    )
+
+
+# --- Funciones públicas de renderizado rápido ---
+# Las siguientes funciones son equivalentes a style_text() y
+# draw_coloured_line() con "print_line=False", pero están
+# pensadas para el redibujado de menús, donde se llaman
+# constantemente con los mismos argumentos. Solo validan sus
+# argumentos cuando estos no se pueden resolver directamente
+# a partir de la tabla de estilos o de la caché.
+def render_styled_text(
+    colour_type: Literal["fg", "bg"], colour: str, text: str
+) -> str:
+    """
+    render_styled_text() es una versión rápida de
+    style_text() que devuelve el texto estilizado a
+    partir de la tabla de estilos precalculada. Si la
+    combinación de modo y color no existe, se recurre a
+    style_text() para informar el error.
+    """
+    try:
+        return f"{_STYLE_PREFIXES[(colour_type, colour)]}{text}{_STYLE_SUFFIX}"
+    except (KeyError, TypeError):
+        return style_text(
+            colour_type=colour_type,
+            colour=colour,
+            text=text,
+            print_line=False,
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def render_coloured_line(
+    length: int, symbol: str = "-", colour: str = "yellow"
+) -> str:
+    """
+    render_coloured_line() es una versión rápida de
+    draw_coloured_line() que guarda en memoria las
+    líneas ya construidas, de manera que dibujar una
+    línea repetida solo cueste una búsqueda en la caché.
+    La primera vez que se construye cada línea, sus
+    argumentos se validan como en draw_coloured_line().
+    """
+    return draw_coloured_line(
+        length=length, symbol=symbol, colour=colour, print_line=False
+    )
 
 
 def toggle_cursor(action: Literal["show", "hide"]) -> None:
@@ -246,7 +606,7 @@ def get_validated_input(
         )
 
     while True:
-        input_str = input(f"{msg}: ")
+        input_str = _read_answer(f"{msg}: ")
 
         # Si el usuario no introduce nada y presiona ENTER,
         # o si introduce caracteres que no sean números cuando
@@ -346,7 +706,8 @@ def get_char() -> str:
     de la implementación. Si se desea atrapar caracteres
     con secuencias de escape que requieran más de un
     byte (F1, F2, etc), esta función no podrá ser
-    utilizada.
+    utilizada. En su lugar, se debe utilizar
+    keyboard_session().
     """
     if os.name == "nt":
         # Las librerías de Windows ya proveen una
@@ -386,28 +747,86 @@ def get_char() -> str:
             # estándar de la terminal.
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-    # Si el usuario presiona CTRL + C, CTRL + D o
-    # CTRL + Z, se aborta forzosamente la ejecución
-    # del programa, tal y como sucedería en un
-    # contexto de ejecución normal.
-    if ord(ch) in [3, 4, 26]:
-        style_text(
-            colour_type="bg",
-            colour="red",
-            text="\nEjecución del programa interrupida manualmente."
-            "\n¡Saliendo!",
-        )
+    _exit_on_abort_key(ch)
+    return ch
 
-        # 130 es el código de salida utilizado por
-        # la excepción KeyboardInterrupt cuando se
-        # presiona CTRL + C. Se lo utiliza acá de
-        # manera general ya que la idea cuando se
-        # utiliza cualquiera de esas combinaciones
-        # de teclas es salir forzosamente de forma
-        # inmediata.
-        sys.exit(130)
 
-    return ch
+@contextlib.contextmanager
+def keyboard_session() -> Iterator[Callable[..., str | None]]:
+    """
+    keyboard_session() es un gestor de contexto que pone
+    la terminal en modo crudo una única vez, en lugar de
+    hacerlo por cada tecla como get_char(), y entrega una
+    función read_key() para leer las teclas presionadas.
+
+    read_key(timeout=None) devuelve el carácter de la
+    tecla presionada o, para las teclas especiales, su
+    nombre ("UP", "DOWN", "LEFT", "RIGHT", "ENTER",
+    "ESC", "F1", etc.), decodificando las secuencias de
+    escape de varios bytes y los caracteres UTF-8. Si se
+    especifica un límite de tiempo y no se presiona
+    ninguna tecla, devuelve None. Si la entrada estándar
+    se cerró, produce un EOFError.
+
+    Al igual que con get_char(), CTRL + C, CTRL + D y
+    CTRL + Z abortan la ejecución del programa. Al salir
+    del contexto se restaura la configuración original
+    de la terminal.
+
+    Ejemplo:
+    with keyboard_session() as read_key:
+        key = read_key()
+    """
+    if os.name == "nt":
+        yield _read_windows_key
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd) if os.isatty(fd) else None
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def read_next_byte() -> bytes | None:
+        # Si la entrada se cierra en medio de una secuencia,
+        # se la trata como si la secuencia hubiera terminado,
+        # y el EOFError se produce en la siguiente lectura.
+        try:
+            return _read_posix_byte(fd, _ESCAPE_SEQUENCE_TIMEOUT)
+        except EOFError:
+            return None
+
+    def read_key(timeout: float | None = None) -> str | None:
+        first_byte = _read_posix_byte(fd, timeout)
+        if first_byte is None:
+            return None
+
+        if first_byte == b"\033":
+            return _decode_escape_sequence(read_next_byte)
+
+        # Los caracteres UTF-8 de varios bytes se leen
+        # hasta que el decodificador los complete.
+        ch = decoder.decode(first_byte)
+        while ch == "":
+            next_byte = read_next_byte()
+            ch = decoder.decode(next_byte or b"", final=next_byte is None)
+
+        _exit_on_abort_key(ch)
+        return _CONTROL_KEYS.get(ch, ch)
+
+    try:
+        if old_settings is not None:
+            # Se pasa la entrada a modo crudo, pero se
+            # conserva el procesamiento de la salida para
+            # que se pueda seguir imprimiendo con normalidad
+            # dentro del contexto.
+            raw_settings = termios.tcgetattr(fd)
+            tty.cfmakeraw(raw_settings)
+            raw_settings[tty.OFLAG] = old_settings[tty.OFLAG]
+            termios.tcsetattr(fd, termios.TCSANOW, raw_settings)
+
+        yield read_key
+    finally:
+        if old_settings is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
 def press_enter() -> None:
@@ -417,6 +836,39 @@ def press_enter() -> None:
     por pantalla para indicarle al usuario como
     continuar.
     """
+    # Si las respuestas son programadas, no hay nadie
+    # a quien esperar.
+    if _scripted_input["answers"] is not None:
+        return
+
     print("")
     print("Presione ENTER para continuar.", end="")
     input()
+
+
+@contextlib.contextmanager
+def scripted_input(answers: list[str]) -> Iterator[None]:
+    """
+    scripted_input() es un gestor de contexto que hace que,
+    dentro de él, get_validated_input() y get_choice()
+    tomen sus respuestas de la lista recibida, en orden,
+    en lugar de leerlas de la entrada estándar. Asimismo,
+    press_enter() no espera a que se presione ENTER.
+
+    Si se solicita una respuesta cuando ya no quedan
+    respuestas en la lista, se produce un ValueError.
+    """
+    if not isinstance(answers, list) or not all(
+        isinstance(answer, str) for answer in answers
+    ):
+        raise TypeError(
+            "El parámetro 'answers' debe ser una lista de cadenas."
+        )
+
+    previous_answers = _scripted_input["answers"]
+    _scripted_input["answers"] = list(answers)
+
+    try:
+        yield
+    finally:
+        _scripted_input["answers"] = previous_answers
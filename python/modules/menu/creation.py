@@ -60,12 +60,24 @@ diccionario es la siguiente:
                ejecución».
         6.2.4. Si se desea salir de un menú de opciones, "action" deberá
                contener la cadena 'exit'.
+        6.2.5. Si se debe entrar a un menú que solo se debe cargar al
+               ingresar a él, "action" debe contener una cadena con el
+               formato 'paquete.modulo:ATRIBUTO' o una función que devuelva
+               el diccionario del menú. Véase la documentación del módulo
+               "plan" para más información.
    6.3. "aesthetic_action": la acción estética a ejecutar antes de la acción
         principal. Puede contener los valores 'print_line' o 'clear_screen'.
    6.4. "prompt": el mensaje para solicitar una entrada del usuario.
    6.5. "env_vars": variables de entorno para modificar el comportamiento de un
         comando. Véase la sección «Aplicación de variables de entorno a
         comandos» para obtener instrucciones de uso concretas.
+   6.6. "after": los comandos que debe esperar cada comando al ejecutarlos de
+        manera concurrente. Véase la sección «Modos especiales de ejecución
+        de comandos» para obtener instrucciones de uso concretas.
+7. "options_provider": debe contener una función que genere opciones a mostrar
+   antes de las definidas en "options", con el mismo formato que estas, y
+   opcionalmente una función que devuelva su marca de invalidación. Véase la
+   documentación del módulo "plan" para más información.
 
 ### Obligatoriedad de los parámetros ###
 A excepción de "dict_name", "title" y "options", que deben ser obligatorios,
@@ -87,6 +99,32 @@ Estas funciones están disponibles en el módulo "validation" de este paquete,
 el cual contiene toda la lógica relacionada a la validación de elementos de un
 diccionario.
 
+Las validaciones se realizan por única vez al iniciar un script, ya que antes
+de mostrar un menú este se compila, junto con todos sus submenús, en un plan
+de ejecución. Véase la documentación del módulo "plan" para más información.
+
+### Navegación entre menús ###
+Los menús a los que ingresa el usuario se guardan en una pila de navegación,
+por lo que ingresar a un submenú no requiere volver a construir ni a validar
+ningún menú, y la profundidad de los menús no está limitada. Al ingresar a un
+menú se ejecutan sus acciones de "on_start", y al salir de él, ya sea con una
+opción de salida o con una tecla de navegación, las de "on_exit".
+
+Cuando el script se ejecuta en una terminal, antes de escribir una elección se
+puede presionar ESC para volver al menú anterior, o INICIO para volver al menú
+principal, saliendo de todos los menús intermedios. Véase la documentación del
+módulo "prompt" para más información.
+
+### Modo de observación ###
+Cuando el script se ejecuta en una terminal, luego de ejecutar una opción cuya
+acción sea una lista de comandos, además de elegir si volver a ejecutarla, se
+puede presionar 'O' u 'o' para ingresar al modo de observación. En este modo la
+opción se vuelve a ejecutar periódicamente y solo se redibujan las líneas de su
+salida que cambiaron, hasta que se presiona cualquier tecla. Si la opción
+solicita una entrada al usuario, esta se solicita una única vez al ingresar al
+modo de observación. Véase la documentación del módulo "watch" para más
+información.
+
 ### Ejecución de acciones arbitrarias en momentos específicos ###
 De acuerdo a lo visto en la explicación de los parámetros aceptados para un
 diccionario de entrada, es posible definir los campos "on_start", "on_draw" y
@@ -105,6 +143,25 @@ Por el contrario, si lo que se desea es mostrar alertas persistenes de algún
 tipo, entonces se debe usar el parámetro "on_draw", el cual permite imprimir
 cabeceras personalizadas por arriba de la cabecera principal de un menú.
 
+Dado que el menú se construye por completo antes de imprimirlo, lo que
+impriman las acciones definidas en "on_draw" se captura para incluirlo en
+el menú. Por lo tanto, dichas acciones deben imprimir a través de print() (o
+de las funciones del módulo "console_ui") y no a través de comandos externos
+que escriban directamente en la terminal.
+
+Asimismo, cuando el script se ejecuta en una terminal, las acciones definidas
+en "on_draw" se ejecutan en segundo plano: el menú se muestra de inmediato con
+la última salida conocida de cada acción, la cual se actualiza en su lugar
+cuando la acción finaliza, mientras el usuario elige una opción. Dichas
+acciones se vuelven a ejecutar periódicamente para mantener la información
+actualizada.
+
+Las acciones cuyo resultado no cambia con frecuencia pueden declarar durante
+cuántos segundos se puede reutilizar su salida, definiéndolas como una tupla
+con el objeto de función y dicha cantidad de segundos (TTL), por ejemplo:
+"on_draw": [(check_internet_connection, 60)]. Véase la documentación de los
+módulos "hooks" y "prompt" para más información.
+
 ### Modos especiales de ejecución de comandos ###
 De acuerdo a lo estipulado en el inciso 4.2.3, a la hora de ejecutar uno o más
 comandos, la clave "action" debe contener una lista que a su vez contenga otras
@@ -124,13 +181,29 @@ deben ejecutarse de cierta forma:
      espacios es posible incluir la etiqueta "#SPLIT-INPUT" junto a "#UINPUT",
      para que la entrada sea dividida y procesada correctamente por el
      intérprete de comandos.
-* En caso de que dos comandos deban ejecutarse con pipes, el primer elemento de
-  la lista contenida por la clave "action" debe ser la cadena "#PIPE", seguido
-  de las listas con las definiciones de comandos.
+* En caso de que dos o más comandos deban ejecutarse con pipes, el primer
+  elemento de la lista contenida por la clave "action" debe ser la cadena
+  "#PIPE", seguido de las listas con las definiciones de comandos, en el orden
+  en el que se deben encadenar.
   ** Asimismo, en caso de que alguno de los comandos deba ejecutarse con
      permisos de superusuario o se le deba anexar una entrada provista por el
      usuario, se deben incluir las cadenas "#ROOT" y "#UINPUT", de acuerdo a lo
      descripto para los casos anteriores.
+* En caso de que dos o más comandos independientes entre sí se puedan ejecutar
+  a la vez, el primer elemento de la lista contenida por la clave "action"
+  debe ser la cadena "#PARALLEL", seguido de las listas con las definiciones
+  de comandos. De esta manera, la acción demora lo que demora el comando más
+  lento, y no la suma de todos ellos.
+  ** Si un comando debe esperar a que finalicen otros, se lo debe indicar con
+     el parámetro "after" de la opción: una lista de tuplas de dos elementos,
+     donde el primero es la posición del comando en la lista "action" y el
+     segundo es una lista con las posiciones de los comandos a esperar, que
+     deben estar definidos antes que él. Si alguno de dichos comandos falla,
+     el comando que los espera no se ejecuta.
+  ** La cantidad de comandos en ejecución a la vez está limitada según la
+     cantidad de procesadores del sistema, y las salidas de los comandos se
+     pueden mezclar entre sí. Si no está activo el ayudante del módulo
+     "root_helper", los comandos con la etiqueta "#ROOT" se ejecutan de a uno.
 
 Ejemplos:
 * ["#ROOT", "comando", "--flag"]
@@ -140,6 +213,13 @@ Ejemplos:
     ["#UINPUT", "comando1", "--flag1"],
     ["#ROOT", "comando2", "--flag1, "--flag2"],
   ]
+* "action": [
+      "#PARALLEL",
+      ["#ROOT", "comando1"],
+      ["#ROOT", "comando2"],
+      ["comando3"],
+  ],
+  "after": [(3, [1])]
 
 ### Aplicación de variables de entorno a comandos ###
 A través del parámetro "env_vars" es posible especificar variables de entorno
@@ -165,42 +245,109 @@ Ejemplo:
         }
     )
 ]
+
+### Ejecución no interactiva ###
+La función run_menu_from_command_line() permite ejecutar opciones de un menú
+sin mostrarlo, para utilizarlas desde otros scripts o tareas programadas.
+Cada opción se indica con "--run" a través de su ruta desde el menú principal,
+con números o nombres de opciones separados por "/", y las respuestas a las
+solicitudes de entrada se indican en orden con "--input". Por ejemplo:
+
+  genscript.py --run 1/2 --run "Menú de manejo de snapshots./3" --input nombre
+
+Con "--list" se muestra la ruta de todas las opciones. El código de salida del
+script es el del último comando que falló, o 0 si todos finalizaron
+correctamente.
 """
 
 import contextlib
-import copy
+import functools
 import os
+import subprocess
+import sys
 import textwrap
 
 from modules.console_ui import (
     clear_screen,
     draw_coloured_line,
-    get_char,
     get_choice,
     get_validated_input,
+    keyboard_session,
+    render_coloured_line,
+    render_styled_text,
+    scripted_input,
+    style_text,
     toggle_cursor,
 )
 
 from modules.subprocess_utils import (
-    pipe_commands,
+    async_run_command,
+    async_run_command_as_root,
+    collect_command_errors,
+    print_pipe_commands,
     run_command,
     run_command_as_root,
+    run_concurrently,
 )
 
-from modules.menu.validation import (
-    _VALID_COMMAND_TAGS,
-    _check_basic_dictionary_structure,
-    _check_top_level_option_keys,
-    _check_action,
+from modules.menu.plan import (
+    EXIT_ACTION,
+    FUNCTION_CALLS_ACTION,
+    FUNCTION_LIST_ACTION,
+    LAZY_SUBMENU_ACTION,
+    PARALLEL_COMMANDS_ACTION,
+    PIPED_COMMANDS_ACTION,
+    SEQUENTIAL_COMMANDS_ACTION,
+    SUBMENU_ACTION,
+    CompiledMenu,
+    CompiledOption,
+    compile_menu,
+    resolve_generated_options,
+    resolve_submenu,
 )
 
-from modules.menu.types import MenuDictionary, OptionDictionary
+from modules.menu.hooks import run_draw_hooks_now
+from modules.menu.palette import choose_from_palette
+from modules.menu.prompt import (
+    BACK_REQUEST,
+    HOME_REQUEST,
+    PALETTE_REQUEST,
+    get_choice_with_background_hooks,
+)
+from modules.menu.types import MenuDictionary
+from modules.menu.watch import watch_action
 from modules.program_tools import get_privilege_elevation_command
-from typing import Callable
+from modules.root_helper import is_root_helper_enabled
+from typing import Any, Callable
+
+# --- Constantes a utilizar en las funciones ---
+# Separador de los elementos de la ruta a una opción
+# en el modo no interactivo.
+_OPTION_PATH_SEPARATOR = "/"
+
+# Cantidad máxima de comandos de una misma opción que se
+# ejecutan a la vez. Como los comandos suelen pasar buena
+# parte de su tiempo esperando operaciones de entrada y
+# salida, se admiten algunos más que procesadores, con la
+# misma fórmula que concurrent.futures.ThreadPoolExecutor.
+_MAX_PARALLEL_COMMANDS = min(32, (os.cpu_count() or 1) + 4)
+
+# Tipos de acción de las opciones que se pueden
+# ejecutar en el modo de observación.
+_WATCHABLE_ACTIONS = (
+    SEQUENTIAL_COMMANDS_ACTION,
+    PIPED_COMMANDS_ACTION,
+    PARALLEL_COMMANDS_ACTION,
+)
+
+# --- Estado de la sesión de menús ---
+# Menú principal de la sesión actual, utilizado para
+# construir el índice de la paleta de búsqueda.
+_menu_session = {"root": None}
 
 
 # --- Funciones privadas ---
-def _execute_external_hooks(hook_list: list[Callable]) -> None:
+def _execute_external_hooks(hook_list: tuple[Callable, ...]) -> None:
     """
     _execute_external_hooks() es una función utilizada
     para ejecutar las funciones definidas en los
@@ -225,39 +372,59 @@ def _execute_external_hooks(hook_list: list[Callable]) -> None:
             hook()
 
 
-def _draw_menu(menu_data: MenuDictionary) -> None:
+def _render_menu(
+    menu: CompiledMenu, hook_outputs: list[str | None] | None = None
+) -> str:
     """
-    _draw_menu() es una función utilizada para imprimir
-    dinámicamente un menú de opciones a partir de un
-    diccionario de entrada, el cual debe contener las
-    opciones a ejecutar, así como el título del menú
-    y cualquier posible encabezado de sección a mostrar
-    para dividir las opciones disponibles en apartados.
+    _render_menu() es una función utilizada para construir
+    dinámicamente, como una única cadena, un menú de
+    opciones a partir de un diccionario de entrada, el
+    cual debe contener las opciones a ejecutar, así como
+    el título del menú y cualquier posible encabezado de
+    sección a mostrar para dividir las opciones
+    disponibles en apartados.
+
+    Si se recibe "hook_outputs", en lugar de ejecutar las
+    acciones de "on_draw" se utiliza la salida ya obtenida
+    de cada una, mostrando un mensaje de carga para las
+    que todavía no hayan finalizado (None). De lo
+    contrario, se ejecutan en el hilo actual las acciones
+    cuya salida no se pueda reutilizar.
     """
-    title_length = len(menu_data["title"])
+    title_length = len(menu.title)
+    title_separator = render_coloured_line(length=title_length, symbol="=")
+    frame_lines = []
 
     # Ejecución de hooks definidos en el parámetro
-    # "on_draw", si los hubiera.
-    on_draw_hooks = menu_data.get("on_draw", None)
-    if on_draw_hooks is not None:
-        for hook in on_draw_hooks:
-            draw_coloured_line(length=title_length, symbol="=")
-            hook()
+    # "on_draw", si los hubiera. Lo que estos
+    # imprimen se captura para incluirlo en el menú.
+    if hook_outputs is None:
+        hook_outputs = run_draw_hooks_now(menu.on_draw)
+
+    for output in hook_outputs:
+        if output is None:
+            output = render_styled_text(
+                colour_type="bg", colour="blue", text="Cargando..."
+            )
+
+        frame_lines.append(title_separator)
+        if output:
+            frame_lines.append(output.rstrip("\n"))
 
-    # Impresión del título del menú.
-    draw_coloured_line(length=title_length, symbol="=")
-    print(menu_data["title"])
-    draw_coloured_line(length=title_length, symbol="=")
+    # Título del menú.
+    frame_lines.append(title_separator)
+    frame_lines.append(menu.title)
+    frame_lines.append(title_separator)
 
-    # Impresión del menú de opciones.
+    # Menú de opciones.
     option_number = 1
 
-    for item in menu_data["options"]:
+    for item in menu.source["options"]:
         if "action" not in item:
             # El elemento a imprimir es un encabezado
             # de sección.
-            print(f"\n{item["name"]}")
-            draw_coloured_line(len(item["name"]))
+            frame_lines.append(f"\n{item["name"]}")
+            frame_lines.append(render_coloured_line(len(item["name"])))
         else:
             # El elemento a imprimir es una opción
             # del menú.
@@ -268,60 +435,54 @@ def _draw_menu(menu_data: MenuDictionary) -> None:
             # longitud de las descripciones de las
             # opciones no sobrepasen la longitud del
             # título. Para ello, se dividen las líneas
-            # y se las guarda en una lista, respecto
-            # de la cual se debe iterar.
-            wrapped_lines = textwrap.wrap(
-                text=item["name"],
-                width=title_length,
-                initial_indent=f"{option_number}. ",
-                subsequent_indent=prefix_str,
+            # y se las guarda en una lista.
+            frame_lines.extend(
+                textwrap.wrap(
+                    text=item["name"],
+                    width=title_length,
+                    initial_indent=f"{option_number}. ",
+                    subsequent_indent=prefix_str,
+                )
             )
 
-            for line in wrapped_lines:
-                print(line)
-
             option_number += 1
 
     # Esta línea en blanco se deja para que el
     # listado de opciones no colisione con el
     # pedido de elección al usuario, realizado
     # por get_choice().
-    print("")
+    frame_lines.append("")
 
+    return "\n".join(frame_lines) + "\n"
 
-def _get_command_options(menu_data: MenuDictionary) -> list[OptionDictionary]:
-    """
-    _get_command_options() es una función utilizada
-    para procesar un diccionario de entrada que contiene
-    definiciones de comandos a ejecutar, así como la
-    definición del título principal de un menú y los
-    encabezados de sección que agrupan las distintas
-    opciones disponibles (si hubiera).
 
-    Se encarga de otorgar como salida una lista aparte
-    que contenga únicamente los posibles comandos a
-    ejecutar, de manera que después se pueda recorrer
-    esta nueva lista para encontrar y ejecutar la
-    opción elegida por el usuario.
+def _supports_background_hooks() -> bool:
+    """
+    _supports_background_hooks() es una función que
+    determina si se puede utilizar el ciclo de eventos
+    del módulo "prompt", el cual requiere un sistema
+    POSIX en el que la entrada y la salida estándar sean
+    una terminal.
     """
-    # Inicialización de una lista vacía que contenga
-    # los posibles comandos a ejecutar.
-    command_options = []
+    return os.name == "posix" and sys.stdin.isatty() and sys.stdout.isatty()
 
-    # Recorrido de la lista "options" definida dentro
-    # del diccionario de entrada.
-    for item in menu_data["options"]:
-        if "action" in item:
-            # Si un ítem de la lista "options" contenida
-            # dentro del diccionario de entrada tiene un
-            # parámetro "action" definido, entonces se lo
-            # añade a la lista de salida.
-            command_options.append(item)
 
-    return command_options
+def _draw_menu(menu: CompiledMenu) -> None:
+    """
+    _draw_menu() es una función utilizada para limpiar
+    la pantalla e imprimir un menú de opciones.
+
+    El menú se construye por completo antes de limpiar
+    la pantalla y se imprime con una única escritura,
+    de manera que no se note ningún parpadeo al
+    redibujarlo, incluso a través de conexiones lentas.
+    """
+    frame = _render_menu(menu)
+    sys.stdout.write(clear_screen(print_line=False) + frame)
+    sys.stdout.flush()
 
 
-def _handle_sequential_command_list(menu_option: OptionDictionary) -> None:
+def _handle_sequential_command_list(option: CompiledOption) -> None:
     """
     _handle_sequential_commands_list() es una
     subfunción de _handle_action() que se encarga
@@ -335,67 +496,35 @@ def _handle_sequential_command_list(menu_option: OptionDictionary) -> None:
     del usuario en caso de ser necesario, previo
     a la ejecución de los comandos provistos.
     """
-    # Se realiza una copia "profunda" del parámetro
-    # "action" para no alterar la versión definida
-    # en el diccionario. Esto podría pasar, por
-    # ejemplo, cuando a un comando se le debe anexar
-    # una entrada provista por el usuario.
-    action_deepcopy = copy.deepcopy(menu_option["action"])
     user_input = None
 
-    if "prompt" in menu_option:
-        user_input = get_validated_input(msg=menu_option["prompt"])
+    if option.prompt is not None:
+        user_input = get_validated_input(msg=option.prompt)
         print("")
 
-    if "env_vars" in menu_option:
-        env_vars_dict = dict(menu_option["env_vars"])
-    else:
-        env_vars_dict = None
-
-    for index, command in enumerate(action_deepcopy):
-        # Lista para almacenar cada comando
-        # a ejecutar.
-        command_without_tags = []
-        requires_root = False
-
-        # Se inspecciona el comando para determinar
-        # si se lo debe ejecutar con permisos de
-        # superusuario o se le debe anexar alguna
-        # entrada provista por el usuario.
-        # Luego se lo limpia para remover cualquier
-        # etiqueta que pueda tener, de manera que
-        # se lo pueda ejecutar sin problemas.
-        if "#ROOT" in command:
-            requires_root = True
-        if "#UINPUT" in command:
-            if "#SPLIT-INPUT" in command:
-                user_input = user_input.split()
-                command = command + user_input
-            else:
-                command.append(user_input)
-
-        command_without_tags = [
-            i for i in command if i not in _VALID_COMMAND_TAGS
-        ]
+    # Las plantillas de los comandos ya no tienen
+    # etiquetas, por lo que solo se les debe anexar
+    # la entrada del usuario, si corresponde. Esto no
+    # modifica la acción definida en el diccionario.
+    for command in option.commands:
+        arguments = command.build_arguments(user_input)
 
         # Ejecución del comando.
-        if requires_root:
-            run_command_as_root(command_without_tags)
+        if command.requires_root:
+            run_command_as_root(arguments)
         else:
-            # Antes de ejecutar un comando, se debe
-            # revisar si es que hay variables de
-            # entorno definidas para aplicarle.
+            # Si el comando tiene variables de entorno
+            # definidas, se las aplica sobre el entorno
+            # actual.
             new_env = None
 
-            if env_vars_dict is not None:
-                env_vars_to_add = env_vars_dict.get(index)
-                new_env = os.environ.copy()
-                new_env.update(env_vars_to_add)
+            if command.env_overlay is not None:
+                new_env = os.environ | command.env_overlay
 
-            run_command(command=command_without_tags, custom_env=new_env)
+            run_command(command=arguments, custom_env=new_env)
 
 
-def _handle_piped_command_list(menu_option: OptionDictionary) -> None:
+def _handle_piped_command_list(option: CompiledOption) -> None:
     """
     _handle_piped_command_list() es una subfunción
     de _handle_action() que se encarga de procesar
@@ -409,50 +538,99 @@ def _handle_piped_command_list(menu_option: OptionDictionary) -> None:
     del usuario en caso de ser necesario, previo
     a la ejecución de los comandos provistos.
     """
-    # Se realiza una copia "profunda" del parámetro
-    # "action" para no alterar la versión definida
-    # en el diccionario. Esto podría pasar, por
-    # ejemplo, cuando a un comando se le debe anexar
-    # una entrada provista por el usuario.
-    action_deepcopy = copy.deepcopy(menu_option["action"])
     user_input = None
 
-    if "prompt" in menu_option:
-        user_input = get_validated_input(msg=menu_option["prompt"])
+    if option.prompt is not None:
+        user_input = get_validated_input(msg=option.prompt)
         print("")
 
     # Lista para almacenar los comandos
     # a ejecutar.
     piped_commands = []
 
-    # Se inspecciona cada comando para anexarle
-    # cualquier cosa que pueda llegar a ser
-    # necesaria, según las etiquetas que tenga.
-    # Luego se limpia el comando para remover
-    # las etiquetas, de manera que se lo pueda
-    # ejecutar sin problemas.
-    for command in action_deepcopy:
-        if not isinstance(command, str):
-            if "#ROOT" in command:
-                root_cmd = get_privilege_elevation_command()
-                command.insert(0, f"{root_cmd}")
-            if "#UINPUT" in command:
-                if "#SPLIT-INPUT" in command:
-                    user_input = user_input.split()
-                    command = command + user_input
-                else:
-                    command.append(user_input)
-            piped_commands.append(
-                [i for i in command if i not in _VALID_COMMAND_TAGS]
+    # A cada comando se le anexa la entrada del
+    # usuario, si corresponde, y se le antepone el
+    # programa de elevación de privilegios si se lo
+    # debe ejecutar como superusuario.
+    for command in option.commands:
+        arguments = command.build_arguments(user_input)
+        if command.requires_root:
+            arguments.insert(0, get_privilege_elevation_command())
+        piped_commands.append(arguments)
+
+    # Ejecución de los comandos. La salida del último
+    # comando se imprime a medida que se produce, sin
+    # esperar a que finalice la pipeline completa.
+    print_pipe_commands(*piped_commands)
+
+
+def _handle_parallel_command_list(option: CompiledOption) -> None:
+    """
+    _handle_parallel_command_list() es una subfunción
+    de _handle_action() que se encarga de procesar
+    el parámetro "action" en una opción del
+    diccionario de entrada cuando este es provisto
+    como una lista de comandos a ejecutar de manera
+    concurrente.
+
+    Cada comando se ejecuta en cuanto finalizan los
+    comandos que debe esperar según el parámetro
+    "after", sin superar la cantidad de comandos a la
+    vez indicada en _MAX_PARALLEL_COMMANDS.
+    """
+    # La librería asyncio demora en importarse, por lo
+    # que solo se la importa si el menú tiene opciones
+    # con comandos concurrentes.
+    import asyncio
+
+    user_input = None
+
+    if option.prompt is not None:
+        user_input = get_validated_input(msg=option.prompt)
+        print("")
+
+    # Si no está activo el ayudante del módulo
+    # "root_helper", cada comando con permisos de
+    # superusuario debe autenticarse por su cuenta, por
+    # lo que estos se ejecutan de a uno para que no se
+    # pidan varias contraseñas a la vez.
+    root_lock = None if is_root_helper_enabled() else asyncio.Lock()
+
+    async def run_as_root(arguments: list[str]) -> Any:
+        if root_lock is None:
+            return await async_run_command_as_root(command=arguments)
+        async with root_lock:
+            return await async_run_command_as_root(command=arguments)
+
+    coroutines = []
+
+    for command in option.commands:
+        arguments = command.build_arguments(user_input)
+
+        if command.requires_root:
+            coroutines.append(run_as_root(arguments))
+        else:
+            new_env = None
+
+            if command.env_overlay is not None:
+                new_env = os.environ | command.env_overlay
+
+            coroutines.append(
+                async_run_command(command=arguments, custom_env=new_env)
             )
 
-    # Ejecución de los comandos y resguardo de
-    # la salida producida por este.
-    result = pipe_commands(*piped_commands)
-    print(f"{result}")
+    run_concurrently(
+        coroutines=coroutines,
+        max_concurrency=_MAX_PARALLEL_COMMANDS,
+        dependencies={
+            position: list(required)
+            for position, required in enumerate(option.dependencies)
+            if required
+        },
+    )
 
 
-def _handle_action(menu_option: OptionDictionary) -> None:
+def _handle_action(option: CompiledOption) -> None:
     """
     _handle_action() es una función utilizada para
     ejecutar comandos o funciones provistas en un
@@ -463,36 +641,420 @@ def _handle_action(menu_option: OptionDictionary) -> None:
     menor cantidad de lógica de procesamiento
     posible esté definida en run_menu().
 
+    El tipo de la acción ya fue determinado al compilar
+    el menú, por lo que no se debe volver a inspeccionar
+    su contenido.
+
     Para el procesamiento de las listas de comandos
-    secuenciales y las listas de comandos a ejecutar
-    con pipes, se utilizan las siguientes funciones:
+    secuenciales, las listas de comandos a ejecutar
+    con pipes y las listas de comandos a ejecutar de
+    manera concurrente, se utilizan las siguientes
+    funciones:
     * _handle_sequential_commands_list().
     * _handle_piped_command_list().
+    * _handle_parallel_command_list().
     """
-    action = menu_option.get("action")
-
-    if all(isinstance(item, (str, list)) for item in action):
-        # Tratamiento de listas de comandos
-        # secuenciales y listas de comandos
-        # para ejecutar con pipes.
-        if "#PIPE" in action:
-            _handle_piped_command_list(menu_option)
-        else:
-            _handle_sequential_command_list(menu_option)
-    elif all(callable(item) for item in action):
+    if option.kind == PIPED_COMMANDS_ACTION:
+        _handle_piped_command_list(option)
+    elif option.kind == SEQUENTIAL_COMMANDS_ACTION:
+        _handle_sequential_command_list(option)
+    elif option.kind == PARALLEL_COMMANDS_ACTION:
+        _handle_parallel_command_list(option)
+    elif option.kind == FUNCTION_LIST_ACTION:
         # Tratamiento de listas de funciones.
-        for function in action:
+        for function in option.action:
             function()
-    elif all(isinstance(item, tuple) for item in action):
+    elif option.kind == FUNCTION_CALLS_ACTION:
         # Tratamiento de listas de tuplas con
         # objetos de función y listas de
         # parámetros.
-        for func_tuple in action:
+        for func_tuple in option.action:
             function = func_tuple[0]
             function_params = func_tuple[1]
             function(*function_params)
 
 
+def _watch_option(option: CompiledOption) -> None:
+    """
+    _watch_option() es una función utilizada para
+    ejecutar una opción en el modo de observación del
+    módulo "watch".
+
+    Si la opción solicita una entrada al usuario, esta se
+    solicita una única vez, y luego se la provee en cada
+    ejecución como una respuesta programada.
+    """
+    answers = []
+
+    if option.prompt is not None:
+        print("")
+        answers.append(get_validated_input(msg=option.prompt))
+
+    def run_once() -> None:
+        with scripted_input(answers):
+            _handle_action(option)
+
+    watch_action(action=run_once, title=option.name)
+
+
+def _run_option(menu: CompiledMenu, option: CompiledOption) -> None:
+    """
+    _run_option() es una función utilizada para ejecutar
+    la acción de una opción elegida por el usuario, junto
+    con su acción estética, y luego consultarle si desea
+    volver a ejecutarla.
+
+    El menú recibido es aquel que contiene a la opción,
+    que no necesariamente es el menú que se está
+    mostrando, ya que la opción se puede elegir a través
+    de la paleta de búsqueda.
+    """
+    # Ejecución de la acción estética definida
+    # en la opción elegida por el usuario.
+    if option.aesthetic_action == "clear_screen":
+        clear_screen()
+    else:
+        draw_coloured_line(len(menu.title))
+    # Solo se puede observar una opción cuya acción sea
+    # una lista de comandos, ya que las funciones pueden
+    # solicitar entradas por su cuenta.
+    can_watch = option.kind in _WATCHABLE_ACTIONS and (
+        _supports_background_hooks()
+    )
+    valid_choices = ["S", "s", "N", "n"]
+    if can_watch:
+        valid_choices += ["O", "o"]
+
+    # Ejecución de la acción principal elegida
+    # por el usuario.
+    while True:
+        _handle_action(option)
+
+        # Luego de ejecutar la acción por primera
+        # vez, se imprime el separador y se le
+        # consulta al usuario si desea volver a
+        # repetir la acción.
+        draw_coloured_line(len(menu.title))
+        user_choice = None
+
+        try:
+            toggle_cursor("hide")
+            print("¿Desea volver a ejecutar la opción?")
+            print("Presione 'S' o 's' para indicar que sí.")
+            print("Presione 'N' o 'n' para indicar que no.")
+            if can_watch:
+                print("Presione 'O' u 'o' para observarla periódicamente.")
+
+            # Mientras el usuario no introduzca un carácter
+            # valido, solo se "consume" lo que introduce. La
+            # terminal se pasa a modo crudo una única vez
+            # para todas las teclas leídas.
+            with keyboard_session() as read_key:
+                while user_choice not in valid_choices:
+                    user_choice = read_key()
+        finally:
+            toggle_cursor("show")
+
+        if user_choice in ["N", "n"]:
+            break
+        elif user_choice in ["O", "o"]:
+            _watch_option(option)
+            break
+        else:
+            # Para las siguientes ejecuciones de una
+            # acción se limpia la pantalla, con la
+            # finalidad de que no se vayan apilando
+            # todas las salidas mostradas por pantalla
+            # por cada iteración.
+            clear_screen()
+
+            # Luego se imprime una cabecera para recordarle
+            # al usuario cual es la opción que se está
+            # repitiendo, por las dudas.
+            draw_coloured_line(len(menu.title))
+            print("Opción a repetir: ")
+            print(option.name)
+            draw_coloured_line(len(menu.title))
+
+
+def _enter_menu(
+    navigation_stack: list[CompiledMenu], menu: CompiledMenu
+) -> None:
+    """
+    _enter_menu() es una función utilizada para ingresar
+    a un menú, ejecutando sus acciones de "on_start" y
+    apilándolo en la pila de navegación.
+
+    El menú solo se apila si sus acciones de "on_start"
+    finalizan correctamente, de manera que no se ejecuten
+    las de "on_exit" de un menú al que no se ingresó.
+    """
+    _execute_external_hooks(menu.on_start)
+    navigation_stack.append(menu)
+
+
+def _leave_menu(navigation_stack: list[CompiledMenu]) -> None:
+    """
+    _leave_menu() es una función utilizada para salir del
+    menú que se encuentra en el tope de la pila de
+    navegación, ejecutando sus acciones de "on_exit".
+    """
+    _execute_external_hooks(navigation_stack.pop().on_exit)
+
+
+def _choose_option(menu: CompiledMenu) -> int | str:
+    """
+    _choose_option() es una función utilizada para
+    imprimir un menú y devolver la elección del usuario,
+    o el pedido de navegación que este realizó.
+
+    Si se está en una terminal, las acciones de "on_draw"
+    se ejecutan en segundo plano, para que el menú no
+    deba esperarlas, y se puede abrir la paleta de
+    búsqueda o volver a un menú anterior.
+    """
+    if _supports_background_hooks():
+        return get_choice_with_background_hooks(
+            render_frame=functools.partial(_render_menu, menu),
+            hooks=menu.on_draw,
+            low_lim=1,
+            upp_lim=len(menu.options),
+            allow_navigation=True,
+        )
+
+    _draw_menu(menu)
+    return get_choice(1, len(menu.options))
+
+
+def _run_navigation_stack(root_menu: CompiledMenu) -> None:
+    """
+    _run_navigation_stack() es una función utilizada para
+    mostrar un menú ya compilado y todos los submenús a
+    los que el usuario ingrese a partir de él, recibir
+    las elecciones del usuario y ejecutar las opciones
+    elegidas.
+
+    En lugar de llamarse a sí misma por cada submenú, la
+    función mantiene una pila de navegación con los menús
+    a los que se ingresó, de manera que la profundidad de
+    los menús no esté limitada por la pila de Python, y
+    que se pueda volver al menú anterior o al menú
+    principal sin volver a construir ningún menú. Las
+    acciones de "on_start" y "on_exit" de cada menú se
+    ejecutan al apilarlo y desapilarlo, respectivamente.
+
+    Dado que el menú y todos sus submenús ya fueron
+    validados al compilarlos, en el ciclo principal no
+    se realiza ningún control de estructura ni se
+    inspecciona el tipo de las acciones.
+    """
+    navigation_stack = []
+    _enter_menu(navigation_stack, root_menu)
+
+    try:
+        # Ciclo principal para imprimir el menú del tope
+        # de la pila, recibir una elección y ejecutarla.
+        while navigation_stack:
+            # Si el menú genera opciones, se obtienen
+            # antes de cada impresión, ya que la opción
+            # ejecutada anteriormente podría haber
+            # cambiado las opciones a generar.
+            shown_menu = resolve_generated_options(navigation_stack[-1])
+            choice = _choose_option(shown_menu)
+
+            # Los pedidos para volver a un menú anterior no
+            # tienen efecto en el menú principal, para que
+            # no se pueda salir del script por accidente.
+            if choice == BACK_REQUEST:
+                if len(navigation_stack) > 1:
+                    _leave_menu(navigation_stack)
+                continue
+            elif choice == HOME_REQUEST:
+                while len(navigation_stack) > 1:
+                    _leave_menu(navigation_stack)
+                continue
+            elif choice == PALETTE_REQUEST:
+                palette_choice = choose_from_palette(_menu_session["root"])
+                if palette_choice is None:
+                    continue
+                option_menu, option = palette_choice
+            else:
+                option_menu = shown_menu
+                option = shown_menu.options[choice - 1]
+
+            # En primera instancia, se controla si el
+            # usuario desea salir o dirigirse a otro
+            # menú de un script.
+            # En caso de que no se desee hacer ninguna
+            # de estas cosas, se prosigue con las
+            # opciones de ejecución definidas abajo.
+            if option.kind in {SUBMENU_ACTION, LAZY_SUBMENU_ACTION}:
+                _enter_menu(navigation_stack, resolve_submenu(option))
+            elif option.kind == EXIT_ACTION:
+                _leave_menu(navigation_stack)
+            else:
+                _run_option(menu=option_menu, option=option)
+    finally:
+        # Si se interrumpe la ejecución, se ejecutan
+        # las acciones de finalización de todos los
+        # menús a los que se ingresó, empezando por el
+        # último.
+        while navigation_stack:
+            _leave_menu(navigation_stack)
+
+
+def _normalize_option_name(name: str) -> str:
+    """
+    _normalize_option_name() es una función que normaliza
+    el nombre de una opción para compararlo con un
+    elemento de una ruta, sin distinguir mayúsculas de
+    minúsculas ni considerar el punto final.
+    """
+    return name.strip().rstrip(".").casefold()
+
+
+def _find_option_in_menu(
+    menu: CompiledMenu, segments: list[str]
+) -> tuple[CompiledOption, int]:
+    """
+    _find_option_in_menu() es una función que busca en un
+    menú la opción indicada por los primeros elementos de
+    una ruta, ya sea por su número o por su nombre.
+
+    Dado que los nombres de las opciones pueden contener
+    el separador de la ruta, se busca primero la opción
+    cuyo nombre abarque la mayor cantidad de elementos.
+    Devuelve la opción encontrada y la cantidad de
+    elementos de la ruta que abarca.
+    """
+    if segments[0].isdigit():
+        number = int(segments[0])
+        if 1 <= number <= len(menu.options):
+            return (menu.options[number - 1], 1)
+    else:
+        for length in range(len(segments), 0, -1):
+            name = _normalize_option_name(
+                _OPTION_PATH_SEPARATOR.join(segments[:length])
+            )
+            for option in menu.options:
+                if _normalize_option_name(option.name) == name:
+                    return (option, length)
+
+    available_options = "\n".join(
+        f"{number}. {option.name}"
+        for number, option in enumerate(menu.options, start=1)
+    )
+    raise ValueError(
+        f"No se encontró la opción '{segments[0]}' en el menú"
+        f" '{menu.title}'."
+        f"\nLas opciones disponibles son:\n{available_options}"
+    )
+
+
+def _find_option_by_path(
+    menu: CompiledMenu, path: str
+) -> tuple[list[CompiledMenu], CompiledOption]:
+    """
+    _find_option_by_path() es una función que recorre los
+    menús a partir del menú principal para encontrar la
+    opción indicada por una ruta, cuyos elementos son
+    números o nombres de opciones separados por "/".
+
+    Devuelve la lista de menús recorridos, empezando por
+    el menú principal, y la opción encontrada, la cual
+    debe ejecutar una acción.
+    """
+    segments = [
+        segment
+        for segment in path.split(_OPTION_PATH_SEPARATOR)
+        if segment.strip()
+    ]
+
+    if not segments:
+        raise ValueError("La ruta a la opción no puede estar vacía.")
+
+    menus = [menu]
+
+    while True:
+        option, length = _find_option_in_menu(
+            resolve_generated_options(menus[-1]), segments
+        )
+        segments = segments[length:]
+
+        if option.kind in {SUBMENU_ACTION, LAZY_SUBMENU_ACTION}:
+            menus.append(resolve_submenu(option))
+            if not segments:
+                raise ValueError(
+                    f"La opción '{option.name}' lleva a un submenú. Indique"
+                    " también la opción del submenú a ejecutar."
+                )
+            continue
+
+        if option.kind == EXIT_ACTION or segments:
+            raise ValueError(
+                f"La opción '{option.name}' no ejecuta ninguna acción."
+            )
+
+        return (menus, option)
+
+
+def _get_exit_status(errors: list[Exception]) -> int:
+    """
+    _get_exit_status() es una función que determina el
+    código de salida de una opción a partir de los errores
+    informados al ejecutar sus comandos: el código del
+    último comando que falló, 1 si este no se pudo
+    ejecutar, o 0 si no se informó ningún error.
+    """
+    if not errors:
+        return 0
+
+    if isinstance(errors[-1], subprocess.CalledProcessError):
+        return errors[-1].returncode or 1
+
+    return 1
+
+
+def _list_option_paths(menu: CompiledMenu) -> list[str]:
+    """
+    _list_option_paths() es una función que devuelve la
+    ruta numérica y por nombre de cada opción que ejecuta
+    una acción, alcanzable desde el menú principal. Los
+    submenús diferidos se cargan para poder recorrerlos.
+
+    Las opciones generadas por "options_provider" no se
+    incluyen, ya que dependen del estado del sistema al
+    momento de mostrar el menú, y su número precede al
+    de las demás opciones del menú.
+    """
+    paths = []
+    pending_menus = [(menu, "", "")]
+    visited_menus = {id(menu)}
+
+    while pending_menus:
+        current_menu, number_path, name_path = pending_menus.pop(0)
+
+        for number, option in enumerate(current_menu.options, start=1):
+            option_number_path = f"{number_path}{number}"
+            option_name_path = f"{name_path}{option.name}"
+
+            if option.kind in {SUBMENU_ACTION, LAZY_SUBMENU_ACTION}:
+                submenu = resolve_submenu(option)
+                if id(submenu) not in visited_menus:
+                    visited_menus.add(id(submenu))
+                    pending_menus.append(
+                        (
+                            submenu,
+                            option_number_path + _OPTION_PATH_SEPARATOR,
+                            option_name_path + _OPTION_PATH_SEPARATOR,
+                        )
+                    )
+            elif option.kind != EXIT_ACTION:
+                paths.append(f"{option_number_path:<10} {option_name_path}")
+
+    return paths
+
+
 # --- Funciones públicas ---
 def run_menu(menu_data: MenuDictionary) -> None:
     """
@@ -505,109 +1067,168 @@ def run_menu(menu_data: MenuDictionary) -> None:
     pasado como parámetro a la función y debe tener
     un formato específico, descripto en la documentación
     de la librería "menu_creation".
-    """
-    if not isinstance(menu_data, dict):
-        raise ValueError(
-            "La estructura de datos a procesar debe ser un diccionario."
-        )
 
-    # Control de estructura del diccionario
-    # de entrada.
-    _check_basic_dictionary_structure(menu_data)
-    _check_top_level_option_keys(menu_data)
+    El diccionario se compila con compile_menu() antes
+    de mostrar el menú, lo que valida por única vez su
+    estructura y la de todos sus submenús.
+    """
+    menu = compile_menu(menu_data)
 
-    # Limpieza de pantalla y ejecución de posibles
-    # acciones previo a la impresión del menú de
-    # opciones.
-    on_start_hooks = menu_data.get("on_start", None)
-    if on_start_hooks is not None:
-        _execute_external_hooks(on_start_hooks)
+    # El primer menú que se ejecuta es el menú principal,
+    # a partir del cual se construye el índice de la
+    # paleta de búsqueda.
+    is_root_menu = _menu_session["root"] is None
+    if is_root_menu:
+        _menu_session["root"] = menu
 
     try:
-        # Ciclo principal para imprimir el menú,
-        # recibir una elección y ejecutarla.
-        while True:
-            # Impresión por pantalla del menú.
-            clear_screen()
-            _draw_menu(menu_data)
+        _run_navigation_stack(menu)
+    finally:
+        if is_root_menu:
+            _menu_session["root"] = None
 
-            # Determinación de la opción elegida
-            # por el usuario.
-            options = _get_command_options(menu_data)
-            option_number = get_choice(1, len(options))
-            option = options[option_number - 1]
 
-            # Control de formato de la acción elegida
-            # por el usuario.
-            _check_action(menu_option=option, dict_name=menu_data["dict_name"])
+def run_menu_options(
+    menu_data: MenuDictionary,
+    paths: list[str],
+    answers: list[str] | None = None,
+) -> int:
+    """
+    run_menu_options() es una función utilizada para
+    ejecutar opciones de un menú sin mostrarlo, indicando
+    cada opción a través de su ruta desde el menú
+    principal. Por ejemplo, "1/3" o "Menú de opciones de
+    actualización./Actualizar el sistema.".
+
+    Las respuestas a las solicitudes de entrada, tanto del
+    parámetro "prompt" como de las funciones ejecutadas,
+    se toman de "answers", en orden.
+
+    Las opciones se ejecutan en orden y la ejecución se
+    detiene en la primera que falle. Las acciones de
+    "on_start" y "on_exit" de cada menú se ejecutan al
+    entrar y salir de él, como en una ejecución
+    interactiva, sin volver a ejecutarlas entre opciones
+    de un mismo menú.
+
+    Devuelve el código de salida de la última opción
+    ejecutada: el del último comando que falló, 1 si se
+    produjo un error, o 0 si finalizó correctamente.
+    """
+    if not isinstance(paths, list) or not all(
+        isinstance(path, str) for path in paths
+    ):
+        raise TypeError("El parámetro 'paths' debe ser una lista de cadenas.")
 
-            # En primera instancia, se controla si el
-            # usuario desea salir o dirigirse a otro
-            # menú de un script.
-            # En caso de que no se desee hacer ninguna
-            # de estas cosas, se prosigue con las
-            # opciones de ejecución definidas abajo.
-            action = option["action"]
-            if isinstance(action, dict):
-                run_menu(action)
-                continue
-            elif isinstance(action, str):
-                break
+    menu = compile_menu(menu_data)
+    active_menus = []
+    exit_status = 0
 
-            # Ejecución de la acción estética definida
-            # en la opción elegida por el usuario.
-            if option["aesthetic_action"] == "clear_screen":
-                clear_screen()
-            else:
-                draw_coloured_line(len(menu_data["title"]))
-
-            # Ejecución de la acción principal elegida
-            # por el usuario.
-            while True:
-                _handle_action(option)
-
-                # Luego de ejecutar la acción por primera
-                # vez, se imprime el separador y se le
-                # consulta al usuario si desea volver a
-                # repetir la acción.
-                draw_coloured_line(len(menu_data["title"]))
-                user_choice = None
-
-                try:
-                    toggle_cursor("hide")
-                    print("¿Desea volver a ejecutar la opción?")
-                    print("Presione 'S' o 's' para indicar que sí.")
-                    print("Presione 'N' o 'n' para indicar que no.")
-
-                    # Mientras el usuario no introduzca un carácter
-                    # valido, solo se "consume" lo que introduce.
-                    while user_choice not in ["S", "s", "N", "n"]:
-                        user_choice = get_char()
-                finally:
-                    toggle_cursor("show")
-
-                if user_choice in ["N", "n"]:
+    try:
+        with scripted_input(answers or []):
+            for path in paths:
+                menus, option = _find_option_by_path(menu, path)
+
+                # Se sale de los menús que no forman parte de
+                # la ruta de la opción y se entra a los nuevos.
+                shared_depth = 0
+                while (
+                    shared_depth < min(len(menus), len(active_menus))
+                    and menus[shared_depth] is active_menus[shared_depth]
+                ):
+                    shared_depth += 1
+
+                while len(active_menus) > shared_depth:
+                    _execute_external_hooks(active_menus.pop().on_exit)
+
+                for submenu in menus[shared_depth:]:
+                    _execute_external_hooks(submenu.on_start)
+                    active_menus.append(submenu)
+
+                with collect_command_errors() as errors:
+                    _handle_action(option)
+                exit_status = _get_exit_status(errors)
+
+                if exit_status != 0:
                     break
-                else:
-                    # Para las siguientes ejecuciones de una
-                    # acción se limpia la pantalla, con la
-                    # finalidad de que no se vayan apilando
-                    # todas las salidas mostradas por pantalla
-                    # por cada iteración.
-                    clear_screen()
-
-                    # Luego se imprime una cabecera para recordarle
-                    # al usuario cual es la opción que se está
-                    # repitiendo, por las dudas.
-                    draw_coloured_line(len(menu_data["title"]))
-                    print("Opción a repetir: ")
-                    print(f'{option["name"]}')
-                    draw_coloured_line(len(menu_data["title"]))
+    except Exception as error:
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text="No se pudo ejecutar la opción indicada."
+            f"\nEl error encontrado es: {error}",
+        )
+        exit_status = 1
     finally:
-        # Tras finalizar la ejecución del script,
-        # se ejecutan las acciones de finalización
-        # definidas en el diccionario de entrada, si
-        # las hubiera.
-        on_exit_hooks = menu_data.get("on_exit", None)
-        if on_exit_hooks is not None:
-            _execute_external_hooks(on_exit_hooks)
+        while active_menus:
+            _execute_external_hooks(active_menus.pop().on_exit)
+
+    return exit_status
+
+
+def run_menu_from_command_line(
+    menu_data: MenuDictionary, argv: list[str] | None = None
+) -> int:
+    """
+    run_menu_from_command_line() es una función utilizada
+    como punto de entrada de los scripts con menús. Si no
+    se recibe ningún argumento, muestra el menú de forma
+    interactiva con run_menu(). De lo contrario, admite:
+    * --run RUTA: ejecuta la opción indicada sin mostrar
+      el menú. Se puede repetir para ejecutar varias
+      opciones en orden.
+    * --input VALOR: respuesta a la siguiente solicitud de
+      entrada. Se puede repetir.
+    * --list: muestra la ruta de todas las opciones.
+
+    Devuelve el código de salida del script.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Sin argumentos se muestra el menú directamente, sin
+    # importar argparse, que demora en importarse y solo
+    # se necesita en el modo no interactivo.
+    if not argv:
+        run_menu(menu_data)
+        return 0
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Sin argumentos, muestra el menú de forma interactiva."
+    )
+    parser.add_argument(
+        "--run",
+        action="append",
+        default=[],
+        metavar="RUTA",
+        help="ejecuta la opción indicada por su ruta, con números o nombres"
+        " de opciones separados por '/'",
+    )
+    parser.add_argument(
+        "--input",
+        action="append",
+        default=[],
+        metavar="VALOR",
+        help="respuesta a la siguiente solicitud de entrada",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="muestra la ruta de todas las opciones que se pueden ejecutar",
+    )
+    arguments = parser.parse_args(argv)
+
+    if arguments.list:
+        for path in _list_option_paths(compile_menu(menu_data)):
+            print(path)
+        return 0
+
+    if arguments.run:
+        return run_menu_options(
+            menu_data=menu_data, paths=arguments.run, answers=arguments.input
+        )
+
+    run_menu(menu_data)
+    return 0
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene el planificador de las acciones definidas en
+el parámetro "on_draw" de los menús, que se encarga de ejecutarlas en segundo
+plano y de guardar su última salida, de manera que dibujar un menú nunca deba
+esperar a que estas finalicen.
+
+### Tiempo de validez de las salidas ###
+Cada elemento de "on_draw" puede ser un objeto de función, o una tupla con un
+objeto de función y la cantidad de segundos durante los cuales su salida se
+considera válida (TTL), por ejemplo: (check_internet_connection, 60).
+
+* Si la acción declara un TTL, solo se vuelve a ejecutar cuando su salida
+  tiene una antigüedad mayor a dicho tiempo, sin importar cuántas veces se
+  dibuje el menú.
+* Si la acción no declara un TTL, se vuelve a ejecutar cada vez que se muestra
+  el menú, y periódicamente mientras el usuario elige una opción.
+
+### Funcionamiento del planificador ###
+* Cada acción se ejecuta en un hilo secundario. Lo que esta imprima se captura
+  únicamente para dicho hilo, sin afectar lo que se imprime desde el hilo
+  principal. Al finalizar, se guarda su salida y se avisa a través de una pipe.
+
+* Mientras una acción se está ejecutando no se la vuelve a lanzar, y el menú
+  se dibuja con la última salida conocida de cada acción, o con un mensaje de
+  carga si la acción todavía no finalizó nunca.
+
+* Las salidas se guardan por acción y no por menú, por lo que al volver a un
+  menú se muestra de inmediato la última salida de sus acciones.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+from typing import Any, Callable
+
+from modules.console_ui import render_styled_text
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad de segundos tras la cual se vuelven a ejecutar
+# las acciones que no declaran un TTL, mientras el
+# usuario elige una opción.
+_DEFAULT_REFRESH_INTERVAL = 30
+
+# --- Estado del planificador ---
+# La pipe de aviso y el redireccionador de la salida se
+# crean una única vez y nunca se descartan, ya que las
+# acciones que sigan en ejecución al elegir una opción
+# pueden finalizar más adelante, y no deben escribir
+# en una pipe cerrada ni en la pantalla.
+_shared_state = {"wake_pipe": None, "router": None}
+
+# Última salida, momento de finalización e hilo en
+# ejecución de cada acción.
+_hook_states = {}
+_hook_states_lock = threading.Lock()
+
+
+# --- Redirección de la salida por hilo ---
+class _ThreadStdoutRouter:
+    """
+    _ThreadStdoutRouter es una clase que reemplaza a
+    sys.stdout a partir de la primera vez que se ejecutan
+    acciones en segundo plano. Lo que se imprime desde un
+    hilo registrado se guarda en el buffer de dicho hilo,
+    y lo que se imprime desde cualquier otro hilo se envía
+    a la salida real.
+
+    A diferencia de contextlib.redirect_stdout(), que
+    afecta a todo el programa, esto permite capturar la
+    salida de cada acción sin capturar la del menú.
+    """
+
+    def __init__(self, real_stdout: Any) -> None:
+        self._real_stdout = real_stdout
+        self._buffers = {}
+
+    def register(self, buffer: io.StringIO) -> None:
+        self._buffers[threading.get_ident()] = buffer
+
+    def unregister(self) -> None:
+        self._buffers.pop(threading.get_ident(), None)
+
+    def write(self, text: str) -> int:
+        target = self._buffers.get(threading.get_ident(), self._real_stdout)
+        return target.write(text)
+
+    def flush(self) -> None:
+        if threading.get_ident() not in self._buffers:
+            self._real_stdout.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._real_stdout, name)
+
+
+# --- Funciones privadas ---
+def _get_shared_state() -> tuple[int, _ThreadStdoutRouter]:
+    """
+    _get_shared_state() es una función que devuelve el
+    descriptor de escritura de la pipe de aviso y el
+    redireccionador de la salida, creándolos e instalando
+    este último en sys.stdout la primera vez que se la
+    llama.
+    """
+    if _shared_state["wake_pipe"] is None:
+        _shared_state["wake_pipe"] = os.pipe()
+        os.set_blocking(_shared_state["wake_pipe"][0], False)
+
+    if not isinstance(sys.stdout, _ThreadStdoutRouter):
+        _shared_state["router"] = _ThreadStdoutRouter(sys.stdout)
+        sys.stdout = _shared_state["router"]
+
+    return (_shared_state["wake_pipe"][1], _shared_state["router"])
+
+
+def _format_hook_error(error: Exception) -> str:
+    """
+    _format_hook_error() es una función que construye el
+    mensaje que se muestra en lugar de la salida de una
+    acción que produjo un error.
+    """
+    return render_styled_text(
+        colour_type="bg",
+        colour="red",
+        text=f"Error al ejecutar la acción: {error}.",
+    )
+
+
+def _store_hook_output(hook: Callable[[], None], output: str) -> None:
+    """
+    _store_hook_output() es una función que guarda la
+    salida de una acción junto con el momento en el que
+    esta finalizó.
+    """
+    with _hook_states_lock:
+        state = _hook_states.setdefault(hook, {"thread": None})
+        state["output"] = output
+        state["updated_at"] = time.monotonic()
+
+
+def _run_hook_in_background(
+    hook: Callable[[], None], router: _ThreadStdoutRouter, wake_fd: int
+) -> None:
+    """
+    _run_hook_in_background() es una función que se
+    ejecuta en un hilo secundario para ejecutar una
+    acción de "on_draw", capturar lo que esta imprime y
+    avisar que finalizó.
+    """
+    hook_output = io.StringIO()
+    router.register(hook_output)
+
+    try:
+        hook()
+        output = hook_output.getvalue()
+    except Exception as error:
+        output = _format_hook_error(error)
+    finally:
+        router.unregister()
+
+    _store_hook_output(hook, output)
+    os.write(wake_fd, b"\0")
+
+
+def _is_hook_expired(
+    state: dict[str, Any] | None, ttl: float | None, now: float
+) -> bool:
+    """
+    _is_hook_expired() es una función que determina si la
+    salida de una acción ya no es válida, según su TTL o,
+    si no lo declara, según el intervalo de actualización
+    por defecto.
+    """
+    if state is None or state.get("updated_at") is None:
+        return True
+
+    interval = _DEFAULT_REFRESH_INTERVAL if ttl is None else ttl
+    return now - state["updated_at"] >= interval
+
+
+# --- Funciones públicas ---
+def get_wake_fd() -> int:
+    """
+    get_wake_fd() es una función que devuelve el descriptor
+    de lectura de la pipe a través de la cual se avisa que
+    finalizó una acción en segundo plano.
+    """
+    _get_shared_state()
+    return _shared_state["wake_pipe"][0]
+
+
+def drain_wake_fd() -> None:
+    """
+    drain_wake_fd() es una función que descarta los avisos
+    pendientes en la pipe de aviso.
+    """
+    try:
+        os.read(get_wake_fd(), 1024)
+    except BlockingIOError:
+        pass
+
+
+def schedule_draw_hooks(
+    hooks: tuple[tuple[Callable[[], None], float | None], ...],
+    menu_shown: bool = False,
+) -> None:
+    """
+    schedule_draw_hooks() es una función que lanza en
+    segundo plano cada acción de "on_draw" recibida cuya
+    salida ya no sea válida, siempre que no se esté
+    ejecutando actualmente.
+
+    Si "menu_shown=True", también se lanzan las acciones
+    que no declaran un TTL, ya que estas se deben volver a
+    ejecutar cada vez que se muestra el menú.
+    """
+    wake_fd, router = _get_shared_state()
+    now = time.monotonic()
+
+    with _hook_states_lock:
+        for hook, ttl in hooks:
+            state = _hook_states.setdefault(hook, {"thread": None})
+
+            if state["thread"] is not None and state["thread"].is_alive():
+                continue
+
+            if not (
+                (menu_shown and ttl is None)
+                or _is_hook_expired(state, ttl, now)
+            ):
+                continue
+
+            state["thread"] = threading.Thread(
+                target=_run_hook_in_background,
+                args=[hook, router, wake_fd],
+                daemon=True,
+            )
+            state["thread"].start()
+
+
+def get_draw_hook_outputs(
+    hooks: tuple[tuple[Callable[[], None], float | None], ...],
+) -> list[str | None]:
+    """
+    get_draw_hook_outputs() es una función que devuelve la
+    última salida conocida de cada acción de "on_draw"
+    recibida, o None si la acción todavía no finalizó
+    nunca. Esta función nunca espera a que una acción
+    finalice.
+    """
+    with _hook_states_lock:
+        return [
+            _hook_states.get(hook, {}).get("output", None) for hook, _ in hooks
+        ]
+
+
+def get_next_refresh_delay(
+    hooks: tuple[tuple[Callable[[], None], float | None], ...],
+) -> float | None:
+    """
+    get_next_refresh_delay() es una función que devuelve
+    la cantidad de segundos que faltan para que expire la
+    salida de alguna de las acciones de "on_draw"
+    recibidas, o None si no hay ninguna acción que se deba
+    volver a lanzar.
+
+    Las acciones que se están ejecutando no se tienen en
+    cuenta, ya que al finalizar avisan a través de la
+    pipe de aviso.
+    """
+    now = time.monotonic()
+    delays = []
+
+    with _hook_states_lock:
+        for hook, ttl in hooks:
+            state = _hook_states.get(hook)
+
+            if state is None or state.get("updated_at") is None:
+                if state is None or state["thread"] is None:
+                    delays.append(0)
+                continue
+
+            if state["thread"] is not None and state["thread"].is_alive():
+                continue
+
+            interval = _DEFAULT_REFRESH_INTERVAL if ttl is None else ttl
+            delays.append(state["updated_at"] + interval - now)
+
+    if not delays:
+        return None
+
+    return max(min(delays), 0)
+
+
+def run_draw_hooks_now(
+    hooks: tuple[tuple[Callable[[], None], float | None], ...],
+) -> list[str]:
+    """
+    run_draw_hooks_now() es una función que devuelve la
+    salida de cada acción de "on_draw" recibida, ejecutando
+    en el hilo actual las que no declaran un TTL o cuya
+    salida ya no es válida. Se utiliza cuando no se pueden
+    ejecutar las acciones en segundo plano.
+    """
+    outputs = []
+    now = time.monotonic()
+
+    for hook, ttl in hooks:
+        with _hook_states_lock:
+            state = _hook_states.get(hook)
+            is_valid = ttl is not None and not _is_hook_expired(
+                state, ttl, now
+            )
+
+        if is_valid:
+            outputs.append(state["output"])
+            continue
+
+        hook_output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(hook_output):
+                hook()
+            output = hook_output.getvalue()
+        except Exception as error:
+            output = _format_hook_error(error)
+
+        _store_hook_output(hook, output)
+        outputs.append(output)
+
+    return outputs
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene la paleta de búsqueda de opciones, que permite
+encontrar y ejecutar cualquier opción alcanzable desde un menú principal sin
+tener que recorrer los submenús uno por uno.
+
+### Índice de búsqueda ###
+* El índice se construye recorriendo todos los menús alcanzables desde el menú
+  principal, e incluye una entrada por cada opción que ejecuta una acción o
+  que lleva a un submenú. Las opciones de salida no se incluyen.
+
+* Cada entrada se puede encontrar por el nombre de la opción, el título del
+  menú que la contiene, el encabezado de sección bajo el que se encuentra y
+  los argumentos de los comandos que ejecuta (o los nombres de las funciones
+  que llama).
+
+* El índice se construye la primera vez que se abre la paleta para un menú
+  principal y luego se guarda en memoria. Si desde entonces se cargó algún
+  submenú diferido, el índice se vuelve a construir para incluirlo.
+
+* Los submenús diferidos que todavía no se cargaron no se recorren, por lo
+  que de ellos solo se incluye la opción que lleva a ellos.
+
+* Las opciones generadas por el parámetro "options_provider" de un menú no se
+  incluyen, ya que dependen del estado del sistema al momento de mostrarlo.
+
+### Filtrado de las entradas ###
+* La búsqueda se divide en términos separados por espacios, y una entrada
+  coincide si contiene todos los términos, sin distinguir mayúsculas de
+  minúsculas.
+
+* El filtrado es incremental: al añadir caracteres a la búsqueda solo se
+  filtran las entradas que coincidían con la búsqueda anterior, y al borrarlos
+  se recuperan los resultados ya calculados.
+
+* Entre las entradas que coinciden, primero se muestran aquellas cuyo nombre
+  empieza con la búsqueda, luego aquellas en las que alguna palabra empieza
+  con la búsqueda y por último el resto, respetando el orden de los menús.
+  Solo se clasifican las entradas necesarias para llenar la pantalla.
+
+### Uso de la paleta ###
+Al presionar "/" mientras se elige una opción de un menú, se abre la paleta.
+Dentro de ella, se puede escribir la búsqueda, moverse entre los resultados
+con las flechas, elegir uno con ENTER o cancelar con ESC.
+"""
+
+import collections
+import shutil
+import sys
+
+from typing import Any
+
+from modules.console_ui import (
+    clear_screen,
+    keyboard_session,
+    render_coloured_line,
+    render_styled_text,
+)
+
+from modules.menu.plan import (
+    EXIT_ACTION,
+    LAZY_SUBMENU_ACTION,
+    SUBMENU_ACTION,
+    CompiledMenu,
+    CompiledOption,
+    get_loaded_submenu,
+    get_loaded_submenu_count,
+)
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad máxima de resultados que se muestran a la vez.
+_MAX_VISIBLE_RESULTS = 10
+
+# Título de la paleta de búsqueda.
+_PALETTE_TITLE = "Búsqueda de opciones (ENTER para elegir, ESC para cancelar)"
+
+# --- Estado de la caché de índices ---
+# Cada índice se guarda junto al menú principal a partir
+# del cual se construyó, de manera que el identificador
+# del diccionario no se pueda reutilizar mientras el
+# índice exista.
+_index_cache = {}
+
+
+# --- Funciones privadas ---
+def _get_action_tokens(action: Any) -> list[str]:
+    """
+    _get_action_tokens() es una función que obtiene los
+    términos de búsqueda de una acción: los argumentos de
+    los comandos que ejecuta, sin sus etiquetas, o los
+    nombres de las funciones que llama y los parámetros
+    que reciben que sean cadenas.
+    """
+    tokens = []
+
+    for item in action:
+        if isinstance(item, list):
+            tokens.extend(
+                token
+                for token in item
+                if isinstance(token, str) and not token.startswith("#")
+            )
+        elif isinstance(item, tuple):
+            tokens.append(getattr(item[0], "__name__", ""))
+            for parameter in item[1]:
+                if isinstance(parameter, str):
+                    tokens.append(parameter)
+                elif isinstance(parameter, list):
+                    tokens.extend(
+                        token for token in parameter if isinstance(token, str)
+                    )
+        elif callable(item):
+            tokens.append(getattr(item, "__name__", ""))
+
+    return tokens
+
+
+def _build_index(root_menu: CompiledMenu) -> list[dict[str, Any]]:
+    """
+    _build_index() es una función que construye el índice
+    de búsqueda recorriendo todos los menús alcanzables
+    desde el menú principal recibido. Los menús que se
+    alcanzan por más de un camino solo se recorren una
+    vez.
+    """
+    index = []
+    visited_menus = {id(root_menu)}
+    pending_menus = collections.deque([root_menu])
+
+    while pending_menus:
+        menu = pending_menus.popleft()
+
+        for option in menu.options:
+            if option.kind == EXIT_ACTION:
+                continue
+
+            if option.kind in {SUBMENU_ACTION, LAZY_SUBMENU_ACTION}:
+                label = f"{option.name} »"
+                tokens = []
+
+                # Los submenús diferidos que todavía no se
+                # cargaron solo se indexan por su nombre.
+                submenu = get_loaded_submenu(option)
+                if submenu is not None:
+                    tokens.append(submenu.title)
+                    if id(submenu) not in visited_menus:
+                        visited_menus.add(id(submenu))
+                        pending_menus.append(submenu)
+            else:
+                label = option.name
+                tokens = _get_action_tokens(option.action)
+
+            name = option.name.lower()
+            index.append(
+                {
+                    "label": label,
+                    "location": menu.title,
+                    "name": name,
+                    # El espacio inicial permite buscar prefijos
+                    # de palabras buscando " término".
+                    "haystack": " "
+                    + " ".join(
+                        [name, option.section, menu.title, *tokens]
+                    ).lower(),
+                    "menu": menu,
+                    "option": option,
+                }
+            )
+
+    return index
+
+
+def _get_index(root_menu: CompiledMenu) -> list[dict[str, Any]]:
+    """
+    _get_index() es una función que devuelve el índice de
+    búsqueda de un menú principal, construyéndolo solo la
+    primera vez que se lo necesita.
+    """
+    cached = _index_cache.get(id(root_menu))
+    loaded_submenus = get_loaded_submenu_count()
+
+    # El índice se vuelve a construir si se cargó algún
+    # submenú diferido desde la última vez.
+    if (
+        cached is None
+        or cached[0] is not root_menu
+        or cached[1] != loaded_submenus
+    ):
+        cached = (root_menu, loaded_submenus, _build_index(root_menu))
+        _index_cache[id(root_menu)] = cached
+
+    return cached[2]
+
+
+def _filter_entries(
+    entries: list[dict[str, Any]], query: str
+) -> list[dict[str, Any]]:
+    """
+    _filter_entries() es una función que devuelve las
+    entradas que contienen todos los términos de la
+    búsqueda, conservando su orden.
+    """
+    matches = entries
+
+    # Se filtra una vez por término, de manera que cada
+    # filtrado recorra solo las entradas que quedaron.
+    for term in query.lower().split():
+        matches = [entry for entry in matches if term in entry["haystack"]]
+
+    return matches
+
+
+def _rank_entries(
+    entries: list[dict[str, Any]], query: str, limit: int
+) -> list[dict[str, Any]]:
+    """
+    _rank_entries() es una función que devuelve las
+    mejores entradas de entre las recibidas, según qué
+    tan bien coinciden con la búsqueda: primero las que
+    empiezan con la búsqueda, luego las que tienen alguna
+    palabra que empieza con ella y por último el resto.
+
+    Las entradas se recorren una única vez, y el recorrido
+    termina en cuanto se encuentran suficientes entradas
+    de la mejor categoría.
+    """
+    query = query.lower().strip()
+    word_prefix = f" {query}"
+    ranked = ([], [], [])
+
+    for entry in entries:
+        if entry["name"].startswith(query):
+            ranked[0].append(entry)
+            if len(ranked[0]) == limit:
+                break
+        elif word_prefix in entry["haystack"]:
+            if len(ranked[1]) < limit:
+                ranked[1].append(entry)
+        elif len(ranked[2]) < limit:
+            ranked[2].append(entry)
+
+    return (ranked[0] + ranked[1] + ranked[2])[:limit]
+
+
+def _render_palette(
+    query: str,
+    visible_entries: list[dict[str, Any]],
+    total: int,
+    selected: int,
+) -> str:
+    """
+    _render_palette() es una función que construye la
+    pantalla de la paleta de búsqueda como una única
+    cadena, para imprimirla de una sola vez.
+    """
+    separator = render_coloured_line(length=len(_PALETTE_TITLE), symbol="=")
+    lines = [separator, _PALETTE_TITLE, separator, ""]
+
+    for position, entry in enumerate(visible_entries):
+        line = f"{entry['label']} ({entry['location']})"
+        if position == selected:
+            line = render_styled_text(
+                colour_type="bg", colour="blue", text=line
+            )
+        lines.append(f"  {line}")
+
+    if total == 0:
+        lines.append(
+            render_styled_text(
+                colour_type="bg", colour="yellow", text="Sin resultados."
+            )
+        )
+    elif total > len(visible_entries):
+        lines.append(f"  ... y {total - len(visible_entries)} resultados más.")
+
+    lines.append("")
+    lines.append(f"/{query}")
+
+    return clear_screen(print_line=False) + "\n".join(lines)
+
+
+# --- Funciones públicas ---
+def choose_from_palette(
+    root_menu: CompiledMenu,
+) -> tuple[CompiledMenu, CompiledOption] | None:
+    """
+    choose_from_palette() es una función que abre la
+    paleta de búsqueda de opciones para todos los menús
+    alcanzables desde el menú principal compilado
+    recibido.
+
+    Devuelve una tupla con el menú que contiene la opción
+    elegida y la propia opción, o None si el usuario
+    cancela la búsqueda.
+    """
+    index = _get_index(root_menu)
+    max_visible = max(
+        min(_MAX_VISIBLE_RESULTS, shutil.get_terminal_size().lines - 8), 1
+    )
+
+    # Cada elemento de la pila contiene una búsqueda y
+    # sus resultados, de manera que al borrar caracteres
+    # no se deban volver a calcular.
+    result_stack = [("", index)]
+    selected = 0
+
+    with keyboard_session() as read_key:
+        while True:
+            query, matches = result_stack[-1]
+            visible_entries = _rank_entries(matches, query, max_visible)
+            selected = min(selected, max(len(visible_entries) - 1, 0))
+
+            sys.stdout.write(
+                _render_palette(query, visible_entries, len(matches), selected)
+            )
+            sys.stdout.flush()
+
+            key = read_key()
+
+            # Al salir de la paleta, se deja el cursor en
+            # una nueva línea.
+            if key == "ESC":
+                print("")
+                return None
+            elif key == "ENTER":
+                if visible_entries:
+                    print("")
+                    entry = visible_entries[selected]
+                    return (entry["menu"], entry["option"])
+            elif key == "UP":
+                selected = max(selected - 1, 0)
+            elif key == "DOWN":
+                selected = min(selected + 1, len(visible_entries) - 1)
+            elif key == "BACKSPACE":
+                if len(result_stack) > 1:
+                    result_stack.pop()
+                    selected = 0
+            elif key is not None and len(key) == 1 and key.isprintable():
+                # Al añadir un carácter, solo se filtran los
+                # resultados de la búsqueda anterior.
+                new_query = query + key
+                result_stack.append(
+                    (new_query, _filter_entries(matches, new_query))
+                )
+                selected = 0
@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene la compilación de los diccionarios de menú en
+un plan de ejecución inmutable, de manera que la estructura de un menú y de
+todos sus submenús se valide una única vez, antes de mostrarlo.
+
+### Contenido del plan de ejecución ###
+* Cada menú se compila en un objeto CompiledMenu, que contiene su título, sus
+  acciones de "on_start", "on_draw" y "on_exit" y una tabla con sus opciones,
+  ordenadas según el número con el que el usuario las elige. Las acciones de
+  "on_draw" se guardan como tuplas con la función y su TTL (o None, si no lo
+  declara).
+
+* Cada opción se compila en un objeto CompiledOption, que contiene el tipo de
+  su acción ya resuelto, una plantilla por cada uno de sus comandos y, si la
+  acción lleva a un submenú, el submenú ya compilado. Si los comandos se
+  ejecutan de manera concurrente, también contiene los comandos que debe
+  esperar cada comando, según el parámetro "after".
+
+* Cada comando se compila en un objeto CommandTemplate, que contiene los
+  argumentos del comando sin sus etiquetas, qué etiquetas tenía y las
+  variables de entorno a aplicarle. De esta manera, para obtener el comando a
+  ejecutar solo se le debe anexar la entrada del usuario, si corresponde, sin
+  copiar ni modificar la acción definida en el diccionario.
+
+* Los objetos del plan utilizan __slots__ y no se pueden modificar una vez
+  compilados.
+
+### Validación de los menús ###
+La compilación utiliza las funciones del módulo "validation" para controlar
+cada menú alcanzable desde el menú compilado, así como la acción de cada una
+de sus opciones. Por lo tanto, cualquier error en la definición de un menú se
+informa al iniciar el script, y no al elegir la opción mal definida.
+
+Los planes compilados se guardan en memoria, de manera que compilar dos veces
+el mismo menú no repita la validación. Asimismo, la huella de cada menú que
+supera la validación se guarda en disco, por lo que los menús que no cambiaron
+desde una ejecución anterior se compilan sin volver a validarlos. Véase la
+documentación del módulo "validation_cache" para más información.
+
+### Submenús diferidos ###
+En lugar de un diccionario, el parámetro "action" de una opción puede contener
+una referencia diferida a un submenú, la cual puede ser:
+* Una cadena con el formato "paquete.modulo:ATRIBUTO", que indica el módulo a
+  importar y la variable de dicho módulo que contiene el diccionario del menú.
+* Un objeto de función sin parámetros que devuelva el diccionario del menú.
+
+Los submenús diferidos no se cargan ni se compilan al compilar el menú que los
+contiene, sino la primera vez que se ingresa a ellos a través de la función
+resolve_submenu(). De esta manera, los módulos que definen submenús solo se
+importan cuando se los necesita, lo que reduce el tiempo de inicio de los
+scripts. Por el mismo motivo, los errores en la definición de un submenú
+diferido recién se informan al ingresar a él.
+
+### Opciones generadas dinámicamente ###
+El parámetro "options_provider" de un menú permite generar opciones a partir
+de información que solo se conoce al mostrarlo, como una opción por cada
+snapshot existente. Puede contener:
+* Un objeto de función sin parámetros que devuelva una lista de opciones, con
+  el mismo formato que el parámetro "options". Las opciones se vuelven a
+  generar cada vez que se muestra el menú.
+* Una tupla con dicho objeto de función y otro, también sin parámetros, que
+  devuelva una "marca de invalidación" económica de obtener, como la fecha de
+  modificación de una carpeta. Las opciones solo se vuelven a generar cuando
+  la marca cambia.
+
+La función resolve_generated_options() devuelve el menú con las opciones
+generadas, que se muestran antes de las definidas en "options". Solo se
+validan y compilan las opciones generadas, ya que las demás opciones del menú
+ya fueron compiladas, y el resultado se guarda en memoria junto a su marca.
+"""
+
+import importlib
+
+from typing import Any, Callable
+
+from modules.menu.types import MenuDictionary, OptionDictionary
+from modules.menu.validation import (
+    _VALID_COMMAND_TAGS,
+    _check_action,
+    _check_basic_dictionary_structure,
+    _check_top_level_option_keys,
+)
+from modules.menu.validation_cache import (
+    get_menu_fingerprints,
+    get_validated_menus,
+    store_validated_menus,
+)
+
+# --- Tipos de acción de las opciones ---
+SUBMENU_ACTION = "submenu"
+LAZY_SUBMENU_ACTION = "lazy_submenu"
+EXIT_ACTION = "exit"
+SEQUENTIAL_COMMANDS_ACTION = "sequential_commands"
+PIPED_COMMANDS_ACTION = "piped_commands"
+PARALLEL_COMMANDS_ACTION = "parallel_commands"
+FUNCTION_LIST_ACTION = "function_list"
+FUNCTION_CALLS_ACTION = "function_calls"
+
+# --- Estado de la caché de planes ---
+# Cada plan se guarda junto al diccionario a partir del
+# cual se compiló, de manera que el identificador del
+# diccionario no se pueda reutilizar mientras el plan
+# exista.
+_plan_cache = {}
+
+# Submenús diferidos ya cargados y compilados, guardados
+# junto a la opción que los referencia.
+_resolved_submenus = {}
+
+# Menús con sus opciones generadas, guardados junto al
+# menú compilado a partir del cual se generaron y a la
+# marca de invalidación con la que se generaron.
+_generated_menus = {}
+
+
+# --- Objetos del plan de ejecución ---
+class _ImmutablePlanNode:
+    """
+    _ImmutablePlanNode es la clase base de los objetos
+    del plan de ejecución, que impide modificar sus
+    atributos una vez creados.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **fields: Any) -> None:
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"No se puede modificar el atributo '{name}' de un plan compilado."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"No se puede eliminar el atributo '{name}' de un plan compilado."
+        )
+
+
+class CommandTemplate(_ImmutablePlanNode):
+    """
+    CommandTemplate es la clase que representa un comando
+    compilado de una lista de comandos. El atributo
+    "input_mode" indica cómo se le anexa la entrada del
+    usuario: None si no se le anexa, "append" si se le
+    anexa como un único argumento y "split" si se la
+    divide en partes.
+    """
+
+    __slots__ = ("arguments", "requires_root", "input_mode", "env_overlay")
+
+    def build_arguments(self, user_input: str | None) -> list[str]:
+        """
+        build_arguments() es un método que devuelve los
+        argumentos del comando a ejecutar, anexándole la
+        entrada provista por el usuario si corresponde.
+        """
+        if self.input_mode == "append":
+            return list(self.arguments + (user_input,))
+
+        if self.input_mode == "split":
+            return list(self.arguments + tuple(user_input.split()))
+
+        return list(self.arguments)
+
+
+class CompiledOption(_ImmutablePlanNode):
+    """
+    CompiledOption es la clase que representa una opción
+    compilada de un menú.
+    """
+
+    __slots__ = (
+        "source",
+        "name",
+        "section",
+        "kind",
+        "action",
+        "submenu",
+        "aesthetic_action",
+        "prompt",
+        "commands",
+        "dependencies",
+    )
+
+
+class CompiledMenu(_ImmutablePlanNode):
+    """
+    CompiledMenu es la clase que representa un menú
+    compilado. Su atributo "options" contiene únicamente
+    las opciones que se pueden elegir, de manera que la
+    opción N.° n sea options[n - 1].
+
+    El atributo "options_provider" contiene la función que
+    genera opciones y la que devuelve su marca de
+    invalidación (o None, si no la declara).
+    """
+
+    __slots__ = (
+        "source",
+        "dict_name",
+        "title",
+        "on_start",
+        "on_draw",
+        "on_exit",
+        "options_provider",
+        "options",
+    )
+
+
+# --- Funciones privadas ---
+def _resolve_action_kind(action: Any) -> str:
+    """
+    _resolve_action_kind() es una función que determina
+    el tipo de una acción que ya fue validada, siguiendo
+    el mismo orden de controles que _check_action().
+    """
+    if isinstance(action, dict):
+        return SUBMENU_ACTION
+
+    if isinstance(action, str):
+        return EXIT_ACTION if action == "exit" else LAZY_SUBMENU_ACTION
+
+    if callable(action):
+        return LAZY_SUBMENU_ACTION
+
+    if all(isinstance(item, (str, list)) for item in action):
+        if "#PIPE" in action:
+            return PIPED_COMMANDS_ACTION
+        if "#PARALLEL" in action:
+            return PARALLEL_COMMANDS_ACTION
+        return SEQUENTIAL_COMMANDS_ACTION
+
+    if all(callable(item) for item in action):
+        return FUNCTION_LIST_ACTION
+
+    return FUNCTION_CALLS_ACTION
+
+
+def _load_submenu_reference(
+    reference: str | Callable[[], MenuDictionary], option_name: str
+) -> Any:
+    """
+    _load_submenu_reference() es una función que obtiene
+    el diccionario de un submenú diferido, importando el
+    módulo indicado en la referencia o llamando a la
+    función que lo devuelve.
+    """
+    if callable(reference):
+        return reference()
+
+    module_name, attribute = reference.split(":")
+
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(
+            f"No se pudo cargar el submenú '{reference}' de la opción"
+            f" '{option_name}'."
+            f"\nEl error encontrado es: {error}."
+        ) from error
+
+
+def _compile_command(
+    command: list[str], env_overlay: dict[str, str] | None
+) -> CommandTemplate:
+    """
+    _compile_command() es una función que compila un
+    comando de una lista de comandos en una plantilla,
+    separando sus etiquetas de sus argumentos.
+    """
+    tags = _VALID_COMMAND_TAGS.intersection(command)
+
+    if "#UINPUT" not in tags:
+        input_mode = None
+    elif "#SPLIT-INPUT" in tags:
+        input_mode = "split"
+    else:
+        input_mode = "append"
+
+    return CommandTemplate(
+        arguments=tuple(
+            argument
+            for argument in command
+            if argument not in _VALID_COMMAND_TAGS
+        ),
+        requires_root="#ROOT" in tags,
+        input_mode=input_mode,
+        env_overlay=env_overlay,
+    )
+
+
+def _compile_command_list(
+    option: OptionDictionary,
+) -> tuple[CommandTemplate, ...]:
+    """
+    _compile_command_list() es una función que compila
+    cada comando de una lista de comandos, en el mismo
+    orden que los comandos. Las cadenas por fuera de los
+    comandos, como "#PIPE", se omiten.
+
+    Las variables de entorno de "env_vars" se asignan al
+    comando cuya posición en la lista indican.
+    """
+    env_overlays = {
+        index: dict(variables)
+        for index, variables in option.get("env_vars", [])
+    }
+
+    return tuple(
+        _compile_command(command, env_overlays.get(index, None))
+        for index, command in enumerate(option["action"])
+        if isinstance(command, list)
+    )
+
+
+def _compile_dependencies(
+    option: OptionDictionary,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    _compile_dependencies() es una función que compila el
+    parámetro "after" de una opción en una tupla con los
+    comandos que debe esperar cada comando. Las posiciones
+    de "after" se refieren a la lista "action", mientras
+    que las compiladas se refieren a la tupla de
+    plantillas de los comandos, que no incluye etiquetas.
+    """
+    command_positions = {
+        index: position
+        for position, index in enumerate(
+            index
+            for index, item in enumerate(option["action"])
+            if isinstance(item, list)
+        )
+    }
+    dependencies = [set() for _ in command_positions]
+
+    for index, required_indexes in option.get("after", []):
+        dependencies[command_positions[index]].update(
+            command_positions[required] for required in required_indexes
+        )
+
+    return tuple(tuple(sorted(required)) for required in dependencies)
+
+
+def _compile_option(
+    option: OptionDictionary,
+    section: str,
+    dict_name: str,
+    compiled_menus: dict[int, CompiledMenu],
+    validated_menus: set[int],
+    validate: bool,
+) -> CompiledOption:
+    """
+    _compile_option() es una función que valida la acción
+    de una opción, si "validate=True", y la compila,
+    compilando también el submenú al que lleva, si
+    corresponde.
+    """
+    if validate:
+        _check_action(menu_option=option, dict_name=dict_name)
+
+    action = option["action"]
+    kind = _resolve_action_kind(action)
+    commands = ()
+    dependencies = ()
+
+    if kind in {
+        SEQUENTIAL_COMMANDS_ACTION,
+        PIPED_COMMANDS_ACTION,
+        PARALLEL_COMMANDS_ACTION,
+    }:
+        commands = _compile_command_list(option)
+
+    if kind == PARALLEL_COMMANDS_ACTION:
+        dependencies = _compile_dependencies(option)
+
+    return CompiledOption(
+        source=option,
+        name=option["name"],
+        section=section,
+        kind=kind,
+        action=action,
+        submenu=(
+            _compile_menu_tree(action, compiled_menus, validated_menus)
+            if kind == SUBMENU_ACTION
+            else None
+        ),
+        aesthetic_action=option.get("aesthetic_action", None),
+        prompt=option.get("prompt", None),
+        commands=commands,
+        dependencies=dependencies,
+    )
+
+
+def _compile_option_list(
+    options: list[OptionDictionary],
+    dict_name: str,
+    compiled_menus: dict[int, CompiledMenu],
+    validated_menus: set[int] = frozenset(),
+    validate: bool = True,
+) -> tuple[CompiledOption, ...]:
+    """
+    _compile_option_list() es una función que compila
+    las opciones que se pueden elegir de una lista de
+    opciones, registrando el encabezado de sección bajo
+    el que se encuentra cada una.
+
+    Los menús cuyo identificador se encuentra en
+    "validated_menus" ya superaron la validación en una
+    ejecución anterior, por lo que no se los vuelve a
+    validar.
+    """
+    compiled_options = []
+    section = ""
+
+    for option in options:
+        if "action" not in option:
+            section = option["name"]
+            continue
+
+        compiled_options.append(
+            _compile_option(
+                option=option,
+                section=section,
+                dict_name=dict_name,
+                compiled_menus=compiled_menus,
+                validated_menus=validated_menus,
+                validate=validate,
+            )
+        )
+
+    return tuple(compiled_options)
+
+
+def _compile_menu_tree(
+    menu_data: MenuDictionary,
+    compiled_menus: dict[int, CompiledMenu],
+    validated_menus: set[int] = frozenset(),
+) -> CompiledMenu:
+    """
+    _compile_menu_tree() es una función que valida y
+    compila un menú y todos los submenús alcanzables
+    desde él. Los menús que se alcanzan por más de un
+    camino (o que se referencian a sí mismos) solo se
+    compilan una vez, y los que se encuentran en
+    "validated_menus" no se validan.
+    """
+    if id(menu_data) in compiled_menus:
+        return compiled_menus[id(menu_data)]
+
+    validate = id(menu_data) not in validated_menus
+
+    # Control de estructura del diccionario.
+    if validate:
+        _check_basic_dictionary_structure(menu_data)
+        _check_top_level_option_keys(menu_data)
+
+    options_provider = menu_data.get("options_provider", None)
+
+    if callable(options_provider):
+        options_provider = (options_provider, None)
+
+    compiled_menu = CompiledMenu(
+        source=menu_data,
+        dict_name=menu_data["dict_name"],
+        title=menu_data["title"],
+        on_start=tuple(menu_data.get("on_start", ())),
+        on_draw=tuple(
+            hook if isinstance(hook, tuple) else (hook, None)
+            for hook in menu_data.get("on_draw", ())
+        ),
+        on_exit=tuple(menu_data.get("on_exit", ())),
+        options_provider=options_provider,
+    )
+
+    # El menú se registra antes de compilar sus opciones
+    # para que los submenús que lo referencian obtengan
+    # el mismo objeto.
+    compiled_menus[id(menu_data)] = compiled_menu
+
+    object.__setattr__(
+        compiled_menu,
+        "options",
+        _compile_option_list(
+            options=menu_data["options"],
+            dict_name=compiled_menu.dict_name,
+            compiled_menus=compiled_menus,
+            validated_menus=validated_menus,
+            validate=validate,
+        ),
+    )
+
+    return compiled_menu
+
+
+def _generate_menu_options(menu: CompiledMenu) -> CompiledMenu:
+    """
+    _generate_menu_options() es una función que genera
+    las opciones de un menú con "options_provider" y
+    devuelve una copia del menú compilado que incluye
+    las opciones generadas antes de las demás.
+    """
+    generated_options = menu.options_provider[0]()
+
+    if not isinstance(generated_options, list):
+        raise TypeError(
+            "La función definida en el parámetro 'options_provider' del"
+            f" diccionario {menu.dict_name} debe devolver una lista de"
+            " opciones."
+        )
+
+    menu_data = menu.source | {
+        "options": generated_options + menu.source["options"]
+    }
+
+    # Las opciones generadas se validan como las demás
+    # opciones del menú, pero solo se compilan ellas.
+    _check_basic_dictionary_structure(menu_data)
+    _check_top_level_option_keys(menu_data)
+
+    # Los submenús de las opciones generadas que sean el
+    # propio menú, o alguno de sus submenús, se reutilizan.
+    compiled_menus = {id(menu.source): menu} | {
+        id(option.action): option.submenu
+        for option in menu.options
+        if option.kind == SUBMENU_ACTION
+    }
+
+    return CompiledMenu(
+        source=menu_data,
+        dict_name=menu.dict_name,
+        title=menu.title,
+        on_start=menu.on_start,
+        on_draw=menu.on_draw,
+        on_exit=menu.on_exit,
+        options_provider=None,
+        options=_compile_option_list(
+            options=generated_options,
+            dict_name=menu.dict_name,
+            compiled_menus=compiled_menus,
+        )
+        + menu.options,
+    )
+
+
+# --- Funciones públicas ---
+def compile_menu(menu_data: MenuDictionary) -> CompiledMenu:
+    """
+    compile_menu() es una función que valida un diccionario
+    de menú, junto con todos sus submenús, y devuelve su
+    plan de ejecución compilado.
+
+    El plan se compila solo la primera vez que se recibe
+    un diccionario, y luego se reutiliza. Los submenús
+    cuya huella ya superó la validación en una ejecución
+    anterior se compilan sin volver a validarlos.
+    """
+    if not isinstance(menu_data, dict):
+        raise ValueError(
+            "La estructura de datos a procesar debe ser un diccionario."
+        )
+
+    cached = _plan_cache.get(id(menu_data))
+
+    if cached is None or cached[0] is not menu_data:
+        fingerprints = get_menu_fingerprints(menu_data)
+        compiled_menus = {}
+        compiled_menu = _compile_menu_tree(
+            menu_data, compiled_menus, get_validated_menus(fingerprints)
+        )
+
+        # Solo se llega a este punto si todos los menús
+        # compilados superaron la validación.
+        store_validated_menus(fingerprints, list(compiled_menus))
+
+        cached = (menu_data, compiled_menu)
+        _plan_cache[id(menu_data)] = cached
+
+    return cached[1]
+
+
+def resolve_submenu(option: CompiledOption) -> CompiledMenu:
+    """
+    resolve_submenu() es una función que devuelve el
+    submenú compilado al que lleva una opción. Si se trata
+    de un submenú diferido, se lo carga y compila la
+    primera vez que se lo solicita.
+    """
+    if option.kind == SUBMENU_ACTION:
+        return option.submenu
+
+    if option.kind != LAZY_SUBMENU_ACTION:
+        raise ValueError(f"La opción '{option.name}' no lleva a un submenú.")
+
+    cached = _resolved_submenus.get(id(option))
+
+    if cached is None or cached[0] is not option:
+        menu_data = _load_submenu_reference(option.action, option.name)
+        cached = (option, compile_menu(menu_data))
+        _resolved_submenus[id(option)] = cached
+
+    return cached[1]
+
+
+def resolve_generated_options(menu: CompiledMenu) -> CompiledMenu:
+    """
+    resolve_generated_options() es una función que
+    devuelve el menú compilado a mostrar, incluyendo las
+    opciones generadas por su "options_provider", si lo
+    define.
+
+    Si el menú declara una función para obtener la marca
+    de invalidación, las opciones generadas se reutilizan
+    mientras la marca no cambie. De lo contrario, se las
+    vuelve a generar cada vez.
+    """
+    if menu.options_provider is None:
+        return menu
+
+    get_stamp = menu.options_provider[1]
+    stamp = None if get_stamp is None else get_stamp()
+    cached = _generated_menus.get(id(menu))
+
+    if (
+        cached is None
+        or cached[0] is not menu
+        or get_stamp is None
+        or cached[1] != stamp
+    ):
+        cached = (menu, stamp, _generate_menu_options(menu))
+        _generated_menus[id(menu)] = cached
+
+    return cached[2]
+
+
+def get_loaded_submenu(option: CompiledOption) -> CompiledMenu | None:
+    """
+    get_loaded_submenu() es una función que devuelve el
+    submenú compilado al que lleva una opción solo si ya
+    está disponible, sin cargar los submenús diferidos
+    que todavía no se hayan utilizado.
+    """
+    if option.kind == SUBMENU_ACTION:
+        return option.submenu
+
+    cached = _resolved_submenus.get(id(option))
+
+    if cached is None or cached[0] is not option:
+        return None
+
+    return cached[1]
+
+
+def get_loaded_submenu_count() -> int:
+    """
+    get_loaded_submenu_count() es una función que devuelve
+    la cantidad de submenús diferidos cargados hasta el
+    momento. Como estos nunca se descartan, la cantidad
+    solo aumenta, por lo que permite saber si se cargó
+    algún submenú nuevo desde una consulta anterior.
+    """
+    return len(_resolved_submenus)
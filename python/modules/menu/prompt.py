@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene el ciclo de eventos utilizado para solicitarle
+al usuario que elija una opción de un menú sin bloquear la pantalla, de manera
+que las acciones definidas en el parámetro "on_draw" de un menú se puedan
+ejecutar en segundo plano y actualizar su salida mientras el usuario escribe.
+
+### Funcionamiento del ciclo de eventos ###
+* El menú se dibuja inmediatamente, mostrando la última salida conocida de
+  cada acción de "on_draw", o un mensaje de carga en el lugar de las que
+  todavía no finalizaron nunca. Las acciones se ejecutan a través del
+  planificador del módulo "hooks".
+
+* El ciclo de eventos, construido sobre el módulo "selectors", espera a que
+  ocurra alguno de los siguientes eventos:
+  1. El usuario presiona una tecla, en cuyo caso se actualiza la entrada.
+  2. Una acción finaliza, en cuyo caso se redibuja el menú en su lugar.
+  3. Expira la salida de alguna acción, en cuyo caso se la vuelve a
+     ejecutar, conservando su salida anterior mientras tanto.
+
+* Las validaciones de la elección del usuario son las mismas que las de la
+  función get_choice() del módulo "console_ui". Asimismo, si se lo permite,
+  antes de escribir una elección se pueden presionar las siguientes teclas:
+  1. "/", para abrir la paleta de búsqueda del módulo "palette".
+  2. ESC, para volver al menú anterior.
+  3. INICIO, para volver al menú principal.
+
+Este ciclo de eventos solo se utiliza en sistemas POSIX cuando la entrada
+estándar es una terminal.
+"""
+
+import selectors
+import shutil
+import sys
+
+from typing import Callable
+
+from modules.console_ui import (
+    clear_screen,
+    keyboard_session,
+    render_styled_text,
+)
+
+from modules.menu.hooks import (
+    drain_wake_fd,
+    get_draw_hook_outputs,
+    get_next_refresh_delay,
+    get_wake_fd,
+    schedule_draw_hooks,
+)
+
+# --- Constantes a utilizar en las funciones ---
+# Mensaje de la elección a realizar por el usuario.
+_CHOICE_PROMPT = "Ingrese su elección: "
+
+# Pedidos que se devuelven en lugar de una elección
+# cuando el usuario presiona una tecla de navegación.
+PALETTE_REQUEST = "palette"
+BACK_REQUEST = "back"
+HOME_REQUEST = "home"
+
+# Teclas de navegación y el pedido que le corresponde
+# a cada una.
+_NAVIGATION_KEYS = {
+    "/": PALETTE_REQUEST,
+    "ESC": BACK_REQUEST,
+    "HOME": HOME_REQUEST,
+}
+
+# Secuencias de escape ANSI utilizadas para redibujar
+# el menú en su lugar.
+_CURSOR_HOME = "\033[H"
+_ERASE_LINE = "\033[K"
+_ERASE_BELOW = "\033[J"
+_SAVE_CURSOR = "\0337"
+_RESTORE_CURSOR = "\0338"
+
+
+# --- Funciones privadas ---
+def _compose_screen(
+    frame: str, user_input: str, message: str | None, full_clear: bool
+) -> str:
+    """
+    _compose_screen() es una función que construye la
+    cadena que redibuja el menú, el pedido de elección
+    con lo que el usuario lleva escrito y, debajo de este,
+    un posible mensaje de error.
+
+    Si el menú entra en la pantalla, se lo redibuja en su
+    lugar, borrando el resto de cada línea, en lugar de
+    limpiar la pantalla entera.
+    """
+    if full_clear:
+        screen = clear_screen(print_line=False) + frame
+    else:
+        screen = _CURSOR_HOME + frame.replace("\n", f"{_ERASE_LINE}\n")
+
+    screen += f"{_CHOICE_PROMPT}{user_input}"
+
+    if message is None:
+        return screen + _ERASE_BELOW
+
+    # El cursor se deja al final de la entrada del
+    # usuario, por arriba del mensaje de error.
+    return (
+        f"{screen}{_ERASE_LINE}{_SAVE_CURSOR}\n{message}{_ERASE_BELOW}"
+        f"{_RESTORE_CURSOR}"
+    )
+
+
+def _validate_choice(
+    user_input: str, low_lim: int, upp_lim: int
+) -> str | None:
+    """
+    _validate_choice() es una función que controla la
+    elección introducida por el usuario, devolviendo el
+    mensaje de error a mostrar o None si es válida.
+    """
+    if user_input == "":
+        return "¡Introduzca un valor!"
+
+    if not user_input.isdigit():
+        return "¡Solo se pueden introducir números!"
+
+    if not low_lim <= int(user_input) <= upp_lim:
+        return "¡Introduzca un número válido!"
+
+    return None
+
+
+# --- Funciones públicas ---
+def get_choice_with_background_hooks(
+    render_frame: Callable[[list[str | None]], str],
+    hooks: tuple[tuple[Callable[[], None], float | None], ...],
+    low_lim: int,
+    upp_lim: int,
+    allow_navigation: bool = False,
+) -> int | str:
+    """
+    get_choice_with_background_hooks() es una función que
+    dibuja un menú y le solicita al usuario que elija una
+    opción, al igual que get_choice(), mientras ejecuta
+    en segundo plano las acciones de "on_draw" recibidas,
+    cada una junto a su TTL (o None si no lo declara).
+
+    El parámetro "render_frame" debe ser una función que
+    reciba la salida de cada acción (o None, si esta aún
+    no finalizó nunca) y devuelva el menú completo como
+    una cadena.
+
+    Si "allow_navigation=True" y el usuario presiona una
+    tecla de navegación antes de escribir su elección, se
+    devuelve el pedido correspondiente: PALETTE_REQUEST,
+    BACK_REQUEST o HOME_REQUEST.
+    """
+    wake_read_fd = get_wake_fd()
+    user_input = ""
+    message = None
+
+    def redraw(full_clear: bool = False) -> None:
+        frame = render_frame(get_draw_hook_outputs(hooks))
+        if frame.count("\n") + 2 > shutil.get_terminal_size().lines:
+            full_clear = True
+        screen = _compose_screen(frame, user_input, message, full_clear)
+        sys.stdout.write(screen)
+        sys.stdout.flush()
+
+    # Se descartan los avisos pendientes de acciones
+    # lanzadas por menús anteriores.
+    drain_wake_fd()
+
+    with (
+        keyboard_session() as read_key,
+        selectors.DefaultSelector() as selector,
+    ):
+        selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+        selector.register(wake_read_fd, selectors.EVENT_READ)
+
+        schedule_draw_hooks(hooks, menu_shown=True)
+
+        # El primer dibujado limpia la pantalla por
+        # completo, y los siguientes se realizan en
+        # el lugar.
+        redraw(full_clear=True)
+
+        while True:
+            events = selector.select(timeout=get_next_refresh_delay(hooks))
+
+            # Expiró la salida de alguna acción.
+            if not events:
+                schedule_draw_hooks(hooks)
+                continue
+
+            for key, _ in events:
+                if key.fd == wake_read_fd:
+                    # Finalizó una acción en segundo plano.
+                    drain_wake_fd()
+                    redraw()
+                    continue
+
+                pressed_key = read_key(0)
+
+                if pressed_key == "ENTER":
+                    message = _validate_choice(user_input, low_lim, upp_lim)
+                    if message is None:
+                        sys.stdout.write("\n")
+                        sys.stdout.flush()
+                        return int(user_input)
+
+                    message = render_styled_text(
+                        colour_type="bg", colour="red", text=message
+                    )
+                    user_input = ""
+                    redraw()
+                elif (
+                    pressed_key in _NAVIGATION_KEYS
+                    and allow_navigation
+                    and not user_input
+                ):
+                    sys.stdout.write("\n")
+                    sys.stdout.flush()
+                    return _NAVIGATION_KEYS[pressed_key]
+                elif pressed_key == "BACKSPACE":
+                    if user_input:
+                        user_input = user_input[:-1]
+                        sys.stdout.write("\b \b")
+                        sys.stdout.flush()
+                elif pressed_key is not None and len(pressed_key) == 1:
+                    user_input += pressed_key
+                    sys.stdout.write(pressed_key)
+                    sys.stdout.flush()
@@ -51,6 +51,10 @@ PossibleActionParameterTypes = Union[
     # uno de los formatos indicados a
     # continuación.
     dict,
+    # Referencia diferida a un submenú,
+    # a través de una función que devuelve
+    # su diccionario.
+    Callable[[], dict],
     FunctionList,
     CustomParametersFunctionList,
     SequentialCommandList,
@@ -61,6 +65,9 @@ PossibleActionParameterTypes = Union[
 # --- Tipo de dato de las tuplas que contienen variables de entorno ---
 EnvVarTuple = tuple[int, dict[str, str]]
 
+# --- Tipo de dato de las tuplas que contienen dependencias entre comandos ---
+DependencyTuple = tuple[int, list[int]]
+
 
 # --- Tipos de dato de los diccionarios utilizados en la librería ---
 class OptionDictionary(TypedDict, total=False, closed=True):
@@ -83,12 +90,24 @@ class OptionDictionary(TypedDict, total=False, closed=True):
     # etiqueta '#UINPUT'.
     prompt: NotRequired[str]
     env_vars: NotRequired[list[EnvVarTuple]]
+    # Solo se puede definir si el parámetro
+    # "action" incluye la etiqueta '#PARALLEL'.
+    after: NotRequired[list[DependencyTuple]]
 
 
 class MenuDictionary(TypedDict, total=False, closed=True):
     dict_name: Required[str]
     title: Required[str]
     on_start: NotRequired[list[Callable]]
-    on_draw: NotRequired[list[Callable]]
+    # Cada elemento puede declarar un TTL
+    # en segundos junto al objeto de función.
+    on_draw: NotRequired[list[Callable | tuple[Callable, float]]]
     on_exit: NotRequired[list[Callable]]
     options: Required[list[OptionDictionary]]
+    # Función que genera opciones adicionales,
+    # opcionalmente junto a una función que
+    # devuelve su marca de invalidación.
+    options_provider: NotRequired[
+        Callable[[], list[OptionDictionary]]
+        | tuple[Callable[[], list[OptionDictionary]], Callable[[], Any]]
+    ]
@@ -15,7 +15,9 @@ scripts con menús.
 
 import collections
 import inspect
+import re
 import warnings
+import weakref
 
 from typing import Any, Callable, Literal
 
@@ -24,7 +26,12 @@ from modules.console_ui import (
     style_text,
 )
 
-from modules.menu.types import EnvVarTuple, MenuDictionary, OptionDictionary
+from modules.menu.types import (
+    DependencyTuple,
+    EnvVarTuple,
+    MenuDictionary,
+    OptionDictionary,
+)
 
 # --- Colecciones a utilizar en las funciones ---
 _VALID_DICTIONARY_KEYS = {
@@ -36,6 +43,7 @@ _VALID_DICTIONARY_KEYS = {
             "on_draw",
             "on_exit",
             "options",
+            "options_provider",
         }
     ),
     "option": frozenset(
@@ -45,6 +53,7 @@ _VALID_DICTIONARY_KEYS = {
             "aesthetic_action",
             "prompt",
             "env_vars",
+            "after",
         }
     ),
 }
@@ -53,7 +62,19 @@ _VALID_AESTHETIC_ACTION_VALUES = frozenset({"clear_screen", "print_line"})
 
 _VALID_COMMAND_TAGS = frozenset({"#ROOT", "#UINPUT", "#SPLIT-INPUT"})
 
-_VALID_ACTION_TAGS = frozenset({"#PIPE"})
+_VALID_ACTION_TAGS = frozenset({"#PIPE", "#PARALLEL"})
+
+# Formato de las referencias diferidas a submenús, del
+# estilo "paquete.modulo:ATRIBUTO".
+_LAZY_SUBMENU_REFERENCE_PATTERN = re.compile(
+    r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)*:[A-Za-z_]\w*"
+)
+
+# --- Estado de la caché de firmas ---
+# Cantidad de parámetros de cada función ya inspeccionada.
+# Las funciones se guardan con una referencia débil, por lo
+# que su entrada se descarta cuando dejan de existir.
+_signature_cache = weakref.WeakKeyDictionary()
 
 
 # --- Modificación del comportamiento de warnings.warn ---
@@ -216,6 +237,49 @@ def _check_env_vars_parameter_structure(
                 raise TypeError(error_msg)
 
 
+def _check_after_parameter_structure(
+    after: list[DependencyTuple],
+    option_number: int,
+    dict_name: str,
+) -> None:
+    """
+    _check_after_parameter_structure() es
+    una función utilizada para verificar que
+    el parámetro 'after' tenga el formato
+    correcto, en caso de ser definido en una
+    opción.
+    """
+    error_msg = (
+        "El parámetro 'after' fue definido con el formato incorrecto en el"
+        f" elemento N.° {option_number} del parámetro 'options' del"
+        f" diccionario {dict_name}."
+        "\nEl parámetro debería tratarse de una lista de tuplas, donde cada"
+        " tupla almacena un entero que represente el comando que debe esperar"
+        " a otros comandos, y una lista de enteros que representen los"
+        " comandos a esperar."
+    )
+
+    # Si "after" no es una lista,
+    # se aborta inmediatamente.
+    if not isinstance(after, list):
+        raise TypeError(error_msg)
+
+    # Si "after" es una lista, se
+    # deben revisar sus contenidos.
+    for item in after:
+        if not isinstance(item, tuple):
+            raise TypeError(error_msg)
+
+        if len(item) != 2:
+            raise ValueError(error_msg)
+
+        if not (isinstance(item[0], int) and isinstance(item[1], list)):
+            raise TypeError(error_msg)
+
+        if not all(isinstance(position, int) for position in item[1]):
+            raise TypeError(error_msg)
+
+
 def _check_hook_parameter_structure(
     hook: list[Callable],
     hook_name: str,
@@ -229,6 +293,10 @@ def _check_hook_parameter_structure(
     caso de ser definidos en un diccionario
     de menú.
 
+    En el caso de "on_draw", los elementos
+    también pueden ser tuplas con un objeto de
+    función y su TTL en segundos.
+
     Esta función no valida el parámetro
     "dict_name" porque se espera que ya llegue
     con el valor correcto.
@@ -250,6 +318,24 @@ def _check_hook_parameter_structure(
     # Si "hook" es una lista, se
     # deben revisar sus contenidos.
     for item in hook:
+        # Las acciones de "on_draw" pueden
+        # declarar un TTL positivo junto al
+        # objeto de función.
+        if hook_name == "on_draw" and isinstance(item, tuple):
+            if not (
+                len(item) == 2
+                and callable(item[0])
+                and isinstance(item[1], (int, float))
+                and not isinstance(item[1], bool)
+                and item[1] > 0
+            ):
+                raise TypeError(
+                    f"{error_msg}\nSi se declara un TTL, el elemento debe"
+                    " ser una tupla con un objeto de función y una cantidad"
+                    " de segundos mayor a cero."
+                )
+            continue
+
         # Si alguno de los elementos de
         # la lista no es un objeto de
         # función, se aborta inmediatamente.
@@ -258,6 +344,33 @@ def _check_hook_parameter_structure(
 
 
 # --- Funciones privadas para realizar controles estructurales ---
+def _check_options_provider_structure(
+    options_provider: Any, dict_name: str
+) -> None:
+    """
+    _check_options_provider_structure() es una
+    función utilizada para verificar que el
+    parámetro 'options_provider' tenga el formato
+    correcto, en caso de ser definido en un menú.
+    """
+    if callable(options_provider):
+        return
+
+    if not (
+        isinstance(options_provider, tuple)
+        and len(options_provider) == 2
+        and all(callable(function) for function in options_provider)
+    ):
+        raise TypeError(
+            "El parámetro 'options_provider' fue definido con el formato"
+            f" incorrecto en el diccionario {dict_name}."
+            "\nEl parámetro debería tratarse de un objeto de función que"
+            " devuelva una lista de opciones, o de una tupla con dicho objeto"
+            " de función y otro que devuelva la marca de invalidación de las"
+            " opciones generadas."
+        )
+
+
 def _check_dictionary_keys(
     dictionary: dict[Any, Any], dictionary_type: Literal["main", "option"]
 ) -> None:
@@ -345,6 +458,13 @@ def _check_basic_dictionary_structure(menu_data: MenuDictionary) -> None:
                 hook=hook_val, hook_name=hook_key, dict_name=dict_name
             )
 
+    # Control del parámetro "options_provider".
+    options_provider = menu_data.get("options_provider", None)
+    if options_provider is not None:
+        _check_options_provider_structure(
+            options_provider=options_provider, dict_name=dict_name
+        )
+
 
 def _check_top_level_option_keys(menu_data: MenuDictionary) -> None:
     """
@@ -379,6 +499,7 @@ def _check_top_level_option_keys(menu_data: MenuDictionary) -> None:
         aesthetic_action = option.get("aesthetic_action", None)
         prompt = option.get("prompt", None)
         env_vars = option.get("env_vars", None)
+        after = option.get("after", None)
 
         # Evaluación de la llave 'name'.
         _check_parameter(
@@ -393,12 +514,17 @@ def _check_top_level_option_keys(menu_data: MenuDictionary) -> None:
             # Si la llave es definida cuando no hay acciones o
             # cuando la acción no precisa de una acción estética
             # que la acompañe, avisar al usuario.
-            if action is None or isinstance(action, (dict, str)):
+            if (
+                action is None
+                or isinstance(action, (dict, str))
+                or callable(action)
+            ):
                 raise ValueError(
                     "El parámetro 'action' no fue definido en el elemento N.°"
                     f" {option_counter} del parámetro 'options' del"
                     f" diccionario {dict_name}, o fue definido como un objeto"
-                    " de diccionario o una cadena."
+                    " de diccionario, una cadena o una referencia a un"
+                    " submenú."
                     "\nPor lo tanto, el parámetro 'aesthetic_action' es"
                     " inválido. Por favor remuévalo."
                 )
@@ -453,6 +579,33 @@ def _check_top_level_option_keys(menu_data: MenuDictionary) -> None:
                     " favor remuévalo."
                 )
 
+        # Evaluación de la llave 'after'.
+        if after is not None:
+            # Si la llave no tiene el formato correcto,
+            # avisar al usuario.
+            _check_after_parameter_structure(
+                after=after,
+                option_number=option_counter,
+                dict_name=dict_name,
+            )
+
+            # Las dependencias entre comandos solo tienen
+            # sentido si estos se ejecutan de manera
+            # concurrente.
+            if (
+                action is None
+                or not _is_action_a_command_list(action)
+                or "#PARALLEL" not in action
+            ):
+                raise ValueError(
+                    "El parámetro 'action' no fue definido en el elemento N.°"
+                    f" {option_counter} del parámetro 'options' del"
+                    f" diccionario {dict_name}, o no se trata de una lista"
+                    " de comandos con la etiqueta '#PARALLEL'."
+                    "\nPor lo tanto, el parámetro 'after' es inválido. Por"
+                    " favor remuévalo."
+                )
+
 
 def _check_action_string(
     menu_option: OptionDictionary, dict_name: str
@@ -473,15 +626,19 @@ def _check_action_string(
     action_name = menu_option["name"]
 
     # Verificación del parámetro para asegurarse de
-    # que únicamente contiene uno de los valores
-    # permitidos.
-    if action != "exit":
+    # que únicamente contiene el valor "exit" o una
+    # referencia diferida a un submenú.
+    if (
+        action != "exit"
+        and _LAZY_SUBMENU_REFERENCE_PATTERN.fullmatch(action) is None
+    ):
         raise ValueError(
             "Revise el parámetro 'action' en el elemento con el nombre"
             f" '{action_name}' del parámetro 'options' del diccionario"
             f" {dict_name}."
             "\nMotivo: el parámetro 'action' únicamente admite el valor"
-            " 'exit' en caso de ser una cadena."
+            " 'exit' o una referencia a un submenú con el formato"
+            " 'paquete.modulo:ATRIBUTO' en caso de ser una cadena."
         )
 
 
@@ -564,6 +721,63 @@ def _check_action_command_list(
             " elemento."
         )
 
+    # Los comandos no se pueden ejecutar con pipes y de
+    # manera concurrente a la vez.
+    if "#PIPE" in action and "#PARALLEL" in action:
+        raise ValueError(
+            "Revise el parámetro 'action' en el elemento con el nombre"
+            f" '{action_name}' del parámetro 'options' del diccionario"
+            f" {dict_name}."
+            "\nMotivo: las etiquetas '#PIPE' y '#PARALLEL' no se pueden"
+            " utilizar a la vez."
+        )
+
+    # Si los comandos se deben ejecutar de manera
+    # concurrente, debe haber al menos dos comandos.
+    command_amount = sum(1 for item in action if isinstance(item, list))
+    if "#PARALLEL" in action and command_amount < 2:
+        raise ValueError(
+            "Revise el parámetro 'action' en el elemento con el nombre"
+            f" '{action_name}' del parámetro 'options' del diccionario"
+            f" {dict_name}."
+            "\nMotivo: para ejecutar comandos de manera concurrente, el"
+            " parámetro 'action' debe contener al menos dos comandos junto"
+            " a la etiqueta '#PARALLEL'."
+        )
+
+    # Cada comando solo puede esperar a comandos que
+    # estén definidos antes que él, lo que impide que
+    # las dependencias formen ciclos.
+    for position, required_positions in menu_option.get("after", []):
+        positions_are_commands = all(
+            0 <= index < len(action) and isinstance(action[index], list)
+            for index in [position, *required_positions]
+        )
+
+        if not positions_are_commands or any(
+            index >= position for index in required_positions
+        ):
+            raise ValueError(
+                "Revise el parámetro 'after' en el elemento con el nombre"
+                f" '{action_name}' del parámetro 'options' del diccionario"
+                f" {dict_name}."
+                "\nMotivo: cada posición debe indicar un comando del"
+                " parámetro 'action', y cada comando solo puede esperar a"
+                " comandos definidos antes que él."
+            )
+
+    # Si los comandos se deben ejecutar con pipes, debe
+    # haber al menos dos comandos para encadenar.
+    if "#PIPE" in action and command_amount < 2:
+        raise ValueError(
+            "Revise el parámetro 'action' en el elemento con el nombre"
+            f" '{action_name}' del parámetro 'options' del diccionario"
+            f" {dict_name}."
+            "\nMotivo: para ejecutar comandos con pipes, el parámetro"
+            " 'action' debe contener al menos dos comandos luego de la"
+            " etiqueta '#PIPE'."
+        )
+
     # Lista que se usa para almacenar los comandos
     # que tienen etiquetas repetidas, así como las
     # etiquetas repetidas.
@@ -575,16 +789,16 @@ def _check_action_command_list(
     # Revisión de cada elemento de la lista 'action'.
     for item in action:
         # Si un elemento por fuera de un comando es una
-        # cadena, debe tratarse únicamente de la etiqueta
-        # "#PIPE".
+        # cadena, debe tratarse únicamente de las etiquetas
+        # "#PIPE" o "#PARALLEL".
         if isinstance(item, str) and item not in _VALID_ACTION_TAGS:
             raise ValueError(
                 "Revise el parámetro 'action' en el elemento con el nombre"
                 f" '{action_name}' del parámetro 'options' del diccionario"
                 f" {dict_name}."
-                "\nMotivo: la única etiqueta permitida en el parámetro"
-                " 'action' por fuera de las listas con los comandos es la"
-                " etiqueta '#PIPE'."
+                "\nMotivo: las únicas etiquetas permitidas en el parámetro"
+                " 'action' por fuera de las listas con los comandos son:"
+                f" {_VALID_ACTION_TAGS}."
             )
 
         # Si un elemento es una lista, se deben revisar
@@ -662,24 +876,88 @@ def _check_action_command_list(
 
 def _count_required_and_optional_function_args(
     function: Callable[..., Any],
-) -> tuple[int, int]:
+) -> tuple[int, int | None, int]:
     """
     _count_required_and_optional_function_args() es
     una función utilizada para contar la cantidad de
     parámetros obligatorios y opcionales que tiene una
     función, a través de la inspección de su definición.
+
+    Devuelve una tupla con:
+    1. La cantidad de parámetros posicionales obligatorios.
+    2. La cantidad de parámetros posicionales opcionales, o
+       None si la función admite una cantidad arbitraria
+       de ellos (*args).
+    3. La cantidad de parámetros obligatorios que solo se
+       pueden pasar por nombre.
+
+    Los parámetros del tipo **kwargs y los que solo se
+    pueden pasar por nombre con un valor por defecto no
+    se cuentan, ya que las acciones únicamente le pasan
+    parámetros posicionales a las funciones.
+
+    El resultado se guarda en memoria la primera vez que
+    se inspecciona cada función, salvo que esta no admita
+    referencias débiles.
     """
+    try:
+        return _signature_cache[function]
+    except (KeyError, TypeError):
+        pass
+
     func_sig = inspect.signature(function)
     required_args = 0
     optional_args = 0
-
-    for name, param in func_sig.parameters.items():
-        if param.default is inspect.Parameter.empty:
-            required_args += 1
+    required_keyword_args = 0
+
+    for param in func_sig.parameters.values():
+        has_default = param.default is not inspect.Parameter.empty
+
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            optional_args = None
+        elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+            if not has_default:
+                required_keyword_args += 1
+        elif param.kind == inspect.Parameter.VAR_KEYWORD:
+            continue
+        elif has_default:
+            if optional_args is not None:
+                optional_args += 1
         else:
-            optional_args += 1
+            required_args += 1
+
+    arg_counts = (required_args, optional_args, required_keyword_args)
+
+    try:
+        _signature_cache[function] = arg_counts
+    except TypeError:
+        # La función no admite referencias débiles, como
+        # sucede con las funciones integradas, por lo que
+        # se la vuelve a inspeccionar cada vez.
+        pass
+
+    return arg_counts
 
-    return (required_args, optional_args)
+
+def _check_required_keyword_args(
+    required_keyword_args: int, action_name: str, dict_name: str
+) -> None:
+    """
+    _check_required_keyword_args() es una función que
+    verifica que una función referenciada en el parámetro
+    "action" no tenga parámetros obligatorios que solo se
+    puedan pasar por nombre, ya que las acciones
+    únicamente le pasan parámetros posicionales.
+    """
+    if required_keyword_args > 0:
+        raise ValueError(
+            "Revise el parámetro 'action' en el elemento con el nombre"
+            f" '{action_name}' del parámetro 'options' del diccionario"
+            f" {dict_name}."
+            "\nMotivo: una de las funciones referenciadas tiene parámetros"
+            " obligatorios que solo se pueden especificar por nombre, y"
+            " las acciones únicamente admiten parámetros posicionales."
+        )
 
 
 def _check_action_simple_function_list(
@@ -706,7 +984,12 @@ def _check_action_simple_function_list(
     action_name = menu_option["name"]
 
     for function in menu_option["action"]:
-        required_args, _ = _count_required_and_optional_function_args(function)
+        required_args, _, required_keyword_args = (
+            _count_required_and_optional_function_args(function)
+        )
+        _check_required_keyword_args(
+            required_keyword_args, action_name, dict_name
+        )
 
         # Si la cantidad de parámetros obligatorios es
         # mayor a cero, la función debería proveerse en
@@ -785,9 +1068,12 @@ def _check_action_tuple_call_list(
         # 2. La cantidad de parámetros provistos es exagerada,
         #    debido a que se proveen más valores de los que
         #    admite la función.
-        req_param_amount, opt_param_amount = (
+        req_param_amount, opt_param_amount, req_keyword_amount = (
             _count_required_and_optional_function_args(function_tuple[0])
         )
+        _check_required_keyword_args(
+            req_keyword_amount, action_name, dict_name
+        )
 
         if len(function_tuple[1]) < req_param_amount:
             raise ValueError(
@@ -798,7 +1084,10 @@ def _check_action_tuple_call_list(
                 " no contiene valores para uno o más parámetros requeridos"
                 " por la función."
             )
-        elif len(function_tuple[1]) > req_param_amount + opt_param_amount:
+        elif (
+            opt_param_amount is not None
+            and len(function_tuple[1]) > req_param_amount + opt_param_amount
+        ):
             raise ValueError(
                 "Revise el parámetro 'action' en el elemento con el nombre"
                 f" '{action_name}' del parámetro 'options' del diccionario"
@@ -854,11 +1143,13 @@ def _check_action(menu_option: OptionDictionary, dict_name: str) -> None:
                 "\n2. Objetos de función."
                 "\n3. Tuplas."
             )
-    elif isinstance(action, dict):
+    elif isinstance(action, dict) or callable(action):
         # Los diccionarios son controlados por las
         # funciones _check_basic_dictionary_structure()
-        # y _check_top_level_option_keys() llamadas al
-        # principio de la función run_menu(). No
+        # y _check_top_level_option_keys() al compilar
+        # el menú, y los submenús referenciados por una
+        # función se controlan de la misma manera la
+        # primera vez que se ingresa a ellos. No
         # corresponde hacer nada acá.
         pass
     else:
@@ -871,4 +1162,5 @@ def _check_action(menu_option: OptionDictionary, dict_name: str) -> None:
             "\n2. Una lista, cuyos contenidos únicamente pueden ser: objetos"
             " de función, tuplas o una combinación de cadenas y otras listas."
             "\n3. Un diccionario."
+            "\n4. Un objeto de función que devuelva un diccionario."
         )
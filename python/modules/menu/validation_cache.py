@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene una caché en disco de los menús que ya fueron
+validados, de manera que al iniciar un script no se deban volver a validar los
+menús que no cambiaron desde una ejecución anterior.
+
+### Huella de un menú ###
+Los planes compilados contienen objetos de función, que no se pueden guardar
+en disco de manera confiable, por lo que no se guarda el plan, sino la
+"huella" de cada menú que superó la validación. La huella de un menú se
+construye a partir de:
+* El contenido del diccionario, incluyendo el tipo de cada elemento, ya que,
+  por ejemplo, no es lo mismo una lista que una tupla.
+* El módulo, el nombre y la línea de definición de cada objeto de función
+  referenciado, junto con la fecha de modificación del archivo de dicho
+  módulo, de manera que modificar una función invalide los menús que la
+  utilizan.
+* El contenido de cada submenú, por lo que la huella de un menú cambia si
+  cambia alguno de sus submenús.
+* La versión de la librería, construida a partir de la versión del intérprete
+  y de la fecha de modificación de los módulos que validan y compilan los
+  menús.
+
+Como cada submenú tiene su propia huella, modificar un submenú solo invalida
+a dicho submenú y a los menús que lo contienen, y los demás menús se siguen
+compilando sin validarlos.
+
+El contenido se serializa con el módulo "pickle", cuya implementación en C es
+considerablemente más rápida que recorrer el menú desde Python. Los menús que
+contienen objetos que no se pueden serializar no tienen huella, y los que
+contienen objetos cuya serialización cambia de una ejecución a otra (como los
+conjuntos de cadenas) producen una huella distinta cada vez. En ambos casos,
+dichos menús simplemente se validan en cada ejecución.
+
+### Almacenamiento ###
+* Las huellas se guardan en el archivo
+  "$XDG_CACHE_HOME/scripts/menu_cache/validated_menus.json", y solo se
+  conservan las más recientes.
+* El archivo solo se reescribe cuando se valida un menú nuevo. Los errores al
+  leer o escribir en disco se ignoran, ya que la caché solo es una
+  optimización.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+from typing import Any
+
+from modules.menu.types import MenuDictionary
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad máxima de huellas que se guardan en disco.
+_MAX_STORED_FINGERPRINTS = 256
+
+# Módulos de la librería que determinan si un menú es
+# válido, cuya modificación invalida todas las huellas.
+_LIBRARY_MODULES = (
+    "plan.py",
+    "types.py",
+    "validation.py",
+    "validation_cache.py",
+)
+
+# --- Estado de la caché ---
+# Huellas leídas del disco, guardadas como las llaves de
+# un diccionario para conservar el orden en el que se
+# agregaron, o None si todavía no se las leyó.
+_stored_fingerprints = {"fingerprints": None}
+
+
+# --- Funciones privadas ---
+def _get_cache_path() -> str:
+    """
+    _get_cache_path() es una función que devuelve la ruta
+    del archivo donde se guardan las huellas, respetando
+    la variable XDG_CACHE_HOME.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(
+        cache_home, "scripts", "menu_cache", "validated_menus.json"
+    )
+
+
+@functools.cache
+def _get_library_stamp() -> str:
+    """
+    _get_library_stamp() es una función que devuelve la
+    versión de la librería, a partir de la versión del
+    intérprete y de la fecha de modificación de los
+    módulos que validan y compilan los menús.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    stamp = [sys.version]
+
+    for module in _LIBRARY_MODULES:
+        try:
+            stamp.append(os.stat(os.path.join(directory, module)).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+
+    return repr(stamp)
+
+
+def _get_module_mtime(module_name: str | None, mtimes: dict) -> int | None:
+    """
+    _get_module_mtime() es una función que devuelve la
+    fecha de modificación del archivo de un módulo ya
+    importado, o None si no se la puede obtener. Las
+    fechas se guardan en el diccionario recibido para no
+    consultar dos veces el mismo archivo.
+    """
+    if module_name not in mtimes:
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+
+        try:
+            mtimes[module_name] = (
+                None if path is None else os.stat(path).st_mtime_ns
+            )
+        except OSError:
+            mtimes[module_name] = None
+
+    return mtimes[module_name]
+
+
+class _FingerprintPickler(pickle.Pickler):
+    """
+    _FingerprintPickler es una clase que serializa un menú
+    para calcular su huella. A diferencia de un pickler
+    común, los objetos de función (y las clases) no se
+    serializan por su nombre, sino por una descripción que
+    incluye la línea en la que se los definió y la fecha de
+    modificación del archivo de su módulo.
+
+    El resultado nunca se deserializa, por lo que solo
+    importa que sea el mismo de una ejecución a otra.
+    """
+
+    def __init__(self, file: io.BytesIO, mtimes: dict) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._mtimes = mtimes
+
+    def reducer_override(self, obj: Any) -> Any:
+        # La propia clase str se excluye, ya que se la
+        # utiliza para representar la descripción.
+        if obj is str or not callable(obj) or not hasattr(obj, "__qualname__"):
+            return NotImplemented
+
+        module_name = getattr(obj, "__module__", None)
+        code = getattr(obj, "__code__", None)
+        return (
+            str,
+            (
+                f"{module_name}.{obj.__qualname__}"
+                f":{None if code is None else code.co_firstlineno}"
+                f"@{_get_module_mtime(module_name, self._mtimes)}",
+            ),
+        )
+
+
+def _collect_menus(
+    menu_data: MenuDictionary, menus: dict[int, MenuDictionary]
+) -> None:
+    """
+    _collect_menus() es una función que guarda en el
+    diccionario recibido un menú y todos los submenús
+    definidos en las acciones de sus opciones, según el
+    identificador de cada uno. Como los menús todavía no
+    fueron validados, se ignora todo lo que no tenga la
+    estructura esperada.
+    """
+    if id(menu_data) in menus:
+        return
+
+    menus[id(menu_data)] = menu_data
+    options = menu_data.get("options", None)
+
+    if not isinstance(options, list):
+        return
+
+    for option in options:
+        if isinstance(option, dict) and isinstance(
+            option.get("action", None), dict
+        ):
+            _collect_menus(option["action"], menus)
+
+
+def _load_stored_fingerprints() -> dict[str, None]:
+    """
+    _load_stored_fingerprints() es una función que
+    devuelve las huellas guardadas en disco, leyéndolas
+    solo la primera vez que se la llama.
+    """
+    if _stored_fingerprints["fingerprints"] is None:
+        try:
+            with open(_get_cache_path()) as file:
+                stored = json.load(file)
+            if not isinstance(stored, list):
+                stored = []
+        except (OSError, ValueError):
+            stored = []
+
+        _stored_fingerprints["fingerprints"] = dict.fromkeys(
+            item for item in stored if isinstance(item, str)
+        )
+
+    return _stored_fingerprints["fingerprints"]
+
+
+def _write_stored_fingerprints(stored: dict[str, None]) -> None:
+    """
+    _write_stored_fingerprints() es una función que guarda
+    las huellas en disco. La escritura se realiza sobre un
+    archivo temporal que luego reemplaza al definitivo,
+    para no dejar nunca un archivo a medio escribir.
+    """
+    path = _get_cache_path()
+    directory = os.path.dirname(path)
+
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(list(stored), file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+# --- Funciones públicas ---
+def get_menu_fingerprints(menu_data: MenuDictionary) -> dict[int, str]:
+    """
+    get_menu_fingerprints() es una función que calcula la
+    huella de un menú y de todos sus submenús, y devuelve
+    un diccionario con la huella de cada uno según el
+    identificador de su diccionario. Los menús que no se
+    pueden serializar no tienen huella.
+    """
+    menus = {}
+    _collect_menus(menu_data, menus)
+
+    fingerprints = {}
+    mtimes = {}
+
+    for menu_id, menu in menus.items():
+        buffer = io.BytesIO()
+        buffer.write(_get_library_stamp().encode())
+
+        try:
+            _FingerprintPickler(buffer, mtimes).dump(menu)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            continue
+
+        fingerprints[menu_id] = hashlib.sha256(buffer.getvalue()).hexdigest()
+
+    return fingerprints
+
+
+def get_validated_menus(fingerprints: dict[int, str]) -> set[int]:
+    """
+    get_validated_menus() es una función que devuelve los
+    identificadores de los menús cuya huella ya superó la
+    validación en alguna ejecución anterior.
+    """
+    stored = _load_stored_fingerprints()
+    return {
+        menu_id
+        for menu_id, fingerprint in fingerprints.items()
+        if fingerprint in stored
+    }
+
+
+def store_validated_menus(
+    fingerprints: dict[int, str], menu_ids: list[int]
+) -> None:
+    """
+    store_validated_menus() es una función que guarda en
+    disco las huellas de los menús recibidos, que deben
+    haber superado la validación. El archivo solo se
+    reescribe si alguna de las huellas es nueva.
+    """
+    stored = _load_stored_fingerprints()
+    new_fingerprints = [
+        fingerprints[menu_id]
+        for menu_id in menu_ids
+        if menu_id in fingerprints and fingerprints[menu_id] not in stored
+    ]
+
+    if not new_fingerprints:
+        return
+
+    stored.update(dict.fromkeys(new_fingerprints))
+
+    # Se descartan las huellas más antiguas.
+    for fingerprint in list(stored)[:-_MAX_STORED_FINGERPRINTS]:
+        del stored[fingerprint]
+
+    _write_stored_fingerprints(stored)
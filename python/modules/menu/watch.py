@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo del paquete contiene el modo de observación, que permite volver a
+ejecutar una acción periódicamente y mostrar su salida actualizada, sin que el
+usuario deba confirmar cada nueva ejecución.
+
+### Funcionamiento del modo de observación ###
+* La salida de cada ejecución se captura a nivel de los descriptores de la
+  salida y el error estándar, por lo que también se captura lo que imprimen
+  los comandos externos, y no solo lo que se imprime desde Python.
+
+* La pantalla se limpia una única vez al iniciar el modo de observación. En
+  cada ejecución se compara la salida con la de la ejecución anterior y solo
+  se redibujan las líneas que cambiaron. Si cambia el tamaño de la terminal,
+  se redibuja la pantalla completa.
+
+* El intervalo entre ejecuciones se adapta a la duración de la acción: si la
+  acción demora, se espera proporcionalmente más antes de volver a ejecutarla,
+  hasta un máximo, de manera que la observación no mantenga al sistema
+  ocupado constantemente.
+
+* Las líneas que no entran en la terminal se recortan, y presionar cualquier
+  tecla durante la espera finaliza el modo de observación.
+
+Este modo solo se utiliza en sistemas POSIX cuando la entrada y la salida
+estándar son una terminal.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from typing import Callable
+
+from modules.console_ui import (
+    clear_screen,
+    keyboard_session,
+    render_coloured_line,
+    toggle_cursor,
+)
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad mínima y máxima de segundos entre ejecuciones.
+_WATCH_INTERVAL = 2
+_MAX_WATCH_INTERVAL = 60
+
+# Factor por el que se multiplica la duración de una
+# ejecución para calcular la espera hasta la siguiente.
+_WATCH_BACKOFF_FACTOR = 2
+
+# Secuencias de escape ANSI utilizadas para redibujar
+# únicamente las líneas que cambiaron.
+_MOVE_CURSOR = "\033[{row};1H"
+_ERASE_LINE = "\033[K"
+_ERASE_BELOW = "\033[J"
+_RESET_STYLE = "\033[0m"
+
+
+# --- Funciones privadas ---
+def _capture_output(action: Callable[[], None]) -> str:
+    """
+    _capture_output() es una función que ejecuta una
+    acción y devuelve todo lo que esta imprime, tanto por
+    la salida como por el error estándar, incluyendo lo
+    que imprimen los comandos externos que ejecuta.
+    """
+    with tempfile.TemporaryFile() as capture_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = [os.dup(1), os.dup(2)]
+
+        try:
+            os.dup2(capture_file.fileno(), 1)
+            os.dup2(capture_file.fileno(), 2)
+            action()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            for target_fd, saved_fd in enumerate(saved_fds, start=1):
+                os.dup2(saved_fd, target_fd)
+                os.close(saved_fd)
+
+        capture_file.seek(0)
+        return capture_file.read().decode(errors="replace")
+
+
+def _get_watch_delay(duration: float) -> float:
+    """
+    _get_watch_delay() es una función que calcula la
+    cantidad de segundos a esperar hasta la siguiente
+    ejecución, a partir de la duración de la anterior.
+    """
+    return min(
+        max(_WATCH_INTERVAL, duration * _WATCH_BACKOFF_FACTOR),
+        _MAX_WATCH_INTERVAL,
+    )
+
+
+def _fit_lines(lines: list[str], size: os.terminal_size) -> list[str]:
+    """
+    _fit_lines() es una función que recorta las líneas
+    recibidas para que entren en la terminal, de manera
+    que ninguna ocupe más de una fila y que la última
+    fila quede libre.
+
+    El recorte se realiza por cantidad de caracteres,
+    por lo que las líneas con secuencias de escape
+    pueden quedar algo más cortas que la terminal.
+    """
+    fitted_lines = []
+
+    for line in lines[: size.lines - 1]:
+        line = line.expandtabs()
+
+        # Si se recorta una línea con colores, se restablece
+        # el estilo para que este no se extienda a las
+        # líneas siguientes.
+        if len(line) > size.columns:
+            line = line[: size.columns] + _RESET_STYLE
+
+        fitted_lines.append(line)
+
+    return fitted_lines
+
+
+def _render_changes(previous_lines: list[str], lines: list[str]) -> str:
+    """
+    _render_changes() es una función que construye la
+    cadena que redibuja únicamente las líneas que
+    cambiaron respecto de la ejecución anterior, y que
+    borra las líneas sobrantes si la salida se acortó.
+    """
+    changes = []
+
+    for row, line in enumerate(lines, start=1):
+        if row > len(previous_lines) or previous_lines[row - 1] != line:
+            changes.append(
+                f"{_MOVE_CURSOR.format(row=row)}{line}{_ERASE_LINE}"
+            )
+
+    if len(lines) < len(previous_lines):
+        changes.append(
+            f"{_MOVE_CURSOR.format(row=len(lines) + 1)}{_ERASE_BELOW}"
+        )
+
+    return "".join(changes)
+
+
+# --- Funciones públicas ---
+def watch_action(action: Callable[[], None], title: str) -> None:
+    """
+    watch_action() es una función que ejecuta una acción
+    periódicamente y muestra su salida debajo del título
+    recibido, redibujando solo las líneas que cambian
+    entre ejecuciones, hasta que el usuario presione
+    cualquier tecla.
+    """
+    previous_lines = []
+    previous_size = None
+
+    toggle_cursor("hide")
+
+    try:
+        while True:
+            start = time.monotonic()
+            output = _capture_output(action)
+            duration = time.monotonic() - start
+            delay = _get_watch_delay(duration)
+
+            # Si cambió el tamaño de la terminal, las líneas
+            # anteriores ya no ocupan las mismas filas, por
+            # lo que se redibuja la pantalla completa.
+            size = shutil.get_terminal_size()
+            if size != previous_size:
+                sys.stdout.write(clear_screen(print_line=False))
+                previous_lines = []
+                previous_size = size
+
+            separator = render_coloured_line(length=len(title), symbol="=")
+            lines = _fit_lines(
+                [
+                    separator,
+                    title,
+                    f"Última ejecución: {time.strftime('%H:%M:%S')}"
+                    f" ({duration:.1f} s), próxima en {delay:.0f} s.",
+                    "Presione cualquier tecla para salir.",
+                    separator,
+                    *output.rstrip("\n").splitlines(),
+                ],
+                size,
+            )
+
+            sys.stdout.write(_render_changes(previous_lines, lines))
+            sys.stdout.flush()
+            previous_lines = lines
+
+            with keyboard_session() as read_key:
+                if read_key(delay) is not None:
+                    break
+    finally:
+        # Se deja el cursor debajo de la última salida.
+        sys.stdout.write(
+            f"{_MOVE_CURSOR.format(row=len(previous_lines) + 1)}"
+            f"{_ERASE_BELOW}"
+        )
+        sys.stdout.flush()
+        toggle_cursor("show")
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo contiene un registro en memoria de métricas de ejecución de los
+comandos externos lanzados por los scripts, con la finalidad de poder
+determinar qué opciones de un menú son lentas y por qué.
+
+### Métricas registradas ###
+Por cada comando ejecutado a través de las funciones del módulo
+"subprocess_utils" se registra:
+* El comando ejecutado (o la pipeline completa, en el caso de pipe_commands()).
+* El tiempo real transcurrido, en segundos.
+* El tiempo de CPU consumido por los procesos hijos, en segundos, obtenido con
+  resource.getrusage(RUSAGE_CHILDREN).
+* El estado de salida: el código de salida del comando, incluso si no se
+  controló ni se capturó su salida, o una cadena que describe el error si el
+  comando no se pudo ejecutar.
+* La cantidad de bytes de salida capturados, si se capturó la salida.
+* El pico de memoria residente (RSS) del comando, en KiB.
+
+El sistema operativo informa los recursos de todos los procesos hijos en
+conjunto, y del pico de memoria solo informa el máximo entre todos los que
+finalizaron hasta el momento. Por lo tanto:
+* El tiempo de CPU y el pico de memoria solo se registran si ningún otro
+  comando se ejecutó al mismo tiempo, ya sea desde otro hilo (por ejemplo, las
+  acciones de "on_draw" en segundo plano) o de manera concurrente. De lo
+  contrario, no se los podría atribuir a un comando en particular.
+* El pico de memoria solo se conoce si el comando superó el máximo registrado
+  hasta el momento. Si no lo superó, se registra None.
+
+Para que el registro no crezca indefinidamente en las sesiones largas, solo se
+conservan las mediciones de los últimos _MAX_RECORDS comandos.
+
+### Visualización de las métricas ###
+Si la variable de entorno SCRIPTS_METRICS está definida al ejecutar un script,
+al finalizar su ejecución se muestran las métricas registradas:
+* Si su valor es "summary", se imprime una tabla con un resumen por comando.
+* Cualquier otro valor se interpreta como la ruta a un archivo JSON en el que
+  se guardan todas las mediciones.
+"""
+
+import collections
+import json
+import os
+import subprocess
+import threading
+import time
+
+if os.name == "posix":
+    import resource
+
+from typing import Any
+
+from modules.console_ui import draw_coloured_line, style_text
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad máxima de mediciones que se conservan.
+_MAX_RECORDS = 10000
+
+# --- Estado del registro de métricas ---
+_records = collections.deque(maxlen=_MAX_RECORDS)
+_records_lock = threading.Lock()
+
+# Mediciones en curso en todo el programa, para detectar
+# los comandos que se ejecutan al mismo tiempo, y en el
+# hilo actual, para asignarles su código de salida.
+_active_measurements = []
+_thread_measurements = threading.local()
+
+
+# --- Funciones privadas ---
+def _get_children_usage() -> tuple[float | None, int | None]:
+    """
+    _get_children_usage() es una función que devuelve el
+    tiempo de CPU total consumido por los procesos hijos
+    finalizados y el pico de memoria residente entre
+    todos ellos, o None si el sistema no lo informa.
+    """
+    if os.name != "posix":
+        return (None, None)
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (usage.ru_utime + usage.ru_stime, usage.ru_maxrss)
+
+
+def _describe_command(args: tuple, kwargs: dict) -> str:
+    """
+    _describe_command() es una función que obtiene una
+    descripción legible del comando ejecutado a partir de
+    los argumentos recibidos por una función del módulo
+    "subprocess_utils".
+    """
+    if "command" in kwargs:
+        command = kwargs["command"]
+    elif len(args) > 1 and all(isinstance(arg, list) for arg in args):
+        # Se trata de una pipeline.
+        return " | ".join(" ".join(arg) for arg in args)
+    elif len(args) > 0:
+        command = args[0]
+    else:
+        return "?"
+
+    if isinstance(command, list):
+        return " ".join(str(item) for item in command)
+
+    return str(command)
+
+
+def _count_output_bytes(result: Any) -> int | None:
+    """
+    _count_output_bytes() es una función que devuelve la
+    cantidad de bytes de salida capturados en el resultado
+    de un comando, o None si no se capturó la salida.
+    """
+    if isinstance(result, str):
+        return len(result.encode())
+
+    if not isinstance(result, subprocess.CompletedProcess):
+        return None
+
+    total = None
+    for stream in (result.stdout, result.stderr):
+        if isinstance(stream, str):
+            total = (total or 0) + len(stream.encode())
+        elif isinstance(stream, bytes):
+            total = (total or 0) + len(stream)
+
+    return total
+
+
+def _get_thread_measurements() -> list[dict]:
+    """
+    _get_thread_measurements() es una función que devuelve
+    la pila de mediciones en curso del hilo actual.
+    """
+    if not hasattr(_thread_measurements, "stack"):
+        _thread_measurements.stack = []
+
+    return _thread_measurements.stack
+
+
+def _remove_measurement(measurements: list[dict], measurement: dict) -> None:
+    """
+    _remove_measurement() es una función que quita una
+    medición de una lista de mediciones en curso. Se
+    compara por identidad, ya que dos mediciones distintas
+    podrían tener los mismos valores.
+    """
+    for index, active_measurement in enumerate(measurements):
+        if active_measurement is measurement:
+            del measurements[index]
+            return
+
+
+def _get_exit_status(
+    measurement: dict, result: Any, error: BaseException | None
+) -> int | str:
+    """
+    _get_exit_status() es una función que determina el
+    estado de salida de un comando a partir de su resultado
+    o del error que se produjo al ejecutarlo.
+    """
+    if error is None:
+        if isinstance(result, subprocess.CompletedProcess):
+            return result.returncode
+
+        # Si no se capturó la salida, las funciones no
+        # devuelven el resultado, por lo que se utiliza el
+        # código informado con set_command_exit_status().
+        # Si no se informó ninguno, que no se haya producido
+        # un error implica que el comando finalizó bien.
+        if measurement["exit_status"] is not None:
+            return measurement["exit_status"]
+        return 0
+
+    if isinstance(error, subprocess.CalledProcessError):
+        return error.returncode
+
+    if isinstance(error, subprocess.TimeoutExpired):
+        return "timeout"
+
+    return type(error).__name__
+
+
+# --- Funciones públicas ---
+def start_command_measurement(concurrent: bool = False) -> dict:
+    """
+    start_command_measurement() es una función que toma
+    las mediciones iniciales necesarias para luego
+    registrar las métricas de un comando con
+    record_command_measurement().
+    """
+    with _records_lock:
+        # Los recursos de los comandos que se solapan no se
+        # pueden distinguir, ni los de este ni los de los
+        # que ya estaban en curso.
+        for active_measurement in _active_measurements:
+            active_measurement["overlapped"] = True
+
+        cpu_time, peak_rss = _get_children_usage()
+        measurement = {
+            "start_time": time.perf_counter(),
+            "start_cpu_time": cpu_time,
+            "start_peak_rss": peak_rss,
+            "overlapped": concurrent or len(_active_measurements) > 0,
+            "exit_status": None,
+        }
+        _active_measurements.append(measurement)
+
+    _get_thread_measurements().append(measurement)
+    return measurement
+
+
+def set_command_exit_status(returncode: int) -> None:
+    """
+    set_command_exit_status() es una función que informa
+    el código de salida del comando que se está midiendo
+    en el hilo actual, para los casos en los que la
+    función que lo ejecuta no devuelve su resultado.
+    """
+    stack = _get_thread_measurements()
+
+    if stack:
+        stack[-1]["exit_status"] = returncode
+
+
+def record_command_measurement(
+    measurement: dict,
+    args: tuple,
+    kwargs: dict,
+    result: Any = None,
+    error: BaseException | None = None,
+) -> None:
+    """
+    record_command_measurement() es una función que
+    registra las métricas de un comando ejecutado, a
+    partir de las mediciones iniciales tomadas con
+    start_command_measurement(), los argumentos con los
+    que se llamó a la función que lo ejecutó y su
+    resultado o error.
+    """
+    wall_time = time.perf_counter() - measurement["start_time"]
+    cpu_time = peak_rss = None
+
+    with _records_lock:
+        _remove_measurement(_active_measurements, measurement)
+        end_cpu_time, end_peak_rss = _get_children_usage()
+
+    _remove_measurement(_get_thread_measurements(), measurement)
+
+    if not measurement["overlapped"] and end_cpu_time is not None:
+        cpu_time = end_cpu_time - measurement["start_cpu_time"]
+
+        # Si el máximo creció, el nuevo máximo corresponde
+        # a alguno de los procesos de este comando.
+        if end_peak_rss > measurement["start_peak_rss"]:
+            peak_rss = end_peak_rss
+
+    record = {
+        "command": _describe_command(args, kwargs),
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "exit_status": _get_exit_status(measurement, result, error),
+        "output_bytes": _count_output_bytes(result),
+        "peak_rss_kib": peak_rss,
+    }
+
+    with _records_lock:
+        _records.append(record)
+
+
+def get_command_metrics() -> list[dict]:
+    """
+    get_command_metrics() es una función que devuelve una
+    copia de todas las métricas registradas hasta el
+    momento.
+    """
+    with _records_lock:
+        return [dict(record) for record in _records]
+
+
+def dump_metrics_json(file_path: str) -> None:
+    """
+    dump_metrics_json() es una función que guarda todas
+    las métricas registradas en un archivo JSON.
+    """
+    if not isinstance(file_path, str):
+        raise TypeError("El parámetro 'file_path' debe ser una cadena.")
+
+    with open(file_path, "w") as file:
+        json.dump(get_command_metrics(), file, indent=4, ensure_ascii=False)
+
+
+def print_metrics_summary() -> None:
+    """
+    print_metrics_summary() es una función que imprime
+    por pantalla una tabla con un resumen de las métricas
+    registradas, agrupadas por comando y ordenadas según
+    el tiempo real total consumido por cada uno.
+    """
+    summary = {}
+
+    for record in get_command_metrics():
+        entry = summary.setdefault(
+            record["command"],
+            {"runs": 0, "wall": 0.0, "max_wall": 0.0, "cpu": 0.0, "fails": 0},
+        )
+        entry["runs"] += 1
+        entry["wall"] += record["wall_time"]
+        entry["max_wall"] = max(entry["max_wall"], record["wall_time"])
+        entry["cpu"] += record["cpu_time"] or 0.0
+        if record["exit_status"] != 0:
+            entry["fails"] += 1
+
+    header = (
+        f"{'Ejecuciones':>11} {'Total (s)':>10} {'Máx. (s)':>9}"
+        f" {'CPU (s)':>8} {'Fallos':>6}  Comando"
+    )
+
+    draw_coloured_line(length=len(header), symbol="=")
+    print("Métricas de los comandos ejecutados")
+    draw_coloured_line(length=len(header), symbol="=")
+
+    if len(summary) == 0:
+        style_text(
+            colour_type="bg",
+            colour="blue",
+            text="No se ejecutó ningún comando externo.",
+        )
+        return
+
+    print(header)
+    draw_coloured_line(length=len(header))
+
+    for command, entry in sorted(
+        summary.items(), key=lambda item: item[1]["wall"], reverse=True
+    ):
+        print(
+            f"{entry['runs']:>11} {entry['wall']:>10.3f}"
+            f" {entry['max_wall']:>9.3f} {entry['cpu']:>8.3f}"
+            f" {entry['fails']:>6}  {command}"
+        )
+
+
+def report_metrics_from_environment() -> None:
+    """
+    report_metrics_from_environment() es una función que
+    muestra o guarda las métricas registradas según el
+    valor de la variable de entorno SCRIPTS_METRICS. Si
+    dicha variable no está definida, no hace nada.
+    """
+    target = os.environ.get("SCRIPTS_METRICS")
+
+    if not target:
+        return
+
+    if target == "summary":
+        print_metrics_summary()
+        return
+
+    try:
+        dump_metrics_json(target)
+    except OSError as os_error:
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text="No se pudieron guardar las métricas en el archivo"
+            f" '{target}'."
+            f"\nEl error encontrado es: {os_error}.",
+        )
@@ -15,6 +15,7 @@ import sys
 from typing import Callable, NoReturn
 
 from modules.console_ui import style_text
+from modules.metrics import report_metrics_from_environment
 
 
 def execute_with_interrupt_handler(
@@ -32,11 +33,12 @@ def execute_with_interrupt_handler(
         )
 
     try:
-        # Ejecución exitosa de la función,
-        # devolviendo el número 0 como código
-        # de salida.
-        function(*args, **kwargs)
-        sys.exit(0)
+        # Ejecución exitosa de la función. Si
+        # esta devuelve un número entero, se lo
+        # utiliza como código de salida, de lo
+        # contrario se devuelve el número 0.
+        exit_status = function(*args, **kwargs)
+        sys.exit(exit_status if isinstance(exit_status, int) else 0)
     except (KeyboardInterrupt, EOFError):
         # Ejecución de la función interrumpida.
         # Se devuelve el número 1 como código
@@ -48,6 +50,11 @@ def execute_with_interrupt_handler(
             "\n¡Saliendo!",
         )
         sys.exit(1)
+    finally:
+        # Sin importar cómo finalice la ejecución, se
+        # muestran las métricas de los comandos ejecutados
+        # si así se lo pidió.
+        report_metrics_from_environment()
 
 
 @functools.cache
@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+
+"""
+========================
+DOCUMENTACIÓN DEL MÓDULO
+========================
+Este módulo contiene un ayudante (helper) persistente para ejecutar comandos
+con permisos de superusuario, de manera que solo se deba elevar privilegios y
+autenticarse una única vez por sesión, en lugar de hacerlo una vez por cada
+comando ejecutado con run_command_as_root().
+
+### Funcionamiento del ayudante ###
+* El ayudante es este mismo archivo, ejecutado como un script independiente a
+  través del programa de elevación de privilegios del sistema (doas, sudo,
+  run0 o pkexec). Por este motivo, el módulo únicamente puede depender de la
+  librería estándar de Python, y no de otros módulos del paquete.
+
+* Al iniciarse, el ayudante crea un socket de Unix dentro de un directorio
+  privado del usuario que lo lanzó, y queda a la espera de pedidos. Solo se
+  aceptan conexiones del propio proceso que lanzó el ayudante, identificado
+  por su PID a través de las credenciales del socket, de manera que otros
+  procesos del mismo usuario no puedan ejecutar comandos como superusuario
+  sin autenticarse.
+
+* Cada pedido consiste en un mensaje con el comando a ejecutar (y, opcional-
+  mente, sus variables de entorno), acompañado de los descriptores de archivo
+  a utilizar como entrada, salida y error estándar del comando. De esta forma,
+  la salida del comando llega directamente a la terminal (o a una pipe, si se
+  la quiere capturar) sin pasar por el ayudante. Como respuesta, el ayudante
+  devuelve el código de salida del comando.
+
+* Cada comando se ejecuta en su propia sesión, por lo que no recibe
+  directamente las interrupciones de la terminal. En su lugar, si la conexión
+  de un pedido se cierra antes de que finalice el comando (por ejemplo,
+  porque el usuario presionó CTRL + C o porque se agotó su límite de tiempo),
+  el ayudante interrumpe dicho comando junto con todos los procesos que este
+  haya creado. El ayudante finaliza por su cuenta cuando recibe un pedido de
+  detención o cuando el proceso que lo lanzó deja de existir.
+
+* El ayudante se ejecuta con el intérprete en modo aislado ("-I"), de manera
+  que no dependa de las variables de entorno ni de los paquetes del usuario,
+  aunque el programa de elevación de privilegios conserve el entorno.
+
+### Uso del ayudante ###
+* El uso del ayudante es opcional. Para activarlo se debe llamar a la función
+  enable_root_helper(), tras lo cual run_command_as_root() delegará todos los
+  comandos en el ayudante. La función enable_root_helper_from_environment()
+  solo lo activa si la variable de entorno SCRIPTS_ROOT_HELPER vale "1", de
+  manera que los scripts puedan ofrecerlo sin imponerlo. El ayudante se
+  inicia de manera diferida la primera vez que se lo necesita, por lo que la
+  autenticación solo se solicita si efectivamente se ejecuta algún comando con
+  permisos de superusuario.
+
+* El ayudante se detiene con stop_root_helper(), o automáticamente al
+  finalizar la ejecución del script.
+
+* El parámetro "elevation_command" de enable_root_helper() permite reemplazar
+  el programa de elevación de privilegios. Por ejemplo, utilizar "env" en su
+  lugar permite probar el ayudante localmente sin permisos de superusuario.
+"""
+
+import atexit
+import json
+import os
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# --- Constantes a utilizar en las funciones ---
+# Formato del encabezado de cada mensaje, que indica la
+# longitud en bytes del contenido que le sigue.
+_HEADER_FORMAT = "!I"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+
+# Intervalo en segundos entre cada control realizado
+# mientras se espera al ayudante o al proceso cliente.
+_POLL_INTERVAL = 0.05
+
+# Tiempo en segundos que se le da a un comando interrumpido
+# para finalizar antes de detenerlo forzosamente.
+_INTERRUPT_GRACE_PERIOD = 5
+
+# --- Estado de la sesión del ayudante en el proceso cliente ---
+_session = {
+    "enabled": False,
+    "elevation_command": None,
+    "process": None,
+    "directory": None,
+    "socket_path": None,
+}
+
+_session_lock = threading.Lock()
+
+
+# --- Funciones privadas para intercambiar mensajes ---
+def _send_message(
+    conn: socket.socket, message: dict, fds: list[int] | None = None
+) -> None:
+    """
+    _send_message() es una función utilizada para enviar
+    un mensaje en formato JSON a través de un socket,
+    anexándole opcionalmente descriptores de archivo.
+    """
+    payload = json.dumps(message).encode()
+    data = struct.pack(_HEADER_FORMAT, len(payload)) + payload
+
+    if fds:
+        # Los descriptores de archivo deben viajar junto
+        # con los primeros bytes del mensaje.
+        sent = socket.send_fds(conn, [data], fds)
+        data = data[sent:]
+
+    conn.sendall(data)
+
+
+def _recv_message(
+    conn: socket.socket, max_fds: int = 0
+) -> tuple[dict | None, list[int]]:
+    """
+    _recv_message() es una función utilizada para recibir
+    un mensaje enviado con _send_message(), junto con los
+    descriptores de archivo que lo acompañen.
+
+    Si la conexión se cierra antes de recibir un mensaje
+    completo, se devuelve None en lugar del mensaje.
+    """
+    if max_fds > 0:
+        data, fds, _, _ = socket.recv_fds(conn, 65536, max_fds)
+    else:
+        data, fds = conn.recv(65536), []
+
+    while len(data) < _HEADER_SIZE:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return (None, fds)
+        data += chunk
+
+    (length,) = struct.unpack(_HEADER_FORMAT, data[:_HEADER_SIZE])
+
+    while len(data) < _HEADER_SIZE + length:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return (None, fds)
+        data += chunk
+
+    payload = data[_HEADER_SIZE : _HEADER_SIZE + length]
+    return (json.loads(payload), fds)
+
+
+# --- Funciones privadas del ayudante (proceso con privilegios) ---
+def _handle_request(
+    conn: socket.socket, allowed_uid: int, client_pid: int
+) -> None:
+    """
+    _handle_request() es una función que se ejecuta en
+    el ayudante, en un hilo propio por cada conexión, y
+    se encarga de ejecutar el comando recibido y de
+    devolver su código de salida.
+    """
+    fds = []
+
+    try:
+        # Únicamente se aceptan pedidos del proceso que
+        # lanzó el ayudante. Controlar solo el usuario no
+        # alcanza, ya que cualquier otro proceso de dicho
+        # usuario podría ejecutar comandos sin autenticarse.
+        credentials = conn.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        peer_pid, peer_uid, _ = struct.unpack("3i", credentials)
+        if peer_pid != client_pid or peer_uid != allowed_uid:
+            return
+
+        request, fds = _recv_message(conn, max_fds=3)
+        if request is None:
+            return
+
+        if request.get("stop", False):
+            _send_message(conn, {"stopped": True})
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+
+        try:
+            # Al indicar la ruta del programa, subprocess
+            # puede lanzarlo con os.posix_spawn().
+            env = request.get("env")
+            process = subprocess.Popen(
+                args=request["argv"],
+                executable=shutil.which(
+                    request["argv"][0],
+                    path=os.pathsep.join(os.get_exec_path(env)),
+                ),
+                stdin=fds[0],
+                stdout=fds[1],
+                stderr=fds[2],
+                env=env,
+                cwd=request.get("cwd"),
+                start_new_session=True,
+            )
+        except OSError as os_error:
+            _send_message(
+                conn,
+                {
+                    "errno": os_error.errno,
+                    "strerror": os_error.strerror,
+                    "filename": os_error.filename,
+                },
+            )
+            return
+        finally:
+            # Una vez creado el proceso, el ayudante ya no
+            # necesita los descriptores recibidos.
+            for fd in fds:
+                os.close(fd)
+            fds = []
+
+        # Mientras el comando se ejecuta, se vigila la
+        # conexión: si el cliente la cierra, se interrumpe
+        # el comando.
+        watcher = threading.Thread(
+            target=_interrupt_on_disconnect, args=[conn, process], daemon=True
+        )
+        watcher.start()
+
+        returncode = process.wait()
+        _send_message(conn, {"returncode": returncode})
+    except OSError:
+        # Si el cliente desaparece a mitad de un pedido,
+        # no hay nadie a quien informarle el error.
+        pass
+    finally:
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+
+
+def _signal_process_group(process: subprocess.Popen, sig: int) -> None:
+    """
+    _signal_process_group() es una función que le envía
+    una señal a un comando lanzado en su propia sesión y a
+    todos los procesos que este haya creado a su vez.
+    """
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        # Ya no queda ningún proceso en el grupo.
+        pass
+
+
+def _interrupt_on_disconnect(
+    conn: socket.socket, process: subprocess.Popen
+) -> None:
+    """
+    _interrupt_on_disconnect() es una función que se
+    ejecuta en el ayudante, en un hilo secundario, para
+    interrumpir un comando si el cliente cierra la
+    conexión antes de que este finalice.
+
+    Se interrumpe al grupo de procesos completo, ya que
+    si algún proceso creado por el comando mantuviera
+    abiertas las pipes del cliente, este quedaría
+    esperando a que se cierren.
+    """
+    try:
+        conn.recv(1)
+    except OSError:
+        pass
+
+    if process.poll() is None:
+        _signal_process_group(process, signal.SIGINT)
+
+        # Si el comando ignora la interrupción, se lo
+        # finaliza forzosamente luego de un tiempo.
+        try:
+            process.wait(timeout=_INTERRUPT_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            pass
+
+        # Los procesos que hayan quedado en el grupo se
+        # finalizan aunque el comando ya haya terminado.
+        _signal_process_group(process, signal.SIGKILL)
+
+
+def _serve(socket_path: str, allowed_uid: int, client_pid: int) -> None:
+    """
+    _serve() es la función principal del ayudante. Crea
+    el socket de Unix en la ruta indicada y atiende los
+    pedidos recibidos hasta que se le pida detenerse o
+    hasta que el proceso cliente deje de existir.
+    """
+    # Las interrupciones de la terminal no deben finalizar
+    # el ayudante, sino únicamente al comando en ejecución.
+    # Se utiliza un manejador vacío en lugar de ignorar la
+    # señal para que los comandos hijos no hereden dicho
+    # comportamiento.
+    signal.signal(signal.SIGINT, lambda signum, frame: None)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        # El socket se crea con permisos restrictivos antes
+        # de cederle su propiedad al usuario cliente.
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+
+        os.chown(socket_path, allowed_uid, -1)
+        server.listen()
+        server.settimeout(1)
+
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                # Si el proceso cliente ya no existe, el
+                # ayudante no tiene razón para seguir vivo.
+                try:
+                    os.kill(client_pid, 0)
+                except ProcessLookupError:
+                    break
+                continue
+
+            conn.settimeout(None)
+            threading.Thread(
+                target=_handle_request,
+                args=[conn, allowed_uid, client_pid],
+                daemon=True,
+            ).start()
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# --- Funciones privadas del cliente ---
+def _start_helper_process() -> None:
+    """
+    _start_helper_process() es una función utilizada
+    para lanzar el ayudante a través del programa de
+    elevación de privilegios y esperar a que esté listo
+    para recibir pedidos.
+
+    Debe llamarse con el candado de la sesión tomado.
+    """
+    elevation_command = _session["elevation_command"]
+
+    if elevation_command is None:
+        # Se importa acá para que el ayudante, al ejecutarse
+        # como script, no dependa de otros módulos.
+        from modules.program_tools import get_privilege_elevation_command
+
+        elevation_command = get_privilege_elevation_command()
+
+    directory = tempfile.mkdtemp(prefix="root-helper-")
+    socket_path = os.path.join(directory, "helper.sock")
+
+    process = subprocess.Popen(
+        [
+            elevation_command,
+            sys.executable,
+            # El modo aislado evita que el intérprete del
+            # superusuario utilice PYTHONPATH, PYTHONSTARTUP
+            # o los paquetes del usuario si el programa de
+            # elevación conserva el entorno.
+            "-I",
+            os.path.abspath(__file__),
+            socket_path,
+            str(os.getuid()),
+            str(os.getpid()),
+        ]
+    )
+
+    # Se espera a que el ayudante cree el socket. Esto
+    # puede demorar lo que tarde el usuario en
+    # autenticarse, por lo que no se utiliza un límite
+    # de tiempo, aunque sí se controla que el ayudante
+    # no haya finalizado por un error de autenticación.
+    while True:
+        if process.poll() is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise RuntimeError(
+                "No se pudo iniciar el ayudante para ejecutar comandos con"
+                " permisos de superusuario. Código de salida:"
+                f" {process.returncode}."
+            )
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(socket_path)
+            break
+        except OSError:
+            time.sleep(_POLL_INTERVAL)
+
+    _session["process"] = process
+    _session["directory"] = directory
+    _session["socket_path"] = socket_path
+
+
+def _read_pipe(fd: int, chunks: list[bytes]) -> None:
+    """
+    _read_pipe() es una función utilizada para leer una
+    pipe hasta el final y guardar su contenido en una
+    lista, de manera que se pueda ejecutar en un hilo.
+    """
+    with open(fd, "rb") as pipe:
+        chunks.append(pipe.read())
+
+
+# --- Funciones públicas ---
+def enable_root_helper(elevation_command: str | None = None) -> None:
+    """
+    enable_root_helper() es una función utilizada para
+    activar el uso del ayudante persistente. El ayudante
+    recién se inicia la primera vez que se ejecuta un
+    comando con permisos de superusuario.
+
+    Se puede especificar un programa de elevación de
+    privilegios distinto del detectado en el sistema a
+    través del parámetro "elevation_command".
+    """
+    if elevation_command is not None and not isinstance(
+        elevation_command, str
+    ):
+        raise TypeError(
+            "El parámetro 'elevation_command' debe ser una cadena."
+        )
+
+    with _session_lock:
+        _session["enabled"] = True
+        _session["elevation_command"] = elevation_command
+
+
+def enable_root_helper_from_environment() -> None:
+    """
+    enable_root_helper_from_environment() es una función
+    que activa el uso del ayudante persistente solo si la
+    variable de entorno SCRIPTS_ROOT_HELPER vale "1". De lo
+    contrario, no hace nada.
+    """
+    if os.environ.get("SCRIPTS_ROOT_HELPER") == "1":
+        enable_root_helper()
+
+
+def is_root_helper_enabled() -> bool:
+    """
+    is_root_helper_enabled() es una función que indica
+    si se activó el uso del ayudante persistente.
+    """
+    return _session["enabled"]
+
+
+def stop_root_helper() -> None:
+    """
+    stop_root_helper() es una función utilizada para
+    detener el ayudante persistente, si está en
+    ejecución, y desactivar su uso.
+    """
+    with _session_lock:
+        _session["enabled"] = False
+        process = _session["process"]
+
+        if process is not None:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                    conn.connect(_session["socket_path"])
+                    _send_message(conn, {"stop": True})
+                    _recv_message(conn)
+            except OSError:
+                pass
+
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+            shutil.rmtree(_session["directory"], ignore_errors=True)
+
+        _session["process"] = None
+        _session["directory"] = None
+        _session["socket_path"] = None
+
+
+def run_with_root_helper(
+    command: list[str],
+    capture_output: bool = False,
+    custom_env: dict | None = None,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess:
+    """
+    run_with_root_helper() es una función utilizada para
+    ejecutar un comando a través del ayudante persistente,
+    iniciándolo si todavía no se está ejecutando.
+
+    Devuelve un objeto del tipo subprocess.CompletedProcess
+    con el código de salida del comando y, si se capturó,
+    su salida como cadena. No controla el código de salida.
+
+    Si se especifica un límite de tiempo y este se agota,
+    se cierra la conexión con el ayudante (lo que provoca
+    que este interrumpa el comando) y se produce el error
+    subprocess.TimeoutExpired.
+    """
+    with _session_lock:
+        if _session["process"] is None:
+            _start_helper_process()
+        socket_path = _session["socket_path"]
+
+    request = {"argv": command, "env": custom_env, "cwd": os.getcwd()}
+    local_fds = []
+    stdout_chunks = []
+    stderr_chunks = []
+    readers = []
+
+    if capture_output:
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        fds = [sys.stdin.fileno(), stdout_write, stderr_write]
+        local_fds = [stdout_write, stderr_write]
+
+        # Ambas pipes se leen de manera concurrente para
+        # que el comando no se bloquee si llena alguna.
+        for fd, chunks in [
+            (stdout_read, stdout_chunks),
+            (stderr_read, stderr_chunks),
+        ]:
+            reader = threading.Thread(target=_read_pipe, args=[fd, chunks])
+            reader.start()
+            readers.append(reader)
+    else:
+        # La salida del comando debe aparecer en el orden
+        # correcto respecto de lo que ya imprimió el script.
+        sys.stdout.flush()
+        fds = [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(socket_path)
+            _send_message(conn, request, fds)
+
+            # Los extremos de escritura de las pipes solo
+            # deben quedar abiertos en el comando.
+            for fd in local_fds:
+                os.close(fd)
+            local_fds = []
+
+            conn.settimeout(timeout)
+            try:
+                response, _ = _recv_message(conn)
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(cmd=command, timeout=timeout)
+    finally:
+        for fd in local_fds:
+            os.close(fd)
+        for reader in readers:
+            reader.join()
+
+    if response is None:
+        raise RuntimeError(
+            "El ayudante para ejecutar comandos con permisos de superusuario"
+            " finalizó de manera inesperada."
+        )
+
+    if "errno" in response:
+        # OSError devuelve automáticamente la subclase que
+        # corresponda al código de error (por ejemplo,
+        # FileNotFoundError).
+        raise OSError(
+            response["errno"], response["strerror"], response["filename"]
+        )
+
+    stdout = stderr = None
+    if capture_output:
+        stdout = b"".join(stdout_chunks).decode(errors="replace")
+        stderr = b"".join(stderr_chunks).decode(errors="replace")
+
+    return subprocess.CompletedProcess(
+        args=command,
+        returncode=response["returncode"],
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+atexit.register(stop_root_helper)
+
+
+if __name__ == "__main__":
+    _serve(
+        socket_path=sys.argv[1],
+        allowed_uid=int(sys.argv[2]),
+        client_pid=int(sys.argv[3]),
+    )
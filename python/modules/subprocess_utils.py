@@ -60,20 +60,202 @@ métodos subprocess.run() y subprocess.Popen().
   embargo, en el caso de run_command_as_root(), el control de errores
   siempre está habilitado.
 
-### Particularidades de la función pipe_commands() ###
-* Los argumentos "first_command" y "second_command" deben tratarse de listas
+* Si se activa el ayudante persistente del módulo "root_helper" a través de
+  la función enable_root_helper(), run_command_as_root() y su contraparte
+  asíncrona le delegan los comandos a dicho ayudante, de manera que solo se
+  eleven privilegios una vez por sesión.
+
+### Captura acotada de la salida ###
+* run_command(capture_output=True) almacena en memoria la salida completa de
+  un comando. Para comandos con salidas muy extensas se proveen dos
+  alternativas:
+
+  1. run_command_to_file(), que hace que el comando escriba su salida
+     directamente en un archivo, sin que esta pase por el script.
+
+  2. run_command_with_output_tail(), que conserva en memoria únicamente los
+     últimos bytes de la salida del comando.
+
+* En ambos casos, del error estándar solo se conservan sus últimos bytes, los
+  cuales se muestran al informar un error de ejecución.
+
+### Modo "tee" de run_command() ###
+* Con "tee_output=True", run_command() ejecuta el comando dentro de una
+  pseudoterminal, de manera que programas como emerge o flatpak conservan sus
+  colores y barras de progreso, mientras su salida se muestra por pantalla y,
+  al mismo tiempo, se captura (con "capture_output=True") y/o se añade a un
+  archivo de registro (con el parámetro "log_path"). Así, no es necesario
+  ejecutar un comando dos veces para ver su salida y también procesarla.
+
+* Como en una terminal la salida y el error estándar son el mismo flujo, el
+  error estándar se captura junto con la salida estándar.
+
+* La entrada del usuario se le reenvía al comando tecla por tecla, incluyendo
+  Ctrl+C, que finaliza el comando como de costumbre.
+
+* La pseudoterminal recibe el tamaño de la terminal real al lanzar el comando
+  y cada vez que esta cambia de tamaño (SIGWINCH), siempre que el comando se
+  ejecute desde el hilo principal.
+
+### Particularidades de las funciones para ejecutar pipelines ###
+* Las funciones pipe_commands(), print_pipe_commands() y stream_pipe_commands()
+  reciben dos o más comandos, cada uno de los cuales debe tratarse de una lista
   de cadenas. En caso de que no tengan el formato correcto, sucederá lo mismo
   que sucede con las validaciones en run_command() y run_command_as_root(), a
   través de la función _check_command_argument_type().
+
+* stream_pipe_commands() es un generador que devuelve la salida del último
+  comando línea por línea a medida que esta se produce, sin acumularla en
+  memoria. pipe_commands() devuelve la salida completa como una cadena, y
+  print_pipe_commands() la imprime por pantalla a medida que llega.
+
+* Los errores estándar de todos los comandos se leen de manera concurrente
+  mientras la pipeline se ejecuta, y solo se conservan sus últimas líneas para
+  informar los errores que se produzcan.
+
+* Al ser un generador, stream_pipe_commands() no está protegido por el manejo
+  de errores del módulo, por lo que sus excepciones se deben tratar al
+  consumirlo. Las otras dos funciones sí lo están.
+
+### Particularidades de la ejecución concurrente de comandos ###
+* Las corrutinas async_run_command() y async_run_command_as_root() son las
+  contrapartes asíncronas de run_command() y run_command_as_root(), y se
+  construyen sobre la función asyncio.create_subprocess_exec(). Por lo tanto,
+  no admiten el uso del intérprete de consola del sistema.
+
+* Para ejecutar varias de estas corrutinas a la vez se utiliza la función
+  run_concurrently(), que limita la cantidad de comandos en ejecución con un
+  semáforo y devuelve los resultados en el mismo orden en el que se reciben
+  las corrutinas. La función run_commands_concurrently() es un atajo para el
+  caso habitual de una lista de comandos sin permisos de superusuario.
+
+* El manejo de errores es el mismo que en las funciones síncronas: si un
+  comando falla, se informa el error por pantalla y su resultado es None, sin
+  que esto afecte al resto de los comandos.
+
+* El parámetro "dependencies" de run_concurrently() permite indicar que una
+  corrutina solo se debe ejecutar luego de que finalicen otras corrutinas
+  anteriores, formando un grafo de dependencias. Las corrutinas sin
+  dependencias pendientes se ejecutan a la vez, respetando el límite de
+  concurrencia, y las que dependen de un comando que falló se omiten.
+
+* Si la salida de los comandos no se captura, estos escriben directamente en
+  la terminal, por lo que sus salidas podrían mezclarse entre sí.
+
+### Errores informados ###
+* Como las funciones del módulo informan los errores por pantalla y devuelven
+  None, quien las llama no siempre puede saber si algún comando falló, por
+  ejemplo cuando no se captura la salida. El gestor de contexto
+  collect_command_errors() devuelve una lista en la que se guardan los errores
+  informados en el hilo actual mientras este se encuentre activo.
+
+* Los comandos ejecutados con "check_return=False" no producen errores, por
+  lo que no se guardan en dicha lista aunque finalicen con un código distinto
+  de cero.
+
+### Registro de métricas ###
+* Todas las funciones protegidas por los decoradores de manejo de errores del
+  módulo registran el tiempo de ejecución, el estado de salida y el consumo de
+  recursos de cada comando en el módulo "metrics". Véase la documentación de
+  dicho módulo para más información.
+
+### Lanzamiento de procesos ###
+* Para reducir el costo de lanzar cada comando, las funciones del módulo
+  resuelven de antemano la ruta absoluta del programa a ejecutar (guardándola
+  en memoria para los siguientes usos) y no le piden a subprocess que cierre
+  los descriptores de archivo heredados. De esta manera, subprocess puede
+  utilizar os.posix_spawn() en lugar de fork() y exec(), lo cual es
+  considerablemente más rápido en procesos grandes. Cerrar los descriptores no
+  es necesario, ya que desde Python 3.4 todos los descriptores que crea el
+  intérprete son no heredables (PEP 446).
+
+* Los comandos ejecutados con límite de tiempo en la ejecución concurrente se
+  lanzan en su propia sesión, por lo que no pueden aprovechar esta ventaja.
+
+* El script "benchmark_spawn.py" permite medir el costo de lanzar comandos con
+  las distintas funciones del módulo.
+
+### Límites de tiempo ###
+* Todas las funciones que ejecutan comandos individuales admiten el parámetro
+  "timeout", que indica la cantidad máxima de segundos que se puede esperar a
+  que finalice un comando. Si se agota, se produce el error
+  "subprocess.TimeoutExpired", que es manejado como el resto de los errores.
+
+* En la ejecución concurrente, los comandos con límite de tiempo se lanzan en
+  su propio grupo de procesos y sin acceso a la entrada estándar, de manera
+  que al agotarse su tiempo se los pueda detener junto con todos los procesos
+  que hayan creado. Asimismo, run_concurrently() y run_commands_concurrently()
+  admiten el parámetro "total_timeout", que cancela todos los comandos que
+  sigan en ejecución (o a la espera de ejecutarse) cuando se agota el tiempo
+  total del lote.
 """
 
+import collections
+import contextlib
+import errno
 import functools
+import os
+import pty
+import selectors
+import shutil
+import signal
 import subprocess
+import sys
+import tempfile
+import termios
+import threading
+import time
+import tty
+
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterator
 
-from typing import Any, Callable
+# La librería asyncio demora considerablemente en importarse,
+# por lo que solo se la importa al ejecutar comandos de
+# manera concurrente.
+if TYPE_CHECKING:
+    import asyncio
 
 from modules.console_ui import style_text
+from modules.metrics import (
+    record_command_measurement,
+    set_command_exit_status,
+    start_command_measurement,
+)
 from modules.program_tools import get_privilege_elevation_command
+from modules.root_helper import is_root_helper_enabled, run_with_root_helper
+
+# --- Constantes a utilizar en las funciones ---
+# Cantidad de líneas del error estándar de cada proceso
+# de una pipeline que se conservan para informar errores.
+_STDERR_TAIL_LINES = 20
+
+# Cantidad de bytes de la salida de un comando que se
+# conservan en memoria al capturarla de forma acotada.
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Tamaño de cada lectura de la salida de un comando.
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Programa intermedio con el que se lanzan los comandos
+# en modo "tee". Convierte la pseudoterminal recibida
+# como entrada estándar en su terminal de control y
+# luego se reemplaza por el comando, cuya ruta y
+# argumentos recibe a continuación.
+_CONTROLLING_TERMINAL_WRAPPER = (
+    "import fcntl, os, sys, termios;"
+    " fcntl.ioctl(0, termios.TIOCSCTTY, 0);"
+    " os.execv(sys.argv[1], sys.argv[2:])"
+)
+
+# --- Estado de la resolución de ejecutables ---
+# Rutas absolutas de los programas ya resueltos, según
+# el nombre del programa y el valor de PATH utilizado.
+_executable_cache = {}
+
+# --- Estado de los errores informados ---
+# Listas en las que se guardan los errores informados en
+# cada hilo, una por cada collect_command_errors() activo.
+_error_collectors = threading.local()
 
 
 # --- Funciones privadas ---
@@ -119,6 +301,101 @@ def _check_command_argument_type(
             )
 
 
+def _check_timeout_argument(name: str, timeout: float | None) -> None:
+    """
+    _check_timeout_argument() se encarga de validar los
+    límites de tiempo que reciben las funciones del
+    módulo, los cuales deben ser None o un número mayor
+    a cero que represente una cantidad de segundos.
+    """
+    if timeout is None:
+        return
+
+    if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+        raise TypeError(f"El parámetro '{name}' debe ser un número.")
+
+    if timeout <= 0:
+        raise ValueError(f"El parámetro '{name}' debe ser mayor a cero.")
+
+
+def _format_stderr_tail(stderr: Any) -> str:
+    """
+    _format_stderr_tail() es una función que devuelve las
+    últimas líneas del error estándar de un comando, para
+    poder incluirlas en un mensaje de error, o una cadena
+    vacía si no se capturó el error estándar.
+    """
+    if not isinstance(stderr, str) or not stderr.strip():
+        return ""
+
+    last_lines = stderr.strip().splitlines()[-_STDERR_TAIL_LINES:]
+    return "\nÚltimos errores:\n" + "\n".join(last_lines)
+
+
+def _report_command_error(error: Exception) -> None:
+    """
+    _report_command_error() es una función utilizada
+    para informarle al usuario sobre los errores que
+    se producen al ejecutar un comando externo.
+
+    Se la utiliza en los decoradores que manejan las
+    excepciones del módulo, de manera que los mensajes
+    de error sean los mismos sin importar si un comando
+    se ejecuta de forma síncrona o asíncrona.
+    """
+    for errors in getattr(_error_collectors, "lists", []):
+        errors.append(error)
+
+    if isinstance(error, subprocess.CalledProcessError):
+        # Si el comando no logra ejecutarse correctamente por algún
+        # motivo, se manejará este error.
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text=f"Error de ejecución del comando {error.cmd}."
+            f"\nCódigo de salida: {error.returncode}."
+            + _format_stderr_tail(error.stderr),
+        )
+    elif isinstance(error, subprocess.TimeoutExpired):
+        # Si el comando no logra ejecutarse aún después de esperar
+        # una determinada cantidad de tiempo, se manejará este error.
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text=f"Se esperaron {error.timeout} segundos para"
+            f" ejecutar el comando {error.cmd}, pero no se recibió"
+            " respuesta.",
+        )
+    elif isinstance(error, FileNotFoundError):
+        # Si el comando no existe, ya sea porque corresponde a un
+        # programa que no está instalado, invocado incorrectamente,
+        # o cualquier otra razón, se manejará este error.
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text=f"No existe el comando '{error.filename}'.",
+        )
+    elif isinstance(error, OSError):
+        # Manejo de errores relacionados con el SO como "archivo
+        # no encontrado", "permiso denegado", etc.
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text="Se ha producido un error del SO durante la ejecución de"
+            " un programa."
+            f"\nEl error encontrado es: {error}.",
+        )
+    else:
+        # Cualquier otro error que no se haya podido manejar
+        # anteriormente se tratará acá.
+        style_text(
+            colour_type="bg",
+            colour="red",
+            text="Se produjo un error inesperado al ejecutar el comando."
+            f"\nError encontrado: {error}.",
+        )
+
+
 # fmt: off
 # Black quiere separar con una línea la definición del decorador luego del
 # docstring, porque seguramente considera que está tratando dos funciones
@@ -138,67 +415,656 @@ def _run_commands_exception_handler(
     # propósito de preservar el nombre y el docstring
     # de las funciones a las cuales se les anexa este
     # decorador.
+    #
+    # Asimismo, cada ejecución se mide y se registra en el
+    # módulo "metrics".
     @functools.wraps(func)
     def inner_exception_handling(*args: Any, **kwargs: Any) -> Any | None:
+        measurement = start_command_measurement()
+
         try:
-            return func(*args, **kwargs)
-        except subprocess.CalledProcessError as exec_error:
-            # Si el comando no logra ejecutarse correctamente por algún
-            # motivo, se manejará este error.
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text=f"Error de ejecución del comando {exec_error.cmd}."
-                f"\nCódigo de salida: {exec_error.returncode}.",
-            )
-            return None
-        except subprocess.TimeoutExpired as timeout_error:
-            # Si el comando no logra ejecutarse aún después de esperar
-            # una determinada cantidad de tiempo, se manejará este error.
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text=f"Se esperaron {timeout_error.timeout} segundos para"
-                f" ejecutar el comando {timeout_error.cmd}, pero no se recibió"
-                " respuesta.",
-            )
+            result = func(*args, **kwargs)
+        except Exception as error:
+            record_command_measurement(measurement, args, kwargs, error=error)
+            _report_command_error(error)
             return None
-        except FileNotFoundError as filenotfound_error:
-            # Si el comando no existe, ya sea porque corresponde a un
-            # programa que no está instalado, invocado incorrectamente,
-            # o cualquier otra razón, se manejará este error.
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text=f"No existe el comando '{filenotfound_error.filename}'.",
-            )
-            return None
-        except OSError as os_error:
-            # Manejo de errores relacionados con el SO como "archivo
-            # no encontrado", "permiso denegado", etc.
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text="Se ha producido un error del SO durante la ejecución de"
-                " un programa."
-                f"\nEl error encontrado es: {os_error}.",
-            )
-            return None
-        except Exception as unknown_error:
-            # Cualquier otro error que no se haya podido manejar
-            # anteriormente se tratará acá.
-            style_text(
-                colour_type="bg",
-                colour="red",
-                text="Se produjo un error inesperado al ejecutar el comando."
-                f"\nError encontrado: {unknown_error}.",
-            )
+        except BaseException as error:
+            # Las interrupciones y cancelaciones no se
+            # manejan, pero se registran igualmente para
+            # que la medición no quede en curso.
+            record_command_measurement(measurement, args, kwargs, error=error)
+            raise
+
+        record_command_measurement(measurement, args, kwargs, result=result)
+        return result
+
+    return inner_exception_handling
+
+
+def _async_run_commands_exception_handler(
+    func: Callable[..., Coroutine[Any, Any, Any]],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    _async_run_commands_exception_handler() es la
+    contraparte asíncrona del decorador anterior, y
+    se utiliza con las corrutinas del módulo que
+    ejecutan comandos a través de la librería asyncio.
+
+    Al igual que su contraparte síncrona, informa el
+    error producido y devuelve None en caso de falla.
+    """
+    @functools.wraps(func)
+    async def inner_exception_handling(
+        *args: Any, **kwargs: Any
+    ) -> Any | None:
+        measurement = start_command_measurement(concurrent=True)
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as error:
+            record_command_measurement(measurement, args, kwargs, error=error)
+            _report_command_error(error)
             return None
+        except BaseException as error:
+            # Las interrupciones y cancelaciones no se
+            # manejan, pero se registran igualmente para
+            # que la medición no quede en curso.
+            record_command_measurement(measurement, args, kwargs, error=error)
+            raise
+
+        record_command_measurement(measurement, args, kwargs, result=result)
+        return result
 
     return inner_exception_handling
 # fmt: on
 
 
+def _resolve_executable(program: str, custom_env: dict | None) -> str | None:
+    """
+    _resolve_executable() es una función que devuelve la
+    ruta absoluta de un programa, buscándolo en el PATH
+    del entorno con el que se lo va a ejecutar, o None si
+    no se lo encuentra.
+
+    Los resultados se guardan en memoria, por lo que cada
+    programa solo se busca una vez por cada valor de PATH.
+    """
+    if os.sep in program:
+        return program
+
+    search_path = os.pathsep.join(os.get_exec_path(custom_env))
+    key = (program, search_path)
+
+    if key not in _executable_cache:
+        executable = shutil.which(program, path=search_path)
+
+        # Los programas que no se encuentran no se guardan,
+        # ya que podrían instalarse más adelante.
+        if executable is None:
+            return None
+
+        _executable_cache[key] = os.path.abspath(executable)
+
+    return _executable_cache[key]
+
+
+def _get_spawn_arguments(
+    command: list[str] | str, custom_env: dict | None = None
+) -> dict[str, Any]:
+    """
+    _get_spawn_arguments() es una función que devuelve los
+    argumentos adicionales que se le deben pasar a
+    subprocess para que pueda lanzar el comando recibido
+    con os.posix_spawn() en lugar de fork() y exec().
+
+    Esto requiere que el programa a ejecutar se indique
+    con su ruta y que no se deban cerrar los descriptores
+    de archivo heredados.
+    """
+    spawn_arguments = {"close_fds": False}
+
+    # Los comandos ejecutados a través del intérprete de
+    # consola ya utilizan la ruta absoluta de este.
+    if isinstance(command, list):
+        spawn_arguments["executable"] = _resolve_executable(
+            program=command[0], custom_env=custom_env
+        )
+
+    return spawn_arguments
+
+
+def _read_stream_tail(stream: Any, tail: bytearray, tail_size: int) -> None:
+    """
+    _read_stream_tail() es una función que lee un stream
+    hasta agotarlo, conservando en el buffer recibido
+    únicamente sus últimos "tail_size" bytes. De esta
+    manera, el consumo de memoria se mantiene acotado sin
+    importar cuánta salida produzca un comando.
+    """
+    while chunk := stream.read1(_READ_CHUNK_SIZE):
+        tail += chunk
+        if len(tail) > tail_size:
+            del tail[:-tail_size]
+
+
+def _run_streaming_command(
+    command: list[str],
+    stdout_target: int,
+    custom_env: dict | None,
+    timeout: float | None,
+    tail_size: int,
+) -> tuple[int, bytes, bytes]:
+    """
+    _run_streaming_command() es una función que ejecuta
+    un comando enviando su salida estándar al descriptor
+    de archivo recibido (o a una pipe, si se recibe
+    subprocess.PIPE) y su error estándar a una pipe.
+
+    Las pipes se leen de manera concurrente en hilos
+    secundarios, conservando solo sus últimos bytes.
+    Devuelve el código de salida del comando y los
+    últimos bytes de su salida y su error estándar.
+    """
+    process = subprocess.Popen(
+        args=command,
+        stdout=stdout_target,
+        stderr=subprocess.PIPE,
+        env=custom_env,
+        **_get_spawn_arguments(command=command, custom_env=custom_env),
+    )
+
+    tails = []
+    reader_threads = []
+
+    for stream in (process.stdout, process.stderr):
+        tail = bytearray()
+        tails.append(tail)
+
+        if stream is not None:
+            reader_thread = threading.Thread(
+                target=_read_stream_tail,
+                args=[stream, tail, tail_size],
+                daemon=True,
+            )
+            reader_thread.start()
+            reader_threads.append(reader_thread)
+
+    try:
+        process.wait(timeout=timeout)
+    except BaseException:
+        # Ya sea porque se agotó el tiempo o porque el
+        # usuario interrumpió la ejecución, no se debe
+        # dejar el proceso huérfano.
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader_thread in reader_threads:
+            reader_thread.join()
+
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    return (process.returncode, bytes(tails[0]), bytes(tails[1]))
+
+
+def _get_terminal_window_size() -> tuple[int, int]:
+    """
+    _get_terminal_window_size() es una función que
+    devuelve la cantidad de filas y columnas de la
+    terminal real, consultando la salida, la entrada y el
+    error estándar, en ese orden. Si ninguno de ellos es
+    una terminal, se utiliza el tamaño que informa
+    shutil.get_terminal_size(), de manera que el comando
+    nunca vea una terminal de tamaño nulo.
+    """
+    for stream in (sys.stdout, sys.stdin, sys.stderr):
+        try:
+            fd = stream.fileno()
+            if os.isatty(fd):
+                return termios.tcgetwinsize(fd)
+        except (AttributeError, OSError, ValueError):
+            continue
+
+    size = shutil.get_terminal_size()
+    return (size.lines, size.columns)
+
+
+def _prepare_pty(slave_fd: int) -> None:
+    """
+    _prepare_pty() es una función que configura la
+    pseudoterminal en la que se ejecuta un comando en
+    modo "tee", copiando el tamaño de la terminal real
+    para que las barras de progreso se dibujen bien.
+
+    Asimismo, se desactiva la conversión de saltos de
+    línea en la pseudoterminal, ya que de eso ya se
+    encarga la terminal real, de manera que la salida
+    registrada no contenga retornos de carro de más.
+    """
+    termios.tcsetwinsize(slave_fd, _get_terminal_window_size())
+
+    attributes = termios.tcgetattr(slave_fd)
+    attributes[tty.OFLAG] &= ~termios.ONLCR
+    termios.tcsetattr(slave_fd, termios.TCSANOW, attributes)
+
+
+def _forward_window_size(master_fd: int) -> Callable | int | None:
+    """
+    _forward_window_size() es una función que instala un
+    manejador de SIGWINCH que copia el nuevo tamaño de la
+    terminal real a la pseudoterminal, lo que hace que el
+    sistema le envíe la misma señal al comando. Devuelve
+    el manejador anterior, para restaurarlo luego.
+
+    Las señales solo se pueden manejar desde el hilo
+    principal, por lo que desde otros hilos no se instala
+    nada y se devuelve None.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return None
+
+    def copy_window_size(signum: int, frame: Any) -> None:
+        try:
+            termios.tcsetwinsize(master_fd, _get_terminal_window_size())
+        except (OSError, termios.error):
+            # La pseudoterminal ya se cerró.
+            pass
+
+    previous_handler = signal.signal(signal.SIGWINCH, copy_window_size)
+
+    # Si el manejador anterior no se instaló desde Python,
+    # se restaura el comportamiento por defecto.
+    return signal.SIG_DFL if previous_handler is None else previous_handler
+
+
+def _get_pty_command(
+    command: list[str] | str, use_shell: bool, custom_env: dict | None
+) -> list[str]:
+    """
+    _get_pty_command() es una función que devuelve el
+    comando a lanzar en modo "tee", precedido por el
+    programa intermedio que le asigna la pseudoterminal
+    como terminal de control.
+
+    Se utiliza un programa intermedio en lugar del
+    parámetro "preexec_fn" de subprocess, el cual no es
+    seguro en procesos con varios hilos, como los que
+    ejecutan las acciones de "on_draw" en segundo plano.
+    """
+    arguments = ["/bin/sh", "-c", command] if use_shell else command
+    executable = _resolve_executable(arguments[0], custom_env)
+
+    # El programa se busca antes de lanzarlo para producir
+    # el mismo error que produciría subprocess.
+    if executable is None:
+        raise FileNotFoundError(
+            errno.ENOENT, os.strerror(errno.ENOENT), arguments[0]
+        )
+
+    return [
+        sys.executable,
+        "-I",
+        "-S",
+        "-c",
+        _CONTROLLING_TERMINAL_WRAPPER,
+        executable,
+        *arguments,
+    ]
+
+
+def _run_under_pty(
+    command: list[str] | str,
+    use_shell: bool,
+    custom_env: dict | None,
+    timeout: float | None,
+    capture_output: bool,
+    log_path: str | None,
+) -> tuple[int, bytes | None]:
+    """
+    _run_under_pty() es una función que ejecuta un comando
+    dentro de una pseudoterminal, mostrando su salida por
+    pantalla a medida que se produce y, al mismo tiempo,
+    guardándola en memoria y/o en un archivo de registro.
+
+    Como el comando cree que escribe en una terminal,
+    conserva sus colores y barras de progreso. La
+    entrada del usuario se le reenvía tal cual, por lo
+    que el comando también puede ser interactivo.
+
+    Devuelve el código de salida del comando y, si se
+    pidió capturarla, su salida.
+    """
+    master_fd, slave_fd = pty.openpty()
+    log_file = None
+    stdin_fd = sys.stdin.fileno() if sys.stdin.isatty() else None
+    stdin_attributes = None
+    captured = bytearray() if capture_output else None
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    try:
+        _prepare_pty(slave_fd)
+
+        if log_path is not None:
+            log_file = open(log_path, "ab")
+
+        sys.stdout.flush()
+        process = subprocess.Popen(
+            args=_get_pty_command(command, use_shell, custom_env),
+            stdin=slave_fd,
+            stdout=slave_fd,
+            stderr=slave_fd,
+            env=custom_env,
+            start_new_session=True,
+        )
+    except BaseException:
+        os.close(master_fd)
+        os.close(slave_fd)
+        if log_file is not None:
+            log_file.close()
+        raise
+
+    # Solo el proceso hijo debe tener abierta la
+    # pseudoterminal, para que al finalizar este la
+    # lectura de su salida termine con un error EIO.
+    os.close(slave_fd)
+    previous_sigwinch_handler = _forward_window_size(master_fd)
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(master_fd, selectors.EVENT_READ)
+
+            # La entrada del usuario se pasa a modo crudo
+            # para reenviarle cada tecla al comando, aunque
+            # se conserva el procesamiento de la salida de
+            # la terminal real.
+            if stdin_fd is not None:
+                stdin_attributes = termios.tcgetattr(stdin_fd)
+                raw_attributes = termios.tcgetattr(stdin_fd)
+                tty.cfmakeraw(raw_attributes)
+                raw_attributes[tty.OFLAG] = stdin_attributes[tty.OFLAG]
+                termios.tcsetattr(stdin_fd, termios.TCSANOW, raw_attributes)
+                selector.register(stdin_fd, selectors.EVENT_READ)
+
+            # La lectura de la salida termina cuando el comando
+            # cierra la pseudoterminal.
+            output_open = True
+
+            while output_open:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise subprocess.TimeoutExpired(
+                        cmd=command, timeout=timeout
+                    )
+
+                # Se utiliza un intervalo de espera para poder
+                # controlar tanto el límite de tiempo como la
+                # finalización del comando, por si algún proceso
+                # que este creó mantiene abierta la terminal.
+                events = selector.select(timeout=0.1)
+
+                if not events and process.poll() is not None:
+                    break
+
+                for key, _ in events:
+                    if key.fd == stdin_fd:
+                        user_input = os.read(stdin_fd, _READ_CHUNK_SIZE)
+                        if user_input:
+                            os.write(master_fd, user_input)
+                        else:
+                            selector.unregister(stdin_fd)
+                        continue
+
+                    try:
+                        chunk = os.read(master_fd, _READ_CHUNK_SIZE)
+                    except OSError:
+                        chunk = b""
+
+                    if not chunk:
+                        output_open = False
+                        break
+
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+
+                    if log_file is not None:
+                        log_file.write(chunk)
+                    if captured is not None:
+                        captured += chunk
+
+        remaining_time = (
+            None if deadline is None else max(deadline - time.monotonic(), 0)
+        )
+        returncode = process.wait(timeout=remaining_time)
+    except BaseException:
+        # Ya sea porque se agotó el tiempo o porque se
+        # interrumpió la ejecución, se finaliza el comando
+        # junto con todos los procesos que haya creado.
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        process.wait()
+        raise
+    finally:
+        if previous_sigwinch_handler is not None:
+            signal.signal(signal.SIGWINCH, previous_sigwinch_handler)
+        if stdin_attributes is not None:
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, stdin_attributes)
+        os.close(master_fd)
+        if log_file is not None:
+            log_file.close()
+
+    return (returncode, None if captured is None else bytes(captured))
+
+
+def _kill_process_group(process: "asyncio.subprocess.Process") -> None:
+    """
+    _kill_process_group() es una función utilizada para
+    finalizar forzosamente un proceso lanzado en su
+    propia sesión, junto con todos los procesos que este
+    haya creado a su vez.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        # El proceso ya finalizó por su cuenta.
+        pass
+
+
+async def _spawn_and_wait(
+    command_to_run: list[str],
+    check_return: bool,
+    capture_output: bool,
+    custom_env: dict | None,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess:
+    """
+    _spawn_and_wait() es una corrutina que ejecuta un
+    comando con asyncio.create_subprocess_exec(), espera
+    a que finalice y devuelve un objeto del tipo
+    subprocess.CompletedProcess con el resultado, tal y
+    como lo haría subprocess.run().
+
+    Si se especifica un límite de tiempo, el comando se
+    ejecuta en su propia sesión (y, por lo tanto, en su
+    propio grupo de procesos) y sin acceso a la entrada
+    estándar, de manera que se lo pueda finalizar junto
+    con todos sus procesos hijos si no termina a tiempo
+    o si se cancela la corrutina.
+    """
+    import asyncio
+
+    stream = asyncio.subprocess.PIPE if capture_output else None
+    use_process_group = timeout is not None
+    process = await asyncio.create_subprocess_exec(
+        *command_to_run,
+        stdin=asyncio.subprocess.DEVNULL if use_process_group else None,
+        stdout=stream,
+        stderr=stream,
+        env=custom_env,
+        start_new_session=use_process_group,
+        **_get_spawn_arguments(command=command_to_run, custom_env=custom_env),
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(), timeout=timeout
+        )
+    except TimeoutError:
+        _kill_process_group(process)
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd=command_to_run, timeout=timeout)
+    except asyncio.CancelledError:
+        # Si se cancela la corrutina (por ejemplo, porque se
+        # agotó el tiempo total de un lote de comandos), no
+        # se debe dejar el proceso huérfano.
+        if use_process_group:
+            _kill_process_group(process)
+        elif process.returncode is None:
+            process.kill()
+        await process.wait()
+        raise
+
+    # Al igual que en run_command(), capturar la salida
+    # implica que esta se devuelve como una cadena.
+    if capture_output:
+        stdout = stdout.decode(errors="replace")
+        stderr = stderr.decode(errors="replace")
+
+    if check_return and process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode=process.returncode,
+            cmd=command_to_run,
+            output=stdout,
+            stderr=stderr,
+        )
+
+    return subprocess.CompletedProcess(
+        args=command_to_run,
+        returncode=process.returncode,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+def _run_through_root_helper(
+    command: list[str],
+    capture_output: bool,
+    timeout: float | None = None,
+    always_return: bool = False,
+) -> None | subprocess.CompletedProcess:
+    """
+    _run_through_root_helper() es una función utilizada
+    para ejecutar un comando a través del ayudante
+    persistente del módulo "root_helper", aplicando el
+    mismo control de errores que run_command_as_root().
+    """
+    result = run_with_root_helper(
+        command=command, capture_output=capture_output, timeout=timeout
+    )
+
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode=result.returncode,
+            cmd=command,
+            output=result.stdout,
+            stderr=result.stderr,
+        )
+
+    if capture_output or always_return:
+        return result
+
+
+def _is_failed_task(task: "asyncio.Task") -> bool:
+    """
+    _is_failed_task() es una función que determina si
+    una tarea finalizada falló, ya sea porque se la
+    canceló, porque produjo una excepción o porque su
+    resultado es None, que es lo que devuelven las
+    corrutinas del módulo cuando falla un comando.
+    """
+    return (
+        task.cancelled()
+        or task.exception() is not None
+        or task.result() is None
+    )
+
+
+def _check_dependencies_argument(
+    dependencies: dict[int, list[int]], coroutine_count: int
+) -> None:
+    """
+    _check_dependencies_argument() es una función que
+    controla que cada dependencia de run_concurrently()
+    indique la posición de una corrutina anterior a la
+    que depende de ella, lo que además garantiza que
+    las dependencias no formen ciclos.
+    """
+    error_msg = (
+        "El parámetro 'dependencies' debe ser un diccionario cuyas llaves"
+        " sean las posiciones de las corrutinas, y cuyos valores sean listas"
+        " con las posiciones de corrutinas anteriores."
+    )
+
+    if not isinstance(dependencies, dict):
+        raise TypeError(error_msg)
+
+    for position, required_positions in dependencies.items():
+        if not isinstance(position, int) or not isinstance(
+            required_positions, (list, tuple)
+        ):
+            raise TypeError(error_msg)
+
+        if not 0 <= position < coroutine_count or not all(
+            isinstance(required, int) and 0 <= required < position
+            for required in required_positions
+        ):
+            raise ValueError(error_msg)
+
+
+async def _run_with_semaphore(
+    semaphore: "asyncio.Semaphore",
+    coroutine: Coroutine[Any, Any, Any],
+    required_tasks: "list[asyncio.Task] | None" = None,
+    position: int | None = None,
+) -> Any:
+    """
+    _run_with_semaphore() es una corrutina que espera
+    a que haya un lugar disponible en el semáforo antes
+    de ejecutar la corrutina recibida, limitando así la
+    cantidad de procesos que corren al mismo tiempo.
+
+    Si se reciben tareas en "required_tasks", primero se
+    espera a que estas finalicen, sin ocupar un lugar en
+    el semáforo mientras tanto. Si alguna de ellas falló,
+    la corrutina no se ejecuta y su resultado es None.
+    """
+    import asyncio
+
+    try:
+        if required_tasks:
+            await asyncio.wait(required_tasks)
+
+            if any(_is_failed_task(task) for task in required_tasks):
+                style_text(
+                    colour_type="bg",
+                    colour="yellow",
+                    text=f"Se omitió el comando N.° {position + 1}, ya que"
+                    " falló uno de los comandos de los que depende.",
+                )
+                return None
+
+        async with semaphore:
+            return await coroutine
+    finally:
+        # Si la corrutina se cancela mientras espera su
+        # lugar en el semáforo, o si no se la ejecuta,
+        # nunca llega a ejecutarse, por lo que se la debe
+        # cerrar explícitamente.
+        coroutine.close()
+
+
 # --- Funciones públicas ---
 @_run_commands_exception_handler
 def run_command(
@@ -207,6 +1073,9 @@ def run_command(
     use_shell: bool = False,
     capture_output: bool = False,
     custom_env: dict = None,
+    timeout: float | None = None,
+    tee_output: bool = False,
+    log_path: str | None = None,
 ) -> None | subprocess.CompletedProcess:
     """
     run_command() es un wrapper de subprocess.run para
@@ -219,15 +1088,21 @@ def run_command(
     de consola del sistema para realizar operaciones,
     pero esto solo se puede hacer con el control de
     errores activado.
+
+    Con "tee_output=True", el comando se ejecuta en una
+    pseudoterminal y su salida se muestra por pantalla
+    y, a la vez, se captura (si "capture_output=True")
+    y/o se añade al archivo indicado en "log_path".
     """
     if (
         not isinstance(check_return, bool)
         or not isinstance(use_shell, bool)
         or not isinstance(capture_output, bool)
+        or not isinstance(tee_output, bool)
     ):
         raise TypeError(
-            "Los parámetros 'check_return', 'use_shell' y 'capture_output'"
-            " deben ser valores lógicos."
+            "Los parámetros 'check_return', 'use_shell', 'capture_output' y"
+            " 'tee_output' deben ser valores lógicos."
         )
 
     if not check_return and use_shell:
@@ -236,7 +1111,48 @@ def run_command(
             " con use_shell=True. No es seguro."
         )
 
+    if log_path is not None:
+        if not isinstance(log_path, str):
+            raise TypeError("El parámetro 'log_path' debe ser una cadena.")
+
+        if not tee_output:
+            raise ValueError(
+                "El parámetro 'log_path' solo se puede usar con"
+                " tee_output=True."
+            )
+
     _check_command_argument_type(command=command, use_shell=use_shell)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+
+    if tee_output:
+        returncode, output = _run_under_pty(
+            command=command,
+            use_shell=use_shell,
+            custom_env=custom_env,
+            timeout=timeout,
+            capture_output=capture_output,
+            log_path=log_path,
+        )
+
+        # El error estándar se mezcla con la salida
+        # estándar en la pseudoterminal, por lo que no
+        # se lo puede capturar por separado.
+        if output is not None:
+            output = output.decode(errors="replace")
+
+        if check_return and returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode=returncode, cmd=command, output=output
+            )
+
+        if capture_output:
+            return subprocess.CompletedProcess(
+                args=command, returncode=returncode, stdout=output
+            )
+
+        set_command_exit_status(returncode)
+        return None
+
     result = subprocess.run(
         args=command,
         check=check_return,
@@ -244,17 +1160,24 @@ def run_command(
         capture_output=capture_output,
         text=capture_output,
         env=custom_env,
+        timeout=timeout,
+        **_get_spawn_arguments(command=command, custom_env=custom_env),
     )
 
     if capture_output:
         return result
 
+    # Sin capturar la salida no se devuelve el resultado,
+    # por lo que el código de salida se informa aparte.
+    set_command_exit_status(result.returncode)
+
 
 @_run_commands_exception_handler
 def run_command_as_root(
     command: list[str] | str,
     use_shell: bool = False,
     capture_output: bool = False,
+    timeout: float | None = None,
 ) -> None | subprocess.CompletedProcess:
     """
     run_command_as_root() es un wrapper de subprocess.run
@@ -273,6 +1196,18 @@ def run_command_as_root(
         )
 
     _check_command_argument_type(command=command, use_shell=use_shell)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+
+    # Si se activó el ayudante persistente, el comando
+    # se le delega a este en lugar de elevar privilegios
+    # nuevamente.
+    if is_root_helper_enabled():
+        return _run_through_root_helper(
+            command=["/bin/sh", "-c", command] if use_shell else command,
+            capture_output=capture_output,
+            timeout=timeout,
+        )
+
     root_cmd = get_privilege_elevation_command()
 
     if use_shell:
@@ -286,6 +1221,8 @@ def run_command_as_root(
         shell=use_shell,
         capture_output=capture_output,
         text=capture_output,
+        timeout=timeout,
+        **_get_spawn_arguments(command=command_to_run),
     )
 
     if capture_output:
@@ -293,64 +1230,554 @@ def run_command_as_root(
 
 
 @_run_commands_exception_handler
-def pipe_commands(
-    first_command: list[str], second_command: list[str]
-) -> str | None:
+def run_command_to_file(
+    command: list[str],
+    output_path: str,
+    custom_env: dict = None,
+    timeout: float | None = None,
+) -> bool | None:
     """
-    pipe_commands() es un wrapper de subprocess.Popen()
-    que sirve para simular el uso de pipelines, como las
-    que se utilizan en los intérpretes de consola. Solo
-    admite la llamada a dos programas.
+    run_command_to_file() es una función utilizada para
+    ejecutar un comando y guardar su salida estándar en
+    un archivo, sin pasar por la memoria del script: el
+    comando escribe directamente en el archivo.
 
-    Recibe como entrada dos listas con los programas
-    a ejecutar.
+    La salida se escribe primero en un archivo temporal
+    que solo reemplaza al definitivo si el comando se
+    ejecuta correctamente, de manera que un error nunca
+    deje un archivo a medio escribir. Del error estándar
+    solo se conservan sus últimos bytes, para poder
+    informar los errores que se produzcan.
+
+    Devuelve True si el comando se ejecutó correctamente.
     """
-    _check_command_argument_type(command=first_command, use_shell=False)
-    _check_command_argument_type(command=second_command, use_shell=False)
+    if not isinstance(output_path, str):
+        raise TypeError("El parámetro 'output_path' debe ser una cadena.")
 
-    with subprocess.Popen(
-        args=first_command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    ) as first_process:
-        with subprocess.Popen(
-            args=second_command,
-            stdin=first_process.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        ) as second_process:
-            # Cierro la salida del primer comando para evitar
-            # deadlocks (puntos muertos o bloqueos).
-            first_process.stdout.close()
-
-            # Guardo la salida estándar del segundo proceso y
-            # descarto el error estándar, ya que no me interesa.
-            stdout_second, _ = second_process.communicate()
-
-        # Descarto tanto la salida estándar como el error
-        # estándar del primer proceso, ya que no me interesa
-        # ninguna de las dos cosas.
-        _, _ = first_process.communicate()
+    _check_command_argument_type(command=command, use_shell=False)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+
+    output_directory = os.path.dirname(os.path.abspath(output_path))
+
+    # Se controla la carpeta de destino por separado para
+    # que el error no se confunda con un comando inexistente.
+    if not os.path.isdir(output_directory):
+        raise NotADirectoryError(f"La carpeta '{output_directory}' no existe")
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=output_directory, prefix=".", suffix=".tmp"
+    )
+
+    try:
+        # mkstemp() crea el archivo con permisos 0600, por lo
+        # que se le asignan los mismos permisos que tendría un
+        # archivo creado con open().
+        umask = os.umask(0)
+        os.umask(umask)
+        os.fchmod(fd, 0o666 & ~umask)
+
+        returncode, _, stderr = _run_streaming_command(
+            command=command,
+            stdout_target=fd,
+            custom_env=custom_env,
+            timeout=timeout,
+            tail_size=_OUTPUT_TAIL_BYTES,
+        )
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    finally:
+        os.close(fd)
+
+    if returncode != 0:
+        os.unlink(temp_path)
+        raise subprocess.CalledProcessError(
+            returncode=returncode,
+            cmd=command,
+            stderr=stderr.decode(errors="replace"),
+        )
+
+    os.replace(temp_path, output_path)
+    return True
+
+
+@_run_commands_exception_handler
+def run_command_with_output_tail(
+    command: list[str],
+    tail_size: int = _OUTPUT_TAIL_BYTES,
+    check_return: bool = True,
+    custom_env: dict = None,
+    timeout: float | None = None,
+) -> None | subprocess.CompletedProcess:
+    """
+    run_command_with_output_tail() es una alternativa a
+    run_command(capture_output=True) para comandos que
+    producen una salida muy extensa (como los registros
+    de compilación), que conserva en memoria únicamente
+    los últimos "tail_size" bytes de la salida y del
+    error estándar del comando.
+
+    Devuelve un objeto del tipo subprocess.CompletedProcess
+    cuya salida y error estándar son cadenas, al igual
+    que run_command(capture_output=True).
+    """
+    if not isinstance(check_return, bool):
+        raise TypeError(
+            "El parámetro 'check_return' debe ser un valor lógico."
+        )
+
+    if isinstance(tail_size, bool) or not isinstance(tail_size, int):
+        raise TypeError("El parámetro 'tail_size' debe ser un número entero.")
+
+    if tail_size <= 0:
+        raise ValueError("El parámetro 'tail_size' debe ser mayor a cero.")
+
+    _check_command_argument_type(command=command, use_shell=False)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+
+    returncode, stdout, stderr = _run_streaming_command(
+        command=command,
+        stdout_target=subprocess.PIPE,
+        custom_env=custom_env,
+        timeout=timeout,
+        tail_size=tail_size,
+    )
+
+    # Al recortar la salida, el primer carácter podría
+    # quedar incompleto, por lo que se reemplazan los
+    # bytes que no se puedan decodificar.
+    stdout = stdout.decode(errors="replace")
+    stderr = stderr.decode(errors="replace")
+
+    if check_return and returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode=returncode, cmd=command, output=stdout, stderr=stderr
+        )
+
+    return subprocess.CompletedProcess(
+        args=command, returncode=returncode, stdout=stdout, stderr=stderr
+    )
+
+
+def stream_pipe_commands(*commands: list[str]) -> Iterator[str]:
+    """
+    stream_pipe_commands() es un generador construido
+    sobre subprocess.Popen() que sirve para simular el
+    uso de pipelines de cualquier longitud, como las
+    que se utilizan en los intérpretes de consola.
+
+    Recibe como entrada dos o más listas con los
+    programas a ejecutar y devuelve, línea por línea
+    y a medida que se produce, la salida estándar del
+    último programa de la pipeline.
+
+    Los errores estándar de todos los programas se
+    leen de manera concurrente en hilos secundarios,
+    de manera que ningún proceso se quede bloqueado
+    al llenarse el buffer de su pipe.
+    """
+    if len(commands) < 2:
+        raise ValueError(
+            "Se deben proveer al menos dos comandos para construir una"
+            " pipeline."
+        )
+
+    for command in commands:
+        _check_command_argument_type(command=command, use_shell=False)
+
+    processes = []
+    stderr_tails = []
+    stderr_threads = []
+    previous_stdout = None
+    finished_reading = False
+
+    try:
+        # Cada proceso recibe como entrada la salida
+        # estándar del proceso anterior.
+        for command in commands:
+            process = subprocess.Popen(
+                args=command,
+                stdin=previous_stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                **_get_spawn_arguments(command=command),
+            )
+            processes.append(process)
+
+            # Cierro la salida del proceso anterior en
+            # este proceso para evitar deadlocks (puntos
+            # muertos o bloqueos). Solo el proceso que la
+            # recibe como entrada debe tenerla abierta.
+            if previous_stdout is not None:
+                previous_stdout.close()
+            previous_stdout = process.stdout
+
+            # Se guardan únicamente las últimas líneas del
+            # error estándar de cada proceso, para poder
+            # informarlas en caso de error sin acumular
+            # toda la salida en memoria.
+            stderr_tail = collections.deque(maxlen=_STDERR_TAIL_LINES)
+            stderr_thread = threading.Thread(
+                target=stderr_tail.extend, args=[process.stderr], daemon=True
+            )
+            stderr_thread.start()
+            stderr_tails.append(stderr_tail)
+            stderr_threads.append(stderr_thread)
+
+        for line in processes[-1].stdout:
+            yield line.rstrip("\n")
+
+        finished_reading = True
+    finally:
+        # Si el generador se abandona antes de tiempo, se
+        # deben finalizar los procesos que sigan vivos para
+        # que no queden bloqueados escribiendo en una pipe
+        # que nadie lee.
+        if previous_stdout is not None:
+            previous_stdout.close()
+
+        for process in processes:
+            if not finished_reading and process.poll() is None:
+                process.kill()
+            process.wait()
+
+        for stderr_thread in stderr_threads:
+            stderr_thread.join()
+
+        for process in processes:
+            process.stderr.close()
 
     # Si alguno de los comandos ejecutados falla, causar
     # una excepción. Esta excepción luego será atrapada
     # como una excepción genérica en el decorador
     # "_run_commands_exception_handler".
-    if first_process.returncode != 0:
-        raise RuntimeError(
-            f"El primer comando, '{' '.join(first_command)}', falló con"
-            f" el código de salida {first_process.returncode}."
-        )
+    #
+    # Los procesos intermedios finalizados por SIGPIPE no
+    # se consideran fallidos, ya que eso solo indica que
+    # el proceso siguiente dejó de leer su salida, tal y
+    # como sucede en los intérpretes de consola.
+    for index, process in enumerate(processes):
+        is_last_process = index == len(processes) - 1
+
+        if process.returncode == 0 or (
+            not is_last_process and process.returncode == -signal.SIGPIPE
+        ):
+            continue
 
-    if second_process.returncode != 0:
-        raise RuntimeError(
-            f"El segundo comando, '{' '.join(second_command)}', falló"
-            f" con el código de salida {second_process.returncode}."
+        error_msg = (
+            f"El comando N.° {index + 1}, '{' '.join(commands[index])}', falló"
+            f" con el código de salida {process.returncode}."
         )
 
-    # Antes de devolver la salida del segundo comando,
+        if stderr_tails[index]:
+            error_msg += f"\nÚltimos errores: {''.join(stderr_tails[index])}"
+
+        raise RuntimeError(error_msg.strip())
+
+
+@_run_commands_exception_handler
+def pipe_commands(*commands: list[str]) -> str | None:
+    """
+    pipe_commands() es un wrapper de stream_pipe_commands()
+    que sirve para simular el uso de pipelines, como las
+    que se utilizan en los intérpretes de consola, y
+    obtener la salida completa del último programa.
+
+    Recibe como entrada dos o más listas con los programas
+    a ejecutar.
+    """
+    output = "\n".join(stream_pipe_commands(*commands))
+
+    # Antes de devolver la salida del último comando,
     # conviene limpiarla para remover cosas como espacios
     # en blanco innecesarios.
-    return stdout_second.strip()
+    return output.strip()
+
+
+@_run_commands_exception_handler
+def print_pipe_commands(*commands: list[str]) -> bool | None:
+    """
+    print_pipe_commands() es un wrapper de
+    stream_pipe_commands() que imprime por pantalla la
+    salida del último programa de una pipeline a medida
+    que esta se produce, sin tener que esperar a que
+    todos los programas finalicen.
+
+    Devuelve True si todos los comandos se ejecutaron
+    correctamente.
+    """
+    for line in stream_pipe_commands(*commands):
+        print(line, flush=True)
+
+    return True
+
+
+@_async_run_commands_exception_handler
+async def async_run_command(
+    command: list[str],
+    check_return: bool = True,
+    capture_output: bool = False,
+    custom_env: dict = None,
+    timeout: float | None = None,
+) -> None | subprocess.CompletedProcess:
+    """
+    async_run_command() es la contraparte asíncrona de
+    run_command(), construida sobre la función
+    asyncio.create_subprocess_exec(). Permite ejecutar
+    varios comandos de manera concurrente al combinarla
+    con run_concurrently().
+
+    A diferencia de run_command(), no admite el uso del
+    intérprete de consola y siempre devuelve un objeto
+    del tipo subprocess.CompletedProcess si el comando
+    se ejecutó correctamente, aún si no se capturó su
+    salida.
+
+    Si se especifica un límite de tiempo con el parámetro
+    "timeout", el comando no tiene acceso a la entrada
+    estándar y, si no finaliza a tiempo, se lo detiene
+    junto con todos sus procesos hijos.
+    """
+    if not isinstance(check_return, bool) or not isinstance(
+        capture_output, bool
+    ):
+        raise TypeError(
+            "Los parámetros 'check_return' y 'capture_output' deben ser"
+            " valores lógicos."
+        )
+
+    _check_command_argument_type(command=command, use_shell=False)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+    return await _spawn_and_wait(
+        command_to_run=command,
+        check_return=check_return,
+        capture_output=capture_output,
+        custom_env=custom_env,
+        timeout=timeout,
+    )
+
+
+@_async_run_commands_exception_handler
+async def async_run_command_as_root(
+    command: list[str],
+    capture_output: bool = False,
+    timeout: float | None = None,
+) -> None | subprocess.CompletedProcess:
+    """
+    async_run_command_as_root() es la contraparte
+    asíncrona de run_command_as_root(). Al igual que
+    esta, no permite desactivar el control de errores.
+    """
+    if not isinstance(capture_output, bool):
+        raise TypeError(
+            "El parámetro 'capture_output' debe ser un valor lógico."
+        )
+
+    _check_command_argument_type(command=command, use_shell=False)
+    _check_timeout_argument(name="timeout", timeout=timeout)
+
+    if is_root_helper_enabled():
+        import asyncio
+
+        return await asyncio.to_thread(
+            _run_through_root_helper,
+            command=command,
+            capture_output=capture_output,
+            timeout=timeout,
+            always_return=True,
+        )
+
+    root_cmd = get_privilege_elevation_command()
+
+    return await _spawn_and_wait(
+        command_to_run=[f"{root_cmd}"] + command,
+        check_return=True,
+        capture_output=capture_output,
+        custom_env=None,
+        timeout=timeout,
+    )
+
+
+def run_concurrently(
+    coroutines: list[Coroutine[Any, Any, Any]],
+    max_concurrency: int | None = None,
+    total_timeout: float | None = None,
+    dependencies: dict[int, list[int]] | None = None,
+) -> list[Any]:
+    """
+    run_concurrently() es una función que sirve para
+    ejecutar de manera concurrente las corrutinas
+    devueltas por async_run_command() y
+    async_run_command_as_root(), limitando la cantidad
+    de comandos que se ejecutan al mismo tiempo con un
+    semáforo.
+
+    Devuelve una lista con los resultados de cada
+    corrutina, en el mismo orden en el que fueron
+    recibidas. Si no se especifica un límite, se
+    utiliza la cantidad de procesadores del sistema.
+
+    Si se especifica un tiempo total con el parámetro
+    "total_timeout", las corrutinas que no hayan
+    finalizado al agotarse dicho tiempo se cancelan
+    (finalizando sus procesos) y su resultado es None.
+
+    El parámetro "dependencies" permite indicar, para la
+    corrutina en cada posición, las posiciones de las
+    corrutinas anteriores que deben finalizar antes de
+    que esta se ejecute. Las corrutinas sin dependencias
+    pendientes se ejecutan de manera concurrente, y las
+    que dependen de una corrutina que falló se omiten,
+    con None como resultado.
+    """
+    import asyncio
+
+    if not isinstance(coroutines, list):
+        raise TypeError("El parámetro 'coroutines' debe ser una lista.")
+
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+
+    if dependencies is None:
+        dependencies = {}
+
+    try:
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError(
+                "El parámetro 'max_concurrency' debe ser un número entero"
+                " mayor a cero."
+            )
+
+        _check_timeout_argument(name="total_timeout", timeout=total_timeout)
+        _check_dependencies_argument(
+            dependencies=dependencies, coroutine_count=len(coroutines)
+        )
+    except (TypeError, ValueError):
+        # Las corrutinas recibidas nunca se van a ejecutar,
+        # por lo que se las cierra para evitar advertencias
+        # de corrutinas que nunca se esperaron.
+        for coroutine in coroutines:
+            if asyncio.iscoroutine(coroutine):
+                coroutine.close()
+        raise
+
+    if len(coroutines) == 0:
+        return []
+
+    async def gather_coroutines() -> list[Any]:
+        # El semáforo se debe crear dentro del bucle
+        # de eventos que ejecuta las corrutinas.
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = []
+
+        # Como cada corrutina solo puede depender de
+        # corrutinas anteriores, sus tareas ya existen
+        # al momento de crear la tarea que las espera.
+        for position, item in enumerate(coroutines):
+            required_tasks = [
+                tasks[required] for required in dependencies.get(position, [])
+            ]
+            tasks.append(
+                asyncio.ensure_future(
+                    _run_with_semaphore(
+                        semaphore, item, required_tasks, position
+                    )
+                )
+            )
+        _, pending = await asyncio.wait(tasks, timeout=total_timeout)
+
+        # Las tareas rezagadas se cancelan y se espera a
+        # que terminen de finalizar sus procesos.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            style_text(
+                colour_type="bg",
+                colour="red",
+                text=f"Se agotó el tiempo total de {total_timeout} segundos"
+                f" y se cancelaron {len(pending)} comando(s) que no habían"
+                " finalizado.",
+            )
+
+        return [None if task in pending else task.result() for task in tasks]
+
+    return asyncio.run(gather_coroutines())
+
+
+def run_commands_concurrently(
+    commands: list[list[str]],
+    max_concurrency: int | None = None,
+    check_return: bool = True,
+    capture_output: bool = False,
+    custom_env: dict = None,
+    timeout: float | None = None,
+    total_timeout: float | None = None,
+) -> list[None | subprocess.CompletedProcess]:
+    """
+    run_commands_concurrently() es una función que
+    permite ejecutar una lista de comandos independientes
+    entre sí de manera concurrente, de forma que el tiempo
+    total de ejecución sea el del comando más lento y no
+    la suma de los tiempos de todos los comandos.
+
+    Permite especificar un límite de tiempo por comando
+    ("timeout") y un límite de tiempo para el lote
+    completo ("total_timeout"). Los comandos que no
+    finalicen a tiempo se detienen junto con todos sus
+    procesos hijos.
+
+    Devuelve una lista con un resultado por comando, en
+    el mismo orden en el que fueron recibidos. Los
+    comandos que fallen tendrán None como resultado.
+    """
+    if not isinstance(commands, list):
+        raise TypeError("El parámetro 'commands' debe ser una lista.")
+
+    return run_concurrently(
+        coroutines=[
+            async_run_command(
+                command=command,
+                check_return=check_return,
+                capture_output=capture_output,
+                custom_env=custom_env,
+                timeout=timeout,
+            )
+            for command in commands
+        ],
+        max_concurrency=max_concurrency,
+        total_timeout=total_timeout,
+    )
+
+
+@contextlib.contextmanager
+def collect_command_errors() -> Iterator[list[Exception]]:
+    """
+    collect_command_errors() es un gestor de contexto
+    que devuelve una lista en la que se guardan, en
+    orden, los errores que las funciones del módulo le
+    informan al usuario desde el hilo actual mientras el
+    contexto se encuentre activo.
+
+    Permite saber si falló alguno de los comandos
+    ejecutados por funciones que no devuelven su
+    resultado, como las acciones de los menús.
+    """
+    if not hasattr(_error_collectors, "lists"):
+        _error_collectors.lists = []
+
+    errors = []
+    _error_collectors.lists.append(errors)
+
+    try:
+        yield errors
+    finally:
+        # Se compara por identidad, ya que todas las listas
+        # vacías son iguales entre sí.
+        _error_collectors.lists[:] = [
+            collector
+            for collector in _error_collectors.lists
+            if collector is not errors
+        ]